@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from typing import Dict
+from typing import Dict, Any
 
 router = APIRouter()
 
@@ -17,3 +17,33 @@ async def health_check() -> Dict[str, str]:
         "message": "새싹아이 API가 정상 작동 중입니다."
     }
 
+
+@router.get("/health/metrics")
+async def metrics() -> Dict[str, Any]:
+    """
+    서비스별 성능 지표 엔드포인트
+    
+    Returns:
+        Dict[str, Any]: 서비스별 지표 (LLM 로드/생성 시간 등)
+    """
+    from app.services.textgen_adapter import get_llm_stats
+    from app.services.classifier import get_classifier_stats, get_classification_cache_stats, get_ensemble_stats
+    from app.services.translation import get_translation_stats
+    from app.services.plantrecog_client import get_plantrecog_stats
+    from app.services.guide import get_care_guide_stats
+    from app.services.forecast import get_forecast_stats
+    from app.services.growth import get_growth_graph_stats
+    from app.services.lazy_imports import get_lazy_import_stats
+
+    return {
+        "llm": get_llm_stats(),
+        "classifier": get_classifier_stats(),
+        "classification_cache": get_classification_cache_stats(),
+        "classifier_ensemble": get_ensemble_stats(),
+        "plantrecog": get_plantrecog_stats(),
+        "translation": get_translation_stats(),
+        "care_guide": get_care_guide_stats(),
+        "forecast": get_forecast_stats(),
+        "growth_graph": get_growth_graph_stats(),
+        "imports": get_lazy_import_stats(),
+    }
@@ -1,15 +1,21 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Body
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Body, Header, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from typing import Dict, Any, Optional
 import asyncio
+import hmac
+import json
+import threading
 from concurrent.futures import ThreadPoolExecutor
 
+from app.config import settings
 from app.models.schemas import (
     PlantAnalysisResponse,
     PlantIdentification,
     PlantGrowthInsightResponse,
     MonthlyDataRow,
     MonthlyDataAnalysis,
+    PeriodAnalysis,
+    CareGuidePregenerateRequest,
 )
 from app.services import (
     classify_plant,
@@ -21,14 +27,17 @@ from app.services import (
     generate_care_guide,
     generate_growth_prediction,
 )
-from app.services.growth import generate_growth_graph, generate_monthly_data_analysis
-from app.services.textgen_adapter import render_plant_analysis
-from app.services.db_utils import save_identification_data, save_growth_log, load_growth_history
+from app.services.guide import pregenerate_care_guides
+from app.services.growth import get_growth_graph, get_period_text, generate_monthly_data_analysis
+from app.services.textgen_adapter import render_plant_analysis, stream_plant_analysis
+from app.services.db_utils import save_identification_data, save_growth_log, load_growth_series
+from app.services.growth_ingest import parse_growth_payload, ingest_growth_records
+from app.services.forecast import forecast
 
 router = APIRouter()
 
 # 스레드 풀 생성 (CPU 바운드 작업용)
-executor = ThreadPoolExecutor(max_workers=3)
+executor = ThreadPoolExecutor(max_workers=settings.executor_max_workers)
 
 
 @router.post("/analyze", response_model=PlantAnalysisResponse)
@@ -332,9 +341,12 @@ async def compare_models(file: UploadFile = File(...)) -> Dict[str, Any]:
                 },
                 "plantrecog": {
                     "name": "PlantRecog (299 Flowers)",
-                    "result": results["plantrecog_model"].dict()
+                    # 원격 분류 실패 시 result는 None, error에 사유 (ViT 결과로 대체하지 않음)
+                    "result": results["plantrecog_model"].dict() if results["plantrecog_model"] else None,
+                    "error": results["plantrecog_error"]
                 }
-            }
+            },
+            "latency_ms": results["latency_ms"]
         }
         
     except HTTPException:
@@ -365,11 +377,135 @@ async def test_endpoint() -> Dict[str, str]:
     }
 
 
+async def _prepare_growth_insight(file: UploadFile, period_unit: str, max_periods: int, include_period_text: bool = True) -> Dict[str, Any]:
+    """
+    성장 인사이트 공통 단계: 검증 → 스캔(자동 모델 선택) → 저장 → 생장예측그래프 → 월별 데이터.
+    종합 분석 텍스트(LLM) 생성에 필요한 인자도 함께 반환합니다.
+    """
+    if not file.content_type or not file.content_type.startswith("image/"):
+        raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다.")
+
+    contents = await file.read()
+    if len(contents) > 10 * 1024 * 1024:
+        raise HTTPException(status_code=400, detail="파일 크기는 10MB 이하여야 합니다.")
+
+    if period_unit not in ["week", "month"]:
+        raise HTTPException(status_code=400, detail="period_unit은 'week' 또는 'month'여야 합니다.")
+
+    loop = asyncio.get_event_loop()
+    identification = await loop.run_in_executor(
+        executor,
+        classify_plant_auto_select_kr,
+        contents,
+    )
+
+    if identification.confidence < 0.1:
+        raise HTTPException(status_code=422, detail="식물을 식별할 수 없습니다. 더 명확한 이미지를 업로드해주세요.")
+
+    # 식물 분석 데이터를 로컬에 저장
+    import hashlib
+    file_hash = hashlib.md5(contents).hexdigest()
+    save_identification_data(identification, file_hash)
+
+    # 그래프 생성은 CPU 바운드 → 스레드 풀 병렬 처리 (결과와 JSON은 캐시)
+    # 종분석 데이터(identification)를 그래프 생성에 전달하여 Y축 범위 계산에 활용
+    graph_task = loop.run_in_executor(
+        executor,
+        get_growth_graph,
+        identification.plant_name,
+        period_unit,
+        max_periods,
+        identification,  # 종분석 데이터 전달
+        include_period_text,
+    )
+    growth_graph, growth_graph_json = await graph_task
+
+    # 월별 데이터 및 종합 분석 생성
+    monthly_rows = []
+    monthly_data_list = []
+
+    # good_growth와 bad_growth를 기반으로 월별 데이터 생성
+    for i in range(len(growth_graph.good_growth)):
+        good_point = growth_graph.good_growth[i]
+        bad_point = growth_graph.bad_growth[i] if i < len(growth_graph.bad_growth) else good_point
+
+        period = good_point.period
+
+        # period에 따라 기간 라벨 결정
+        if period == 0:
+            period_label = "현재"
+        else:
+            period_label = f"{period}개월"
+
+        # 좋은 조건과 나쁜 조건 크기 가져오기
+        good_height = good_point.size
+        bad_height = bad_point.size
+
+        # 예상 크기 = 좋은 조건과 나쁜 조건의 평균
+        expected_height = (good_height + bad_height) / 2
+
+        # 월별 데이터 추가
+        monthly_rows.append({
+            "period": period_label,
+            "expected_height": round(expected_height, 1),
+            "good_condition_height": round(good_height, 1),
+            "bad_condition_height": round(bad_height, 1)
+        })
+
+        # 종합 분석을 위한 데이터 리스트
+        monthly_data_list.append({
+            "period": period,
+            "expected": expected_height,
+            "good": good_height,
+            "bad": bad_height
+        })
+
+    # 새 LLM 어댑터로 종합 분석 생성 (로컬 LLM → 실패 시 템플릿 폴백)
+    # good_growth와 bad_growth에서 크기 값 추출
+    good_series = [p.size for p in growth_graph.good_growth]
+    bad_series = [p.size for p in growth_graph.bad_growth]
+
+    # 초기 크기 (첫 번째 값 또는 그래프의 min_size 사용)
+    start_cm = good_series[0] if good_series else growth_graph.min_size
+
+    # 간단한 성장 추론 텍스트 (기존 호환성 유지)
+    analysis_text = f"{identification.plant_name}의 {max_periods}{'개월' if period_unit == 'month' else '주'} 성장 전망: 초기 {start_cm:.1f}cm에서 최대 {growth_graph.max_size:.1f}cm까지 성장 가능합니다."
+
+    # MonthlyDataRow 리스트 생성
+    monthly_data_rows = [
+        MonthlyDataRow(
+            period=row["period"],
+            expected_height=row["expected_height"],
+            good_condition_height=row.get("good_condition_height"),
+            bad_condition_height=row.get("bad_condition_height")
+        )
+        for row in monthly_rows
+    ]
+
+    return {
+        "identification": identification,
+        "growth_graph": growth_graph,
+        "growth_graph_json": growth_graph_json,
+        "analysis_text": analysis_text,
+        "monthly_data": monthly_data_rows,
+        "analysis_kwargs": {
+            "plant_name": identification.plant_name,
+            "K": growth_graph.max_size,
+            "start_cm": start_cm,
+            "unit": period_unit,
+            "periods": max_periods,
+            "good_series": good_series,
+            "bad_series": bad_series,
+        },
+    }
+
+
 @router.post("/growth-insight", response_model=PlantGrowthInsightResponse)
 async def growth_insight(
     file: UploadFile = File(...),
     period_unit: str = Query("month", description="기간 단위 ('week' 또는 'month')"),
-    max_periods: int = Query(12, description="최대 기간 수")
+    max_periods: int = Query(12, description="최대 기간 수"),
+    include_period_text: bool = Query(True, description="False면 그래프에 기간별 분석 텍스트 대신 숫자 참조(period_refs)만 포함 (텍스트는 /growth-graph/period-analysis)"),
 ) -> PlantGrowthInsightResponse:
     """
     스캔(자동 모델 선택) → 생육분석(텍스트) → 생장예측그래프 → 종합분석 텍스트 반환.
@@ -379,133 +515,147 @@ async def growth_insight(
         file: 업로드된 식물 이미지 파일
         period_unit: 기간 단위 ('week' 또는 'month'), 기본값: 'month'
         max_periods: 최대 기간 수, 기본값: 12
+        include_period_text: 기간별 분석 텍스트 포함 여부, 기본값: True
     """
     try:
-        if not file.content_type or not file.content_type.startswith("image/"):
-            raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다.")
-
-        contents = await file.read()
-        if len(contents) > 10 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="파일 크기는 10MB 이하여야 합니다.")
+        insight = await _prepare_growth_insight(file, period_unit, max_periods, include_period_text)
+        identification = insight["identification"]
 
-        if period_unit not in ["week", "month"]:
-            raise HTTPException(status_code=400, detail="period_unit은 'week' 또는 'month'여야 합니다.")
+        comprehensive_analysis = render_plant_analysis(**insight["analysis_kwargs"])
 
-        loop = asyncio.get_event_loop()
-        identification = await loop.run_in_executor(
-            executor,
-            classify_plant_auto_select_kr,
-            contents,
+        response = PlantGrowthInsightResponse(
+            identification=identification,
+            growth_graph=insight["growth_graph"],
+            analysis_text=insight["analysis_text"],
+            monthly_data=insight["monthly_data"],
+            comprehensive_analysis=comprehensive_analysis,
+            success=True,
+            message=f"{identification.plant_name} 성장 인사이트 생성이 완료되었습니다.",
         )
+        return _graph_json_response(response, insight["growth_graph_json"])
 
-        if identification.confidence < 0.1:
-            raise HTTPException(status_code=422, detail="식물을 식별할 수 없습니다. 더 명확한 이미지를 업로드해주세요.")
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"성장 인사이트 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"성장 인사이트 생성 중 오류가 발생했습니다: {str(e)}")
 
-        # 식물 분석 데이터를 로컬에 저장
-        import hashlib
-        file_hash = hashlib.md5(contents).hexdigest()
-        save_identification_data(identification, file_hash)
 
-        # 그래프 생성은 CPU 바운드 → 스레드 풀 병렬 처리
-        # 종분석 데이터(identification)를 그래프 생성에 전달하여 Y축 범위 계산에 활용
-        graph_task = loop.run_in_executor(
-            executor,
-            generate_growth_graph,
-            identification.plant_name,
-            period_unit,
-            max_periods,
-            identification  # 종분석 데이터 전달
-        )
-        growth_graph = await graph_task
-
-        # 월별 데이터 및 종합 분석 생성
-        monthly_rows = []
-        monthly_data_list = []
-
-        # good_growth와 bad_growth를 기반으로 월별 데이터 생성
-        for i in range(len(growth_graph.good_growth)):
-            good_point = growth_graph.good_growth[i]
-            bad_point = growth_graph.bad_growth[i] if i < len(growth_graph.bad_growth) else good_point
-
-            period = good_point.period
-
-            # period에 따라 기간 라벨 결정
-            if period == 0:
-                period_label = "현재"
-            else:
-                period_label = f"{period}개월"
-
-            # 좋은 조건과 나쁜 조건 크기 가져오기
-            good_height = good_point.size
-            bad_height = bad_point.size
-
-            # 예상 크기 = 좋은 조건과 나쁜 조건의 평균
-            expected_height = (good_height + bad_height) / 2
-
-            # 월별 데이터 추가
-            monthly_rows.append({
-                "period": period_label,
-                "expected_height": round(expected_height, 1),
-                "good_condition_height": round(good_height, 1),
-                "bad_condition_height": round(bad_height, 1)
-            })
-
-            # 종합 분석을 위한 데이터 리스트
-            monthly_data_list.append({
-                "period": period,
-                "expected": expected_height,
-                "good": good_height,
-                "bad": bad_height
-            })
-
-        # 새 LLM 어댑터로 종합 분석 생성 (로컬 LLM → 실패 시 템플릿 폴백)
-        # good_growth와 bad_growth에서 크기 값 추출
-        good_series = [p.size for p in growth_graph.good_growth]
-        bad_series = [p.size for p in growth_graph.bad_growth]
-
-        # 초기 크기 (첫 번째 값 또는 그래프의 min_size 사용)
-        start_cm = good_series[0] if good_series else growth_graph.min_size
-
-        comprehensive_analysis = render_plant_analysis(
-            plant_name=identification.plant_name,
-            K=growth_graph.max_size,
-            start_cm=start_cm,
-            unit=period_unit,
-            periods=max_periods,
-            good_series=good_series,
-            bad_series=bad_series
-        )
+def _dump_with_graph(model: Any, graph_json: bytes) -> bytes:
+    """
+    growth_graph 필드를 캐시된 JSON 바이트로 채워 응답 모델을 직렬화합니다.
+    (그래프는 다시 검증/직렬화하지 않음)
+    """
+    body = model.model_dump_json(exclude={"growth_graph"}).encode("utf-8")
+    return b'{"growth_graph":' + graph_json + b"," + body[1:]
 
-        # 간단한 성장 추론 텍스트 (기존 호환성 유지)
-        analysis_text = f"{identification.plant_name}의 {max_periods}{'개월' if period_unit == 'month' else '주'} 성장 전망: 초기 {start_cm:.1f}cm에서 최대 {growth_graph.max_size:.1f}cm까지 성장 가능합니다."
 
-        # MonthlyDataRow 리스트 생성
-        monthly_data_rows = [
-            MonthlyDataRow(
-                period=row["period"],
-                expected_height=row["expected_height"],
-                good_condition_height=row.get("good_condition_height"),
-                bad_condition_height=row.get("bad_condition_height")
-            )
-            for row in monthly_rows
-        ]
+def _graph_json_response(model: Any, graph_json: bytes) -> Response:
+    """_dump_with_graph 결과를 그대로 JSON 응답으로 반환합니다 (response_model 재직렬화 생략)."""
+    return Response(content=_dump_with_graph(model, graph_json), media_type="application/json")
 
-        return PlantGrowthInsightResponse(
-            identification=identification,
-            growth_graph=growth_graph,
-            analysis_text=analysis_text,
-            monthly_data=monthly_data_rows,
-            comprehensive_analysis=comprehensive_analysis,
-            success=True,
-            message=f"{identification.plant_name} 성장 인사이트 생성이 완료되었습니다.",
-        )
 
+def _sse_event(event: str, data: Any) -> str:
+    """Server-Sent Events 메시지 한 건을 직렬화합니다."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/growth-insight/stream")
+async def growth_insight_stream(
+    file: UploadFile = File(...),
+    period_unit: str = Query("month", description="기간 단위 ('week' 또는 'month')"),
+    max_periods: int = Query(12, description="최대 기간 수"),
+    include_period_text: bool = Query(True, description="False면 그래프에 기간별 분석 텍스트 대신 숫자 참조(period_refs)만 포함 (텍스트는 /growth-graph/period-analysis)"),
+) -> StreamingResponse:
+    """
+    /growth-insight의 스트리밍(SSE) 버전.
+    식별 결과와 그래프를 먼저 보내고, 종합 분석 텍스트는 LLM이 생성하는 즉시 토큰 단위로 전송합니다.
+
+    이벤트 순서:
+        - insight: comprehensive_analysis를 제외한 PlantGrowthInsightResponse
+        - token: {"text": "..."} (종합 분석 텍스트 조각, 여러 번)
+        - done: {"comprehensive_analysis": "..."} (전체 텍스트)
+        - error: {"detail": "..."} (생성 중 오류 발생 시)
+
+    Args:
+        file: 업로드된 식물 이미지 파일
+        period_unit: 기간 단위 ('week' 또는 'month'), 기본값: 'month'
+        max_periods: 최대 기간 수, 기본값: 12
+        include_period_text: 기간별 분석 텍스트 포함 여부, 기본값: True
+    """
+    try:
+        insight = await _prepare_growth_insight(file, period_unit, max_periods, include_period_text)
     except HTTPException:
         raise
     except Exception as e:
-        print(f"성장 인사이트 오류: {e}")
+        print(f"성장 인사이트 스트리밍 오류: {e}")
         raise HTTPException(status_code=500, detail=f"성장 인사이트 생성 중 오류가 발생했습니다: {str(e)}")
 
+    identification = insight["identification"]
+    head = PlantGrowthInsightResponse(
+        identification=identification,
+        growth_graph=insight["growth_graph"],
+        analysis_text=insight["analysis_text"],
+        monthly_data=insight["monthly_data"],
+        comprehensive_analysis=None,
+        success=True,
+        message=f"{identification.plant_name} 성장 인사이트 생성이 완료되었습니다.",
+    )
+
+    async def event_stream():
+        yield f"event: insight\ndata: {_dump_with_graph(head, insight['growth_graph_json']).decode('utf-8')}\n\n"
+
+        loop = asyncio.get_event_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        cancelled = threading.Event()
+
+        def post(kind: str, value: Any = None):
+            if not cancelled.is_set():
+                try:
+                    loop.call_soon_threadsafe(events.put_nowait, (kind, value))
+                except RuntimeError:
+                    cancelled.set()  # 이벤트 루프 종료됨
+
+        def pump():
+            # 생성기는 이 스레드에서만 진행하고 닫음 (다른 스레드에서 close()하면 실행 중 ValueError)
+            tokens = stream_plant_analysis(**insight["analysis_kwargs"])
+            try:
+                for text in tokens:
+                    if cancelled.is_set():
+                        break
+                    post("token", text)
+                post("done")
+            except Exception as e:
+                post("error", e)
+            finally:
+                # 클라이언트 연결 종료 시 GeneratorExit → LLM 생성 작업 취소
+                tokens.close()
+
+        # 토큰 대기는 블로킹이므로 이벤트 루프 밖의 스레드 하나에서 생성기를 끝까지 진행
+        loop.run_in_executor(None, pump)
+        parts = []
+        try:
+            while True:
+                kind, value = await events.get()
+                if kind == "token":
+                    parts.append(value)
+                    yield _sse_event("token", {"text": value})
+                elif kind == "done":
+                    yield _sse_event("done", {"comprehensive_analysis": "".join(parts).strip()})
+                    break
+                else:
+                    print(f"성장 인사이트 스트리밍 오류: {value}")
+                    yield _sse_event("error", {"detail": str(value)})
+                    break
+        finally:
+            cancelled.set()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
 # 식물 개별 성장 기록 저장 API
 @router.post("/update-growth")
@@ -520,15 +670,91 @@ async def update_growth(
     except Exception as e:
         return {"success": False, "msg": str(e)}
 
+# 성장 기록 일괄 수집 API (기기 동기화용)
+@router.post("/update-growth/bulk")
+async def update_growth_bulk(request: Request) -> Dict[str, Any]:
+    """
+    여러 식물의 성장 기록을 한 번에 저장합니다.
+
+    본문은 JSON 배열 또는 NDJSON (Content-Type: application/x-ndjson, 한 줄에 기록 하나):
+        {"plant_id": "plant-1", "date": "2025-01-31", "height": 12.5}
+
+    기록마다 검증하고, 통과한 기록만 저장소 트랜잭션 한 번으로 저장합니다.
+    같은 (plant_id, date)는 나중 값으로 덮어씁니다.
+
+    Returns:
+        Dict[str, Any]: received, accepted, rejected, errors([{index, error}]), plants, elapsed_ms
+    """
+    body = await request.body()
+    loop = asyncio.get_event_loop()
+    try:
+        items = await loop.run_in_executor(
+            executor, parse_growth_payload, body, request.headers.get("content-type")
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"본문 파싱 오류: {e}")
+
+    if len(items) > settings.growth_bulk_max_records:
+        raise HTTPException(
+            status_code=413,
+            detail=f"한 번에 최대 {settings.growth_bulk_max_records}건까지 저장할 수 있습니다. (요청: {len(items)}건)"
+        )
+
+    try:
+        result = await loop.run_in_executor(executor, ingest_growth_records, items)
+    except Exception as e:
+        print(f"성장 기록 일괄 저장 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"성장 기록 저장 중 오류가 발생했습니다: {str(e)}")
+
+    return {
+        "success": result["rejected"] == 0,
+        "msg": f"{result['accepted']}건 저장, {result['rejected']}건 거부",
+        **result,
+    }
+
+# 성장 기록 조회 API (열 형식, 날짜 범위/다운샘플링)
+@router.get("/growth-history")
+async def growth_history(
+    plant_id: str = Query(..., description="식물 ID"),
+    date_from: Optional[str] = Query(None, alias="from", description="시작 날짜 YYYY-MM-DD (포함)"),
+    date_to: Optional[str] = Query(None, alias="to", description="끝 날짜 YYYY-MM-DD (포함)"),
+    bucket_days: int = Query(1, ge=1, le=3660, description="다운샘플링 구간 길이 (일, 1이면 원본)"),
+    how: str = Query("mean", description="다운샘플링 방식 (mean / last)")
+) -> Dict[str, Any]:
+    """
+    성장 기록을 열 형식 {"dates": [...], "heights": [...]}으로 반환합니다.
+
+    Returns:
+        Dict[str, Any]: plant_id, count, dates, heights
+    """
+    if how not in ("mean", "last"):
+        raise HTTPException(status_code=400, detail="how는 'mean' 또는 'last'여야 합니다.")
+    try:
+        series = load_growth_series(plant_id, date_from, date_to)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"날짜 형식 오류 (YYYY-MM-DD): {e}")
+
+    if bucket_days > 1:
+        series = series.downsample(bucket_days, how)
+    return {"plant_id": plant_id, "count": len(series), **series.to_columns_json()}
+
 # 성장 예측+비교+분석+관리팁 API
 @router.get("/growth-insight-v2")
-async def growth_insight_v2(plant_id: str):
+async def growth_insight_v2(
+    plant_id: str,
+    horizon_days: int = Query(7, ge=1, le=90, description="예측 일수"),
+):
+    """
+    성장 기록과 로지스틱 성장 곡선 기반 예측(95% 예측 구간 포함)을 반환합니다.
+    기록이 4개 미만이면 선형 추세로 예측합니다.
+    """
     try:
-        history = load_growth_history(plant_id)
-        if not history:
+        series = load_growth_series(plant_id)
+        if not len(series):
             return {"success": False, "msg": "기록 없음", "history": []}
-        last_height = history[-1]["height"]
-        prediction = [{"date": f"예측+{i+1}d", "height": last_height + (i+1)*1.0} for i in range(7)]
+        history = series.to_records()
+        result = forecast(plant_id, series, horizon_days=horizon_days)
+        prediction = result["prediction"]
         compare_comment = "-"
         if len(history) >= 2:
             delta = history[-1]["height"] - history[-2]["height"]
@@ -540,6 +766,7 @@ async def growth_insight_v2(plant_id: str):
             "success": True,
             "history": history,
             "prediction": prediction,
+            "model": result["model"],
             "compare_comment": compare_comment,
             "analysis": analysis,
             "care_tip": care_tip
@@ -552,7 +779,8 @@ async def growth_insight_v2(plant_id: str):
 async def get_monthly_data_analysis(
     plant_name: str = Query(..., description="식물 이름"),
     max_months: int = Query(12, description="최대 월 수"),
-    data_id: Optional[str] = Query(None, description="저장된 데이터 ID (선택사항)")
+    data_id: Optional[str] = Query(None, description="저장된 데이터 ID (선택사항)"),
+    include_period_text: bool = Query(True, description="False면 그래프에 기간별 분석 텍스트 대신 숫자 참조(period_refs)만 포함 (텍스트는 /growth-graph/period-analysis)"),
 ) -> MonthlyDataAnalysis:
     """
     저장된 식물 데이터를 기반으로 월별 데이터 분석을 반환합니다.
@@ -562,6 +790,7 @@ async def get_monthly_data_analysis(
         plant_name: 식물 이름
         max_months: 최대 월 수 (기본값: 12)
         data_id: 저장된 데이터 ID (선택사항)
+        include_period_text: 기간별 분석 텍스트 포함 여부, 기본값: True
 
     Returns:
         MonthlyDataAnalysis: 월별 데이터 분석 결과
@@ -578,7 +807,8 @@ async def get_monthly_data_analysis(
             generate_monthly_data_analysis,
             plant_name,
             max_months,
-            data_id
+            data_id,
+            include_period_text
         )
 
         elapsed_time = time.time() - start_time
@@ -595,7 +825,7 @@ async def get_monthly_data_analysis(
             for row in result["monthly_data"]
         ]
 
-        return MonthlyDataAnalysis(
+        response = MonthlyDataAnalysis(
             identification=result["identification"],
             growth_graph=result["growth_graph"], 
             monthly_data=monthly_data_rows,
@@ -603,6 +833,7 @@ async def get_monthly_data_analysis(
             success=True,
             message=f"{result['identification'].plant_name} 월별 데이터 분석이 완료되었습니다."
         )
+        return _graph_json_response(response, result["growth_graph_json"])
 
     except Exception as e:
         print(f"월별 데이터 분석 오류: {e}")
@@ -613,3 +844,74 @@ async def get_monthly_data_analysis(
             detail=f"월별 데이터 분석 중 오류가 발생했습니다: {str(e)}"
         )
 
+
+
+@router.get("/growth-graph/period-analysis", response_model=PeriodAnalysis)
+async def get_growth_period_analysis(
+    plant_name: str = Query(..., description="식물 이름"),
+    period: int = Query(..., ge=0, description="기간 (그래프 period 값)"),
+    period_unit: str = Query("month", description="기간 단위 ('week' 또는 'month')"),
+    max_periods: int = Query(12, description="그래프 최대 기간 수"),
+    confidence: Optional[float] = Query(None, ge=0.0, le=1.0, description="식별 신뢰도 (그래프 응답의 identification.confidence)"),
+) -> PeriodAnalysis:
+    """
+    성장 그래프 한 기간의 분석 텍스트를 반환합니다.
+    include_period_text=false로 받은 그래프의 period_refs와 함께 사용합니다.
+
+    Args:
+        plant_name: 식물 이름
+        period: 기간
+        period_unit: 기간 단위 ('week' 또는 'month')
+        max_periods: 그래프 최대 기간 수
+        confidence: 식별 신뢰도 (그래프 요청과 같은 값)
+
+    Returns:
+        PeriodAnalysis: 기간별 상세 분석
+    """
+    if period_unit not in ["week", "month"]:
+        raise HTTPException(status_code=400, detail="period_unit은 'week' 또는 'month'여야 합니다.")
+
+    analysis = await asyncio.get_event_loop().run_in_executor(
+        executor, get_period_text, plant_name, period, period_unit, max_periods, confidence
+    )
+    if analysis is None:
+        raise HTTPException(status_code=404, detail=f"그래프에 {period} 기간이 없습니다.")
+    return analysis
+
+
+@router.post("/admin/care-guides/pregenerate")
+async def pregenerate_care_guides_endpoint(
+    request: CareGuidePregenerateRequest,
+    x_admin_token: Optional[str] = Header(None)
+) -> Dict[str, Any]:
+    """
+    식물 목록의 관리 가이드를 미리 생성해 저장합니다 (관리자용).
+    X-Admin-Token 헤더가 settings.admin_token과 일치해야 합니다 (토큰이 설정되지 않았으면 항상 403).
+
+    Args:
+        request: 식물 이름 목록과 재생성 여부
+
+    Returns:
+        Dict[str, Any]: 식물별 결과 (cached / generated / failed)와 집계
+    """
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="관리자 토큰(ADMIN_TOKEN)이 설정되지 않아 사용할 수 없습니다.")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode("utf-8"), settings.admin_token.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 올바르지 않습니다.")
+
+    loop = asyncio.get_event_loop()
+    results = await loop.run_in_executor(
+        executor,
+        lambda: pregenerate_care_guides(request.plant_names, force=request.force)
+    )
+
+    summary = {status: 0 for status in ("cached", "generated", "failed")}
+    for status in results.values():
+        summary[status] += 1
+
+    return {
+        "success": summary["failed"] == 0,
+        "message": f"관리 가이드 {len(results)}건 처리 완료 (생성 {summary['generated']}, 기존 {summary['cached']}, 실패 {summary['failed']})",
+        "results": results,
+        "summary": summary,
+    }
@@ -27,6 +27,71 @@ class Settings(BaseSettings):
     text_generation_model: str = "none"  # koGPT2 비활성화 - Qwen 모델 사용 (textgen_adapter.py)
     image_generation_model: str = "stabilityai/sd-turbo"
     
+    # 식물 분류기 마이크로 배칭 (여러 요청을 한 번의 forward pass로 처리)
+    classifier_max_batch_size: int = 8  # 배치 최대 이미지 수
+    classifier_max_batch_wait_ms: float = 10.0  # 첫 요청 후 배치를 채우기 위해 기다리는 최대 시간 (ms)
+    
+    # 분류 결과 캐시 (이미지 내용 해시 기준, 분류기 백엔드별)
+    classification_cache_size: int = 1024  # 메모리 캐시 최대 항목 수 (0이면 비활성화)
+    classification_cache_ttl: float = 86400.0  # 유효 시간 (초)
+    classification_cache_disk: bool = False  # 디스크 계층 사용 여부 (cache_dir에 SQLite 파일 생성)
+    
+    # 두 분류기(ViT + PlantRecog) 앙상블 실행 정책
+    # "parallel": 두 분류기를 동시에 실행, ViT 신뢰도가 기준 이상이면 원격 결과를 기다리지 않음
+    # "local_first": ViT를 먼저 실행하고 기준 미만일 때만 원격 호출 (원격 호출 수 최소화)
+    classifier_ensemble_policy: str = "parallel"
+    classifier_auto_select_threshold: float = 0.5  # 자동 선택 시 ViT 결과를 채택하는 최소 신뢰도
+    
+    # PlantRecog 원격 분류 API (로컬 스텁 서버 주소로 바꿔 테스트 가능)
+    plantrecog_url: str = "https://plantrecog.sarthak.work"
+    plantrecog_connect_timeout: float = 3.0  # 연결 타임아웃 (초)
+    plantrecog_read_timeout: float = 15.0  # 응답 읽기 타임아웃 (초)
+    plantrecog_total_timeout: float = 30.0  # 재시도/백오프 포함 요청 전체 제한 시간 (초)
+    plantrecog_max_retries: int = 2  # 연결 오류/5xx/429 재시도 횟수
+    plantrecog_retry_backoff: float = 0.2  # 재시도 백오프 기본값 (초, 지터 포함)
+    plantrecog_max_connections: int = 20  # 커넥션 풀 크기
+    plantrecog_http2: bool = True  # h2 패키지가 설치된 경우에만 HTTP/2 사용
+    plantrecog_breaker_failures: int = 5  # 회로 차단기가 열리는 연속 실패 횟수
+    plantrecog_breaker_reset: float = 30.0  # 회로가 열린 뒤 다시 시험하기까지 대기 시간 (초)
+    
+    # 식물 이름 번역 저장소 (None이면 cache_dir/translations.sqlite3)
+    translation_store_path: Optional[str] = None
+    translation_prewarm: bool = True  # 서버 시작 시 분류 모델 레이블 미리 번역
+    
+    # 식물 관리 가이드 저장소 (정규화된 식물 이름 + 프롬프트 버전 키, None이면 cache_dir/care_guides.sqlite3)
+    care_guide_store_path: Optional[str] = None
+    care_guide_ttl: float = 30 * 86400.0  # 저장된 가이드 유효 시간 (초)
+    care_guide_cache_size: int = 512  # 메모리 캐시 최대 항목 수
+    
+    # 식물 분석/성장 기록 저장소
+    storage_backend: str = "sqlite"  # "sqlite" (WAL 트랜잭션) 또는 "json" (기존 파일 전체 재작성 방식)
+    storage_path: Optional[str] = None  # SQLite 파일 경로 (None이면 plant-care-final/data/seedai.sqlite3)
+    storage_auto_migrate: bool = True  # SQLite 저장소를 처음 열 때 기존 JSON 파일을 한 번 가져옴
+    # JSON 저장소의 성장 기록 저널 (growth_history.json.journal에 한 줄씩 추가 → 주기적으로 스냅샷 압축)
+    growth_journal_sync: bool = True  # 저장 시 fsync까지 기다림 (동시 쓰기는 fsync 한 번으로 묶음)
+    growth_journal_compact_threshold: int = 10000  # 저널 줄 수가 이 값을 넘으면 압축
+    growth_journal_compact_interval: float = 300.0  # 주기 압축 간격 (초)
+    
+    growth_bulk_max_records: int = 100000  # 일괄 수집 요청 한 번의 최대 기록 수
+    
+    # 성장 예측 그래프 캐시 (plant_name, period_unit, max_periods, 신뢰도 구간)별 결과 + JSON 직렬화
+    growth_graph_cache_size: int = 1024
+    growth_graph_confidence_step: float = 0.05  # 신뢰도 양자화 간격 (같은 구간이면 같은 그래프)
+    
+    # 관리자 엔드포인트 토큰 (X-Admin-Token 헤더로 전달, None이면 관리자 엔드포인트 비활성화)
+    admin_token: Optional[str] = None
+    
+    # API 스레드 풀 크기 (배치가 채워지려면 동시 분류 요청 수만큼 스레드가 필요)
+    executor_max_workers: int = 8
+    # /api/detect 추론 전용 스레드 풀 크기 (YOLO/cv2는 GIL을 풀고 실행, 동시 추론 수 = 메모리 상한)
+    detect_max_workers: int = 2
+    detect_batch_max_images: int = 50  # /api/detect/batch 한 번의 최대 이미지 수
+    detect_batch_size: int = 16  # YOLO 순전파 한 번에 넣을 이미지 수
+    # image_transport=url 결과 이미지 보관소 (워커 프로세스 메모리, 항목 수·전체 바이트 상한 + 만료 시간 초)
+    detect_result_store_size: int = 128
+    detect_result_store_bytes: int = 256 * 1024 * 1024
+    detect_result_ttl: int = 600
+    
     # 선택적 Hugging Face 토큰 (rate limit 완화용)
     huggingface_token: Optional[str] = None
     
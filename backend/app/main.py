@@ -9,14 +9,17 @@ Unified FastAPI main — merge of our main.py and teammate's app.py
 
 import os
 import uuid
-import shutil
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, UploadFile, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+
+from app.services.caching import LRUTTLCache
 
 # --- Optional settings & dotenv ---
 try:
@@ -28,10 +31,22 @@ except Exception:
 # Settings (optional)
 _api_host = os.getenv("API_HOST", "0.0.0.0")
 _api_port = int(os.getenv("API_PORT", "8000"))
+_detect_workers = int(os.getenv("DETECT_MAX_WORKERS", "2"))
+_detect_batch_max_images = 50
+_detect_batch_size = 16
+_detect_result_store_size = 128
+_detect_result_store_bytes = 256 * 1024 * 1024
+_detect_result_ttl = 600
 try:
     from app.config import settings  # optional
     _api_host = getattr(settings, "api_host", _api_host)
     _api_port = getattr(settings, "api_port", _api_port)
+    _detect_workers = getattr(settings, "detect_max_workers", _detect_workers)
+    _detect_batch_max_images = getattr(settings, "detect_batch_max_images", _detect_batch_max_images)
+    _detect_batch_size = getattr(settings, "detect_batch_size", _detect_batch_size)
+    _detect_result_store_size = getattr(settings, "detect_result_store_size", _detect_result_store_size)
+    _detect_result_store_bytes = getattr(settings, "detect_result_store_bytes", _detect_result_store_bytes)
+    _detect_result_ttl = getattr(settings, "detect_result_ttl", _detect_result_ttl)
 except Exception:
     pass
 
@@ -42,7 +57,7 @@ logger = logging.getLogger("app.main")
 # --- External services (best-effort import) ---
 _detector_ok = False
 try:
-    from inference import get_detector  # teammate side
+    from inference import IMAGE_FORMATS, decode_image, detector_load_error, get_detector, is_detector_loaded  # teammate side (ultralytics는 로드 시점에 import)
     _HAS_DETECTOR = True
 except Exception as e:
     logger.warning("inference.get_detector import failed: %s", e)
@@ -97,6 +112,18 @@ try:
 except Exception as e:
     logger.warning("Optional routers not included (app.api.health/plant): %s", e)
 
+# 감지 추론 전용 스레드 풀 (이벤트 루프와 다른 API 스레드 풀을 막지 않도록 분리)
+_detect_executor = ThreadPoolExecutor(max_workers=max(1, _detect_workers), thread_name_prefix="detect")
+
+# image_transport=url 감지 결과 이미지 보관소 (/api/detect/{id}/image로 바이너리 제공, 워커 프로세스별 메모리)
+# 항목 수와 이미지 바이트 합계를 모두 제한 (max_edge 없는 원본 크기 PNG도 워커 메모리를 넘지 않도록)
+_detect_results = LRUTTLCache(
+    maxsize=_detect_result_store_size,
+    ttl=_detect_result_ttl,
+    max_bytes=_detect_result_store_bytes,
+    sizeof=lambda stored: len(stored["result"] or b"") + len(stored["original"] or b""),
+)
+
 # --- FS paths ---
 UPLOAD_DIR = Path("uploads")
 RESULTS_DIR = Path("results")
@@ -104,21 +131,55 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 RESULTS_DIR.mkdir(exist_ok=True)
 
 # --- Startup: preload detector if available ---
+def _preload_detector():
+    global _detector_ok
+    try:
+        det = get_detector()
+        _detector_ok = getattr(det, "disease_model", None) is not None
+        logger.info("Detector preload done (loaded=%s)", _detector_ok)
+    except Exception as e:
+        logger.error("Detector preload failed: %s", e)
+        _detector_ok = False
+
+
 @app.on_event("startup")
 async def on_startup():
-    global _detector_ok
     if _HAS_DETECTOR:
-        try:
-            logger.info("Preloading detector model...")
-            det = get_detector()
-            _detector_ok = getattr(det, "disease_model", None) is not None
-            logger.info("Detector preload done (loaded=%s)", _detector_ok)
-        except Exception as e:
-            logger.error("Detector preload failed: %s", e)
-            _detector_ok = False
+        # 감지 모델(ultralytics/torch import 포함)은 백그라운드에서 로드 → 시작과 /health를 막지 않음
+        logger.info("Preloading detector model in background...")
+        asyncio.get_event_loop().run_in_executor(None, _preload_detector)
     else:
         logger.info("Detector module not present; skipping preload")
 
+    # 로컬 LLM 엔진 미리 로드 (요청마다 GGUF를 다시 로드하지 않도록)
+    try:
+        from app.services.textgen_adapter import preload_llm_engine
+        loaded = await asyncio.get_event_loop().run_in_executor(None, preload_llm_engine)
+        logger.info("LLM engine preload done (loaded=%s)", loaded)
+    except Exception as e:
+        logger.warning("LLM engine preload skipped: %s", e)
+
+    # 분류 모델 레이블 번역 프리웜 (네트워크 호출 가능 → 기다리지 않고 백그라운드 실행)
+    try:
+        from app.config import settings as _settings
+        if _settings.translation_prewarm:
+            from app.services.classifier import prewarm_translations
+            asyncio.get_event_loop().run_in_executor(None, prewarm_translations)
+    except Exception as e:
+        logger.warning("Translation prewarm skipped: %s", e)
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    _detect_executor.shutdown(wait=False)
+
+    # PlantRecog 커넥션 풀 정리
+    try:
+        from app.services.plantrecog_client import close_plantrecog_client
+        close_plantrecog_client()
+    except Exception as e:
+        logger.warning("PlantRecog client close failed: %s", e)
+
 # --- Root ---
 @app.get("/")
 async def root():
@@ -137,120 +198,220 @@ async def health_check():
             "models": {"disease_model_loaded": False},
             "note": "inference 모듈이 없어 최소 기능만 동작합니다.",
         }
+    load_error = detector_load_error()
+    if load_error is not None:
+        return {
+            "status": "degraded",
+            "models": {"disease_model_loaded": False},
+            "note": f"감지 모델 로드에 실패했습니다: {load_error}",
+        }
+    if not is_detector_loaded():
+        # 백그라운드 프리로드 중에는 기다리지 않고 바로 응답
+        return {
+            "status": "starting",
+            "models": {"disease_model_loaded": False},
+            "note": "감지 모델을 로드하는 중입니다.",
+        }
     det = get_detector()
     return {
         "status": "healthy" if getattr(det, "disease_model", None) is not None else "degraded",
         "models": {"disease_model_loaded": getattr(det, "disease_model", None) is not None},
+        "result_store": _detect_results.stats(),
         "note": "단일 모델로 식물 종과 병충해를 함께 감지합니다.",
     }
 
 # --- Detect (from teammate app.py) ---
+def _loaded_detector():
+    """모델이 로드된 감지기를 반환합니다 (로드 실패/모델 없음은 503)."""
+    try:
+        detector = get_detector()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"감지 모델을 사용할 수 없습니다: {e}")
+    if getattr(detector, "disease_model", None) is None:
+        raise HTTPException(status_code=503, detail="모델이 로드되지 않았습니다. models/plant_disease.pt 배치 필요.")
+    return detector
+
+
+def _run_detection(contents: bytes, conf_threshold: Optional[float], render: Optional[dict] = None) -> dict:
+    """감지 추론 단계 (_detect_executor 스레드에서 실행되는 블로킹 작업, 업로드 버퍼를 메모리에서 디코딩)"""
+    detector = _loaded_detector()
+    image = decode_image(contents)
+    if image is None:
+        raise HTTPException(status_code=400, detail="이미지를 디코딩할 수 없습니다.")
+
+    return detector.detect_image(
+        image,
+        conf_threshold=conf_threshold,
+        filter_by_confidence=True,
+        **(render or {}),
+    )
+
+
+def _format_detection(results: dict) -> dict:
+    """감지 결과를 API 응답 형식으로 변환합니다 (상태 메시지 포함, LLM 방제법은 비어 있음)."""
+    diagnosis_status = results.get("diagnosis_status", "no_detection")
+    max_confidence = float(results.get("max_confidence", 0.0))
+    diseases = results.get("diseases", [])
+
+    resp = {
+        "success": True,
+        "diagnosis_status": diagnosis_status,
+        "max_confidence": round(max_confidence, 4),
+        "detection_count": results.get("detection_count", 0),
+        "species": {
+            "name": results.get("species") or "알 수 없음",
+            "confidence": round(float(results.get("species_confidence", 0.0)), 4),
+        },
+        "diseases": [
+            {
+                "name": d["name"],
+                "full_name": d.get("full_name", d["name"]),
+                "species": d.get("species", ""),
+                "confidence": round(float(d["confidence"]), 4),
+                "bbox": d.get("bbox"),
+            }
+            for d in diseases
+        ],
+        "result_image": results.get("result_image"),
+        "original_image": results.get("original_image"),
+        "total_diseases_detected": len(diseases),
+    }
+
+    # status message
+    if diagnosis_status == "high_confidence" and diseases:
+        resp["status_message"] = "✅ 정확한 진단이 완료되었습니다."
+    elif diagnosis_status == "medium_confidence" and diseases:
+        disease_info = diseases[0]
+        resp["status_message"] = (
+            f"⚠️ 정확한 진단이 어렵습니다. "
+            f"{disease_info.get('species')}의 {disease_info.get('name')}일 가능성"
+            f"({max_confidence * 100:.1f}%)이 가장 높습니다. "
+            f"더 선명한 사진으로 다시 시도해 주세요."
+        )
+    elif diagnosis_status == "low_confidence":
+        resp["status_message"] = (
+            "❌ 신뢰도가 매우 낮습니다. 잎사귀가 선명하게 보이도록 다시 촬영해 주세요."
+        )
+    else:
+        resp["status_message"] = (
+            "❌ 식물 잎을 감지하지 못했습니다. 잎사귀가 선명하게 보이도록 다시 촬영해 주세요."
+        )
+    resp["treatment_advice"] = None
+    resp["llm_enabled"] = False
+    return resp
+
+
+def _run_detection_batch(images: List[bytes], conf_threshold: Optional[float], include_images: bool) -> List[dict]:
+    """배치 감지 단계 (_detect_executor 스레드에서 실행)"""
+    detector = _loaded_detector()
+
+    return detector.detect_batch(
+        images,
+        conf_threshold=conf_threshold,
+        filter_by_confidence=True,
+        render_images=include_images,
+        batch_size=_detect_batch_size,
+    )
+
+
 @app.post("/api/detect")
 async def detect_plant_disease(
     file: UploadFile = File(...),
     conf_threshold: Optional[float] = 0.01,
     user_notes: Optional[str] = None,
+    include_original: bool = True,
+    include_result_image: bool = True,
+    image_format: str = "jpeg",
+    image_quality: Optional[int] = Query(None, ge=1, le=100),
+    max_edge: Optional[int] = Query(None, ge=32, le=8192),
+    image_transport: str = "base64",
 ):
+    """
+    잎 사진 한 장에서 식물 종과 병충해를 감지합니다.
+
+    Args:
+        include_original: False면 원본 이미지(클라이언트가 이미 가진 업로드)를 응답에서 생략
+        include_result_image: False면 결과 이미지 렌더링/인코딩을 생략
+        image_format: 출력 이미지 형식 (jpeg, webp, png)
+        image_quality: 출력 이미지 품질 1-100 (jpeg/webp)
+        max_edge: 출력 이미지 긴 변 최대 픽셀
+        image_transport: base64면 JSON에 이미지 포함, url이면 이미지를 보관소에 두고
+            /api/detect/{detection_id}/image 주소만 반환 (같은 워커에서 detect_result_ttl초 동안 유효)
+    """
     allowed_extensions = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
     ext = Path(file.filename).suffix.lower()
     if ext not in allowed_extensions:
         raise HTTPException(status_code=400, detail=f"허용 형식: {', '.join(sorted(allowed_extensions))}")
 
-    # save temp
-    unique = f"{uuid.uuid4()}{ext}"
-    upload_path = UPLOAD_DIR / unique
-
-    try:
-        with open(upload_path, "wb") as buf:
-            shutil.copyfileobj(file.file, buf)
+    if not _HAS_DETECTOR:
+        raise HTTPException(status_code=503, detail="모델 모듈 없음(inference). 설치/배치 후 재시도하세요.")
+    if image_format not in IMAGE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"image_format: {', '.join(IMAGE_FORMATS)} 중 하나")
+    if image_transport not in ("base64", "url"):
+        raise HTTPException(status_code=400, detail="image_transport: base64, url 중 하나")
 
-        if not _HAS_DETECTOR:
-            raise HTTPException(status_code=503, detail="모델 모듈 없음(inference). 설치/배치 후 재시도하세요.")
+    render = {
+        "render_images": include_original or include_result_image,
+        "include_original": include_original,
+        "render_result": include_result_image,
+        "image_options": {
+            "image_format": image_format,
+            "quality": image_quality,
+            "max_edge": max_edge,
+            "as_base64": image_transport == "base64",
+        },
+    }
 
-        detector = get_detector()
-        if getattr(detector, "disease_model", None) is None:
-            raise HTTPException(status_code=503, detail="모델이 로드되지 않았습니다. models/plant_disease.pt 배치 필요.")
+    try:
+        contents = await file.read()
 
-        results = detector.detect(
-            str(upload_path),
-            conf_threshold=conf_threshold,
-            filter_by_confidence=True,
+        # 추론 단계(디코딩 → YOLO 추론/블러/이미지 인코딩)는 전용 스레드 풀에서 실행
+        loop = asyncio.get_event_loop()
+        results = await loop.run_in_executor(
+            _detect_executor, _run_detection, contents, conf_threshold, render
         )
 
-        diagnosis_status = results.get("diagnosis_status", "no_detection")
-        max_confidence = float(results.get("max_confidence", 0.0))
-
-        resp = {
-            "success": True,
-            "diagnosis_status": diagnosis_status,
-            "max_confidence": round(max_confidence, 4),
-            "detection_count": results.get("detection_count", 0),
-            "species": {
-                "name": results.get("species") or "알 수 없음",
-                "confidence": round(float(results.get("species_confidence", 0.0)), 4),
-            },
-            "diseases": [
-                {
-                    "name": d["name"],
-                    "full_name": d.get("full_name", d["name"]),
-                    "species": d.get("species", ""),
-                    "confidence": round(float(d["confidence"]), 4),
-                    "bbox": d.get("bbox"),
-                }
-                for d in results.get("diseases", [])
-            ],
-            "result_image": results.get("result_image"),
-            "original_image": results.get("original_image"),
-            "total_diseases_detected": len(results.get("diseases", [])),
-        }
+        stored = None
+        if image_transport == "url":
+            # 이미지 바이트는 보관소로 옮기고 JSON에는 주소만 포함
+            stored = {
+                "media_type": IMAGE_FORMATS[image_format][1],
+                "result": results.pop("result_image", None),
+                "original": results.pop("original_image", None),
+            }
 
-        # status message + LLM
-        if diagnosis_status == "high_confidence" and resp["total_diseases_detected"] > 0:
-            disease_info = results["diseases"][0]
-            resp["status_message"] = "✅ 정확한 진단이 완료되었습니다."
-            if _HAS_ADVISOR:
-                try:
-                    advisor = get_advisor()
-                    treatment = advisor.get_treatment_advice(
-                        plant_species=disease_info.get("species"),
-                        disease=disease_info.get("name"),
-                        confidence=disease_info.get("confidence"),
-                        user_notes=user_notes,
-                    )
-                    resp["treatment_advice"] = treatment
-                    resp["llm_enabled"] = True
-                except Exception as e:
-                    logger.error("LLM 호출 실패: %s", e)
-                    resp["treatment_advice"] = None
-                    resp["llm_enabled"] = False
-            else:
-                resp["treatment_advice"] = None
-                resp["llm_enabled"] = False
+        resp = _format_detection(results)
+        diagnosis_status = resp["diagnosis_status"]
+        max_confidence = resp["max_confidence"]
+        resp["image_format"] = image_format
+        if stored is not None and (stored["result"] is not None or stored["original"] is not None):
+            detection_id = uuid.uuid4().hex
+            if not _detect_results.set(detection_id, stored):
+                raise HTTPException(
+                    status_code=413,
+                    detail="결과 이미지가 보관소 용량보다 큽니다. max_edge/image_format으로 크기를 줄이세요.",
+                )
+            resp["detection_id"] = detection_id
+            if stored["result"] is not None:
+                resp["result_image_url"] = f"/api/detect/{detection_id}/image"
+            if stored["original"] is not None:
+                resp["original_image_url"] = f"/api/detect/{detection_id}/image?kind=original"
 
-        elif diagnosis_status == "medium_confidence" and resp["total_diseases_detected"] > 0:
+        # LLM 방제법 (고신뢰도 진단만)
+        if diagnosis_status == "high_confidence" and resp["total_diseases_detected"] > 0 and _HAS_ADVISOR:
             disease_info = results["diseases"][0]
-            resp["status_message"] = (
-                f"⚠️ 정확한 진단이 어렵습니다. "
-                f"{disease_info.get('species')}의 {disease_info.get('name')}일 가능성"
-                f"({max_confidence * 100:.1f}%)이 가장 높습니다. "
-                f"더 선명한 사진으로 다시 시도해 주세요."
-            )
-            resp["treatment_advice"] = None
-            resp["llm_enabled"] = False
-
-        elif diagnosis_status == "low_confidence":
-            resp["status_message"] = (
-                "❌ 신뢰도가 매우 낮습니다. 잎사귀가 선명하게 보이도록 다시 촬영해 주세요."
-            )
-            resp["treatment_advice"] = None
-            resp["llm_enabled"] = False
-
-        else:
-            resp["status_message"] = (
-                "❌ 식물 잎을 감지하지 못했습니다. 잎사귀가 선명하게 보이도록 다시 촬영해 주세요."
-            )
-            resp["treatment_advice"] = None
-            resp["llm_enabled"] = False
+            try:
+                advisor = get_advisor()
+                treatment = await advisor.get_treatment_advice_async(
+                    plant_species=disease_info.get("species"),
+                    disease=disease_info.get("name"),
+                    confidence=disease_info.get("confidence"),
+                    user_notes=user_notes,
+                )
+                resp["treatment_advice"] = treatment
+                resp["llm_enabled"] = True
+            except Exception as e:
+                logger.error("LLM 호출 실패: %s", e)
 
         logger.info(
             "detect: status=%s species=%s conf=%.2f diseases=%d",
@@ -263,12 +424,90 @@ async def detect_plant_disease(
     except Exception as e:
         logger.error("detect error: %s", e)
         raise HTTPException(status_code=500, detail=f"서버 오류: {e}")
-    finally:
-        try:
-            if upload_path.exists():
-                upload_path.unlink()
-        except Exception as e:
-            logger.warning("임시 파일 삭제 실패: %s", e)
+
+@app.get("/api/detect/{detection_id}/image")
+async def get_detection_image(detection_id: str, kind: str = "result"):
+    """
+    image_transport=url로 요청한 감지의 결과(또는 원본) 이미지를 바이너리로 반환합니다.
+
+    Args:
+        detection_id: /api/detect 응답의 detection_id
+        kind: result 또는 original
+    """
+    if kind not in ("result", "original"):
+        raise HTTPException(status_code=400, detail="kind: result, original 중 하나")
+    stored = _detect_results.get(detection_id)
+    if stored is None or stored.get(kind) is None:
+        raise HTTPException(status_code=404, detail="이미지가 없거나 만료되었습니다.")
+    return Response(
+        content=stored[kind],
+        media_type=stored["media_type"],
+        headers={"Cache-Control": f"private, max-age={_detect_result_ttl}"},
+    )
+
+
+@app.post("/api/detect/batch")
+async def detect_plant_disease_batch(
+    files: List[UploadFile] = File(...),
+    conf_threshold: Optional[float] = 0.01,
+    include_images: bool = True,
+):
+    """
+    여러 잎 사진을 한 번에 감지합니다 (YOLO 배치 순전파, 입력 순서대로 결과 반환).
+    LLM 방제법은 생성하지 않습니다 (필요한 사진은 /api/detect로 개별 요청).
+
+    Args:
+        files: 이미지 파일 목록 (최대 detect_batch_max_images장)
+        conf_threshold: 신뢰도 임계값
+        include_images: False면 원본/결과 이미지(base64) 생성을 생략 (응답 크기·처리 시간 감소)
+    """
+    if not _HAS_DETECTOR:
+        raise HTTPException(status_code=503, detail="모델 모듈 없음(inference). 설치/배치 후 재시도하세요.")
+    if len(files) > _detect_batch_max_images:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {_detect_batch_max_images}장까지 업로드할 수 있습니다.")
+
+    allowed_extensions = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+    try:
+        # 허용되지 않은 형식은 추론 전에 제외 (결과는 입력 위치에 오류로 기록)
+        accepted = [
+            index for index, f in enumerate(files)
+            if Path(f.filename or "").suffix.lower() in allowed_extensions
+        ]
+        contents = [await files[index].read() for index in accepted]
+
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        batch_results = await loop.run_in_executor(
+            _detect_executor, _run_detection_batch, contents, conf_threshold, include_images
+        )
+        elapsed = loop.time() - start
+        results_by_index = dict(zip(accepted, batch_results))
+
+        items = []
+        for index, upload in enumerate(files):
+            results = results_by_index.get(index)
+            if results is None:
+                items.append({"index": index, "filename": upload.filename, "success": False,
+                              "error": f"허용 형식: {', '.join(sorted(allowed_extensions))}"})
+            elif "error" in results:
+                items.append({"index": index, "filename": upload.filename, "success": False, "error": results["error"]})
+            else:
+                items.append({"index": index, "filename": upload.filename, **_format_detection(results)})
+
+        logger.info("detect batch: images=%d elapsed=%.2fs", len(files), elapsed)
+        return JSONResponse(content={
+            "success": True,
+            "count": len(items),
+            "failed": sum(not item["success"] for item in items),
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "results": items,
+        })
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("detect batch error: %s", e)
+        raise HTTPException(status_code=500, detail=f"서버 오류: {e}")
 
 # --- Cleanup (from teammate) ---
 @app.delete("/api/cleanup")
@@ -61,6 +61,14 @@ class PeriodAnalysis(BaseModel):
     layout_type: str = Field("split", description="레이아웃 타입: 'split' (좌우 분할)")
 
 
+class PeriodReference(BaseModel):
+    """기간별 분석 참조 (텍스트 없이 숫자만, 텍스트는 /growth-graph/period-analysis로 조회)"""
+    period: int = Field(..., description="기간 (주 또는 월)")
+    stage: str = Field(..., description="성장 단계 (초기/초기 성장/중기 성장/후기 성장)")
+    good_size: float = Field(..., description="좋은 조건 크기 (cm)")
+    bad_size: float = Field(..., description="나쁜 조건 크기 (cm)")
+
+
 class GrowthGraph(BaseModel):
     """성장 예측 그래프 (좋은/나쁜 지표 포함)"""
     good_growth: List[GrowthGraphPoint] = Field(..., description="좋은 생장 그래프 지표 (최적 관리 시)")
@@ -70,6 +78,7 @@ class GrowthGraph(BaseModel):
     min_size: float = Field(..., description="발아단계 최소 크기 (cm) - Y축 시작값")
     max_size: float = Field(..., description="최대 성장 크기 (cm) - Y축 끝값")
     period_analyses: List[PeriodAnalysis] = Field(default_factory=list, description="월별 상세 분석 정보")
+    period_refs: Optional[List[PeriodReference]] = Field(None, description="기간별 분석 참조 (include_period_text=false일 때만, period_analyses 대신)")
     note: str = Field("성장 그래프는 환경/관리 상태에 따라 달라질 수 있습니다.", description="해석 노트")
     # 그래프 시각화 정보
     graph_config: Dict[str, Any] = Field(
@@ -121,3 +130,9 @@ class MonthlyDataAnalysis(BaseModel):
     success: bool = True
     message: str = "월별 데이터 분석이 완료되었습니다."
 
+
+
+class CareGuidePregenerateRequest(BaseModel):
+    """관리 가이드 사전 생성 요청 (관리자용)"""
+    plant_names: List[str] = Field(..., min_length=1, max_length=200, description="가이드를 미리 생성할 식물 이름 목록")
+    force: bool = Field(False, description="이미 저장된 가이드도 다시 생성할지 여부")
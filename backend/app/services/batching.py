@@ -0,0 +1,130 @@
+"""
+동적 마이크로 배칭
+
+여러 요청의 입력을 모아 한 번의 forward pass로 처리합니다.
+- 단일 워커 스레드가 최대 max_batch_size개 또는 첫 요청 후 max_wait_ms까지 입력을 모음
+- 배치 추론 결과를 각 요청의 Future로 분배
+- 실제 배치 크기 분포를 지표로 제공
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+class MicroBatcher:
+    """요청을 모아 배치 단위로 추론 함수를 호출하는 워커"""
+
+    def __init__(
+        self,
+        infer_fn: Callable[[Sequence[Any]], Sequence[Any]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+        name: str = "batcher",
+    ):
+        """
+        Args:
+            infer_fn: 입력 리스트를 받아 같은 순서의 결과 리스트를 반환하는 함수
+            max_batch_size: 한 배치의 최대 입력 수
+            max_wait_ms: 첫 입력 도착 후 배치를 채우기 위해 기다리는 최대 시간 (밀리초)
+            name: 워커 스레드 이름 / 로그 태그
+        """
+        self.infer_fn = infer_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.name = name
+
+        self._queue: "queue.Queue[Tuple[Any, Future]]" = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+        self._errors = 0
+        self._batch_sizes: Dict[int, int] = {}
+        self._infer_seconds_total = 0.0
+
+    def submit(self, item: Any) -> Future:
+        """입력 하나를 대기열에 넣고 결과를 받을 Future를 반환합니다."""
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def _ensure_worker(self):
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name=f"{self.name}-worker", daemon=True)
+                self._worker.start()
+
+    def _collect(self) -> List[Tuple[Any, Future]]:
+        """첫 입력을 기다린 뒤, 배치가 차거나 대기 시간이 끝날 때까지 입력을 모읍니다."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # 대기 시간이 끝나도 이미 도착한 입력은 함께 처리
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except queue.Empty:
+                    break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            # 이미 취소된 요청은 제외
+            batch = [(item, fut) for item, fut in batch if fut.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            start = time.perf_counter()
+            try:
+                results = self.infer_fn([item for item, _ in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(f"배치 결과 수 불일치: {len(results)} != {len(batch)}")
+            except Exception as e:
+                print(f"[{self.name}] 배치 추론 오류 (batch={len(batch)}): {e}")
+                with self._stats_lock:
+                    self._errors += 1
+                for _, fut in batch:
+                    fut.set_exception(e)
+                continue
+            elapsed = time.perf_counter() - start
+
+            with self._stats_lock:
+                self._batches += 1
+                self._items += len(batch)
+                self._batch_sizes[len(batch)] = self._batch_sizes.get(len(batch), 0) + 1
+                self._infer_seconds_total += elapsed
+
+            for (_, fut), result in zip(batch, results):
+                fut.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """배치 지표(배치 수, 평균/분포 배치 크기, 추론 시간)를 반환합니다."""
+        with self._stats_lock:
+            batches = self._batches
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "batches": batches,
+                "items": self._items,
+                "errors": self._errors,
+                "queue_depth": self._queue.qsize(),
+                "avg_batch_size": round(self._items / batches, 3) if batches else None,
+                "batch_size_histogram": dict(sorted(self._batch_sizes.items())),
+                "avg_infer_ms": round(self._infer_seconds_total / batches * 1000, 3) if batches else None,
+            }
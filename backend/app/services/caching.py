@@ -0,0 +1,292 @@
+"""
+캐시 유틸리티
+
+- content_hash: 이미지 바이트 등 내용 기반 고속 해시 키
+- LRUTTLCache: 스레드 안전 메모리 LRU + TTL 캐시 (히트/미스/제거 지표 포함)
+- SqliteKVStore: SQLite 기반 디스크 키-값 저장소 (프로세스/워커 간 공유, 재시작 후 유지)
+- SingleFlight: 같은 키의 동시 계산을 하나로 합침 (나머지 호출은 결과를 기다려 공유)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Union
+
+_MISSING = object()
+
+
+def content_hash(data: bytes) -> str:
+    """내용 기반 캐시 키 (BLAKE2b 128비트, MD5보다 빠르고 충돌에 강함)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class LRUTTLCache:
+    """스레드 안전 LRU + TTL 메모리 캐시 (선택적으로 전체 바이트 수 상한)"""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        """
+        Args:
+            maxsize: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            ttl: 항목 유효 시간 (초), None이면 만료 없음
+            max_bytes: 값 크기 합계 상한 (초과 시 오래된 항목부터 제거), None이면 항목 수만 제한
+            sizeof: 값의 바이트 크기 계산 함수 (max_bytes 사용 시 필수)
+        """
+        if max_bytes is not None and sizeof is None:
+            raise ValueError("max_bytes를 쓰려면 sizeof가 필요합니다.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key → (value, expires_at, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            value, expires_at, size = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> bool:
+        """
+        값을 저장합니다.
+
+        Returns:
+            bool: 저장 여부 (값 하나가 max_bytes보다 크면 저장하지 않고 False)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        size = self._sizeof(value) if self._sizeof is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+        with self._lock:
+            previous = self._data.pop(key, _MISSING)
+            if previous is not _MISSING:
+                self._bytes -= previous[2]
+            self._data[key] = (value, expires_at, size)
+            self._bytes += size
+            while len(self._data) > self.maxsize or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, evicted = self._data.popitem(last=False)
+                self._bytes -= evicted[2]
+                self.evictions += 1
+        return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+            if entry is not _MISSING:
+                self._bytes -= entry[2]
+        return default if entry is _MISSING else entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                **({"bytes": self._bytes, "max_bytes": self.max_bytes} if self.max_bytes is not None else {}),
+            }
+
+
+class SqliteKVStore:
+    """
+    SQLite 기반 디스크 키-값 저장소 (값은 JSON 직렬화)
+    WAL 모드로 여러 프로세스/워커가 동시에 읽고 쓸 수 있습니다.
+    """
+
+    def __init__(self, path: Union[str, Path], table: str = "kv", ttl: Optional[float] = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (상위 디렉토리는 자동 생성)
+            table: 테이블 이름
+            ttl: 기본 유효 시간 (초), None이면 만료 없음
+        """
+        if not table.isidentifier():
+            raise ValueError(f"잘못된 테이블 이름: {table}")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.table = table
+        self.ttl = ttl
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL)"
+        )
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간 공유하지 않고 스레드마다 하나씩 사용
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, default: Any = None) -> Any:
+        row = self._conn().execute(
+            f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return default
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(key)
+            return default
+        return json.loads(value)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        now = time.time()
+        result = {}
+        # SQLite 변수 개수 제한을 피하기 위해 나눠서 조회
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn().execute(
+                f"SELECT key, value, expires_at FROM {self.table} WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            for key, value, expires_at in rows:
+                if expires_at is None or expires_at > now:
+                    result[key] = json.loads(value)
+        return result
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        self.set_many({key: value}, ttl=ttl)
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None):
+        if not items:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl else None
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                [(key, json.dumps(value, ensure_ascii=False), expires_at) for key, value in items.items()],
+            )
+
+    def delete(self, key: str):
+        conn = self._conn()
+        with conn:
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """만료된 항목을 삭제하고 삭제 수를 반환합니다."""
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+            )
+        return cur.rowcount
+
+    def __len__(self) -> int:
+        return self._conn().execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+
+class SingleFlight:
+    """
+    같은 키에 대한 동시 호출 중 하나만 fn을 실행하고, 나머지는 그 결과(또는 예외)를 공유합니다.
+    완료된 결과는 보관하지 않으므로 캐시와 함께 사용합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "_Call"] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Args:
+            key: 중복 제거 키
+            fn: 실제 계산 함수 (인자 없음)
+
+        Returns:
+            Any: fn의 결과 (동시에 들어온 호출은 같은 결과를 받음)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"in_flight": len(self._calls), "executed": self.executed, "shared": self.shared}
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
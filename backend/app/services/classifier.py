@@ -1,17 +1,36 @@
-from io import BytesIO
-from PIL import Image
-import torch
-import numpy as np
-from transformers import AutoImageProcessor, AutoModelForImageClassification, pipeline
-import requests
+from pathlib import Path
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 from app.config import settings
 from app.models.schemas import PlantIdentification
+from app.services.batching import MicroBatcher
+from app.services.caching import LRUTTLCache, SqliteKVStore, content_hash
+from app.services.preprocess import preprocess_image
+from app.services.plantrecog_client import CircuitOpenError, get_plantrecog_client
+from app.services import translation
+from app.services.lazy_imports import lazy_import
+
+# torch/transformers는 모델을 실제로 로드/추론하는 경로에서만 import
+torch = lazy_import("torch")
+transformers = lazy_import("transformers")
 
 # 전역 변수로 모델 캐싱
 _classifier_model = None
 _processor = None
 _translator = None
-_translation_cache = {}
+_batcher = None
+_result_cache = None
+_result_disk_cache = None
+_result_cache_disk_hits = 0
+_ensemble_executor = None
+_ensemble_lock = threading.Lock()
+_backend_latency = {}
+_ensemble_stats = {"runs": 0, "short_circuits": 0, "remote_skipped": 0, "remote_cancelled": 0, "remote_failures": 0}
+
+# 분류 결과 상위 k개
+CLASSIFIER_TOP_K = 3
 
 
 def load_classifier():
@@ -21,12 +40,12 @@ def load_classifier():
     if _classifier_model is None:
         print(f"모델 로딩 중: {settings.plant_classifier_model}")
         try:
-            _processor = AutoImageProcessor.from_pretrained(
+            _processor = transformers.AutoImageProcessor.from_pretrained(
                 settings.plant_classifier_model,
                 cache_dir=settings.cache_dir,
                 token=settings.huggingface_token
             )
-            _classifier_model = AutoModelForImageClassification.from_pretrained(
+            _classifier_model = transformers.AutoModelForImageClassification.from_pretrained(
                 settings.plant_classifier_model,
                 cache_dir=settings.cache_dir,
                 token=settings.huggingface_token
@@ -43,9 +62,182 @@ def load_classifier():
     return _processor, _classifier_model
 
 
+def _infer_batch(batch: list) -> list:
+    """
+    전처리된 이미지 텐서들을 한 번의 forward pass로 분류합니다.
+
+    Args:
+        batch: (1, 3, 224, 224) 텐서 리스트
+
+    Returns:
+        이미지별 [{"label": str, "score": float}, ...] (상위 k개) 리스트
+    """
+    processor, model = load_classifier()
+
+    pixel_values = torch.cat(batch, dim=0)
+    # GPU로 이동 (사용 가능한 경우)
+    if torch.cuda.is_available():
+        pixel_values = pixel_values.cuda()
+
+    # 추론 실행
+    with torch.no_grad():
+        logits = model(pixel_values=pixel_values).logits
+
+    # Softmax를 적용하여 확률로 변환
+    probabilities = torch.nn.functional.softmax(logits, dim=-1)
+    k = min(CLASSIFIER_TOP_K, probabilities.shape[-1])
+    top_probs, top_indices = torch.topk(probabilities, k=k, dim=-1)
+
+    id2label = model.config.id2label
+    results = []
+    for probs, indices in zip(top_probs.tolist(), top_indices.tolist()):
+        results.append([
+            {"label": id2label.get(int(idx), f"Class {idx}"), "score": float(prob)}
+            for prob, idx in zip(probs, indices)
+        ])
+    return results
+
+
+def get_classifier_batcher() -> MicroBatcher:
+    """ViT 분류기 마이크로 배처를 반환합니다 (처음 한 번만 생성)"""
+    global _batcher
+
+    if _batcher is None:
+        _batcher = MicroBatcher(
+            _infer_batch,
+            max_batch_size=settings.classifier_max_batch_size,
+            max_wait_ms=settings.classifier_max_batch_wait_ms,
+            name="classifier",
+        )
+    return _batcher
+
+
+def get_classifier_stats() -> dict:
+    """분류기 배치 지표를 반환합니다."""
+    if _batcher is None:
+        return {"batches": 0}
+    return _batcher.stats()
+
+
+def _get_result_caches():
+    """분류 결과 캐시(메모리 LRU+TTL, 선택적 디스크 계층)를 반환합니다 (처음 한 번만 생성)"""
+    global _result_cache, _result_disk_cache
+
+    if _result_cache is None:
+        _result_cache = LRUTTLCache(
+            maxsize=settings.classification_cache_size,
+            ttl=settings.classification_cache_ttl,
+        )
+        if settings.classification_cache_disk:
+            try:
+                _result_disk_cache = SqliteKVStore(
+                    Path(settings.cache_dir) / "classification_cache.sqlite3",
+                    table="classification",
+                    ttl=settings.classification_cache_ttl,
+                )
+            except Exception as e:
+                print(f"[분류 캐시] 디스크 캐시 초기화 실패 (메모리만 사용): {e}")
+                _result_disk_cache = None
+    return _result_cache, _result_disk_cache
+
+
+def _cached_classify(backend: str, image: bytes, classify_fn) -> PlantIdentification:
+    """
+    이미지 내용 해시로 분류 결과를 캐시합니다 (분류기 백엔드별).
+    classify_fn이 예외를 던지면 캐시하지 않고 예외를 그대로 전달합니다.
+    캐시에는 번역 전 영어 결과만 저장하므로, 번역 실패(원문 대체)가 캐시에 남지 않습니다
+    (번역은 _translate_identification에서 조회 시점마다 적용, 번역 자체는 translation 캐시 사용).
+    """
+    global _result_cache_disk_hits
+
+    if settings.classification_cache_size <= 0:
+        return classify_fn(image)
+
+    memory, disk = _get_result_caches()
+    # "en": 번역 전 결과 (번역된 이름을 저장하던 예전 디스크 항목과 분리)
+    key = f"{backend}:en:{content_hash(image)}"
+
+    cached = memory.get(key)
+    if cached is not None:
+        return cached.model_copy(deep=True)
+
+    if disk is not None:
+        data = disk.get(key)
+        if data is not None:
+            _result_cache_disk_hits += 1
+            identification = PlantIdentification(**data)
+            memory.set(key, identification)
+            return identification.model_copy(deep=True)
+
+    identification = classify_fn(image)
+    memory.set(key, identification)
+    if disk is not None:
+        try:
+            disk.set(key, identification.model_dump())
+        except Exception as e:
+            print(f"[분류 캐시] 디스크 저장 실패: {e}")
+    return identification.model_copy(deep=True)
+
+
+def _translate_identification(identification: PlantIdentification, common_names: bool = True) -> PlantIdentification:
+    """
+    분류기의 영어 결과에 한국어 이름을 적용합니다 (GPT-4o-mini, 요청 내 이름을 한 번에).
+
+    Args:
+        identification: 번역 전 결과 (_cached_classify가 반환한 복사본, 직접 수정)
+        common_names: False면 plant_name만 번역 (common_names는 영어 그대로)
+
+    Returns:
+        PlantIdentification: 번역된 결과 (번역 실패한 이름은 영어 그대로)
+    """
+    names = [identification.plant_name] + (identification.common_names if common_names else [])
+    translated = translation.translate_names(names)
+    identification.plant_name = translated.get(identification.plant_name, identification.plant_name)
+    if common_names:
+        identification.common_names = [translated.get(name, name) for name in identification.common_names]
+    return identification
+
+
+def get_classification_cache_stats() -> dict:
+    """분류 결과 캐시 지표(히트/미스/제거)를 반환합니다."""
+    if _result_cache is None:
+        return {"enabled": settings.classification_cache_size > 0, "size": 0}
+    stats = _result_cache.stats()
+    stats["enabled"] = True
+    stats["disk_enabled"] = _result_disk_cache is not None
+    stats["disk_hits"] = _result_cache_disk_hits
+    return stats
+
+
+def _classify_vit(image: bytes) -> PlantIdentification:
+    """ViT 모델로 분류합니다. 실패 시 예외를 던집니다 (캐시되지 않도록)."""
+    # 이미지 전처리 (축소 디코딩 + float32 정규화 → (1, 3, 224, 224) 텐서)
+    pixel_values = preprocess_image(image)
+    
+    # 마이크로 배처를 통해 추론 (다른 요청과 한 배치로 묶여 실행될 수 있음)
+    results = get_classifier_batcher().submit(pixel_values).result()
+    
+    if not results:
+        raise RuntimeError("분류 결과 없음")
+
+    top_result = results[0]
+    plant_name_en = format_plant_name(top_result["label"])
+    confidence = top_result["score"]
+    common_names = [format_plant_name(r["label"]) for r in results[:3]]
+
+    # 번역 전 결과 (plant_name은 조회 시 _translate_identification에서 번역)
+    return PlantIdentification(
+        plant_name=plant_name_en,
+        scientific_name=plant_name_en,  # 영어 이름을 scientific_name으로 저장
+        confidence=confidence,
+        common_names=common_names
+    )
+
+
 def classify_plant(image: bytes) -> PlantIdentification:
     """
     Transformers 라이브러리를 직접 사용하여 식물 종을 식별합니다.
+    같은 이미지는 내용 해시 캐시에서 바로 반환합니다.
     
     Args:
         image: 식물 이미지 바이트
@@ -54,79 +246,8 @@ def classify_plant(image: bytes) -> PlantIdentification:
         PlantIdentification: 식물 식별 결과
     """
     try:
-        # 이미지 전처리
-        img = Image.open(BytesIO(image))
-        
-        # RGB로 변환
-        if img.mode != "RGB":
-            img = img.convert("RGB")
-        
-        # 모델 로드
-        processor, model = load_classifier()
-        
-        # 수동 이미지 전처리 (NumPy 호환성 문제 우회)
-        # 224x224로 리사이즈
-        img_resized = img.resize((224, 224), Image.Resampling.LANCZOS)
-        
-        # NumPy 배열로 변환하고 정규화
-        img_array = np.array(img_resized).astype(np.float32) / 255.0
-        
-        # ImageNet 정규화
-        mean = np.array([0.5, 0.5, 0.5])
-        std = np.array([0.5, 0.5, 0.5])
-        img_array = (img_array - mean) / std
-        
-        # (H, W, C) -> (C, H, W) 변환
-        img_array = np.transpose(img_array, (2, 0, 1))
-        
-        # PyTorch 텐서로 변환
-        pixel_values = torch.tensor(img_array, dtype=torch.float32).unsqueeze(0)
-        inputs = {"pixel_values": pixel_values}
-        
-        # GPU로 이동 (사용 가능한 경우)
-        if torch.cuda.is_available():
-            inputs = {k: v.cuda() for k, v in inputs.items()}
-        
-        # 추론 실행
-        with torch.no_grad():
-            outputs = model(**inputs)
-            logits = outputs.logits
-        
-        # 결과 파싱
-        # Softmax를 적용하여 확률로 변환
-        probabilities = torch.nn.functional.softmax(logits, dim=-1)
-        top_probs, top_indices = torch.topk(probabilities[0], k=3)
-        
-        # 결과 추출
-        results = []
-        for prob, idx in zip(top_probs, top_indices):
-            label = model.config.id2label.get(int(idx), f"Class {idx}")
-            results.append({
-                "label": label,
-                "score": float(prob)
-            })
-        
-        if results:
-            top_result = results[0]
-            plant_name_en = format_plant_name(top_result["label"])
-            plant_name = format_plant_name(top_result["label"])
-            confidence = top_result["score"]
-            common_names_en = [format_plant_name(r["label"]) for r in results[:3]]
-
-            # GPT-4o-mini로 식물 이름 번역
-            plant_name = translate_to_korean(plant_name_en)
-            common_names = [translate_to_korean(name) for name in common_names_en]
-            common_names = [format_plant_name(r["label"]) for r in results[:3]]
-
-            return PlantIdentification(
-                plant_name=plant_name,
-                scientific_name=plant_name_en,  # 영어 이름을 scientific_name으로 저장
-                confidence=confidence,
-                common_names=common_names
-            )
-        else:
-            return get_default_identification()
-            
+        # ViT 결과의 common_names는 영어 레이블 그대로 사용
+        return _translate_identification(_cached_classify("vit", image, _classify_vit), common_names=False)
     except Exception as e:
         print(f"식물 분류 오류: {e}")
         return get_default_identification()
@@ -152,7 +273,7 @@ def get_default_identification() -> PlantIdentification:
 
 def translate_to_korean(text: str) -> str:
     """
-    GPT-4o-mini를 사용하여 영어 식물 이름을 한국어로 번역합니다.
+    영어 식물 이름을 한국어로 번역합니다 (app.services.translation 사용).
 
     Args:
         text: 영어 식물 이름
@@ -160,93 +281,218 @@ def translate_to_korean(text: str) -> str:
     Returns:
         str: 한국어 번역 결과
     """
-    global _translation_cache
-    
-    # 이미 번역된 것이 있으면 캐시에서 반환
-    if text in _translation_cache:
-        return _translation_cache[text]
-    
-    try:
-        # OpenAI 클라이언트 import
-        from app.services.guide import load_openai_client
+    return translation.translate_to_korean(text)
 
-        client = load_openai_client()
-        if client is None:
-            print(f"[번역 실패] OpenAI 클라이언트 없음: {text}")
-            return text
-        
-        # GPT-4o-mini로 식물 이름 번역
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a plant name translator. Translate English plant names to Korean names that are commonly used in South Korea. Return only the Korean name, no additional text."
-                },
-                {
-                    "role": "user",
-                    "content": f"Translate this plant name to Korean: {text}"
-                }
-            ],
-            temperature=0.3,
-            max_tokens=50
-        )
-        
-        translated = response.choices[0].message.content.strip()
 
-        # 캐시에 저장
-        _translation_cache[text] = translated
-        print(f"[GPT 번역] {text} → {translated}")
+def prewarm_translations() -> int:
+    """
+    분류 모델의 id2label 레이블을 미리 번역해 둡니다 (서버 시작 시 호출).
+    번역은 디스크에 저장되므로 최초 1회만 GPT를 호출합니다.
 
-        return translated
-        
+    Returns:
+        int: 번역된 레이블 수
+    """
+    try:
+        config = transformers.AutoConfig.from_pretrained(
+            settings.plant_classifier_model,
+            cache_dir=settings.cache_dir,
+            token=settings.huggingface_token
+        )
+        labels = [format_plant_name(label) for label in config.id2label.values()]
+        count = translation.prewarm(labels)
+        print(f"[번역 프리웜] {count}/{len(labels)}개 레이블 번역 준비 완료")
+        return count
     except Exception as e:
-        print(f"[번역 오류] {text}: {e}")
-        # 오류 발생 시 원문 반환
-        return text
+        print(f"[번역 프리웜] 실패: {e}")
+        return 0
 
 
-def classify_plant_with_plantrecog(image: bytes) -> PlantIdentification:
-    """PlantRecog API를 사용하여 식물 종을 식별합니다."""
+def _classify_plantrecog(image: bytes) -> PlantIdentification:
+    """PlantRecog API로 분류합니다. 실패 시 예외를 던집니다 (캐시되지 않도록)."""
+    # 공유 커넥션 풀 + 재시도 + 회로 차단기 (app/services/plantrecog_client.py)
+    result = get_plantrecog_client().predict_sync(image)
+    predictions = []
+    if result.get("message") == "Success" and "payload" in result:
+        predictions = result["payload"].get("predictions", [])
+    if not predictions:
+        raise RuntimeError(f"예측 결과 없음: {result.get('message')}")
+
+    top_prediction = predictions[0]
+    plant_name_en = format_plant_name(top_prediction["name"])
+    confidence = top_prediction["score"]
+    common_names_en = [format_plant_name(p["name"]) for p in predictions[1:4]]
+
+    # 번역 전 결과 (조회 시 _translate_identification에서 번역)
+    return PlantIdentification(
+        plant_name=plant_name_en,
+        scientific_name=plant_name_en,  # 영어 이름을 scientific_name으로 저장
+        confidence=confidence,
+        common_names=common_names_en
+    )
+
+
+def _classify_plantrecog_or_error(image: bytes) -> Tuple[Optional[PlantIdentification], Optional[str]]:
+    """
+    PlantRecog API로만 분류합니다 (캐시 사용, ViT로 대체하지 않음).
+
+    Returns:
+        (결과, None) 또는 실패 시 (None, 오류 메시지)
+    """
     try:
-        api_url = "https://plantrecog.sarthak.work/predict"
-        files = {'image': ('plant.jpg', BytesIO(image), 'image/jpeg')}
-        response = requests.post(api_url, files=files, timeout=30)
-        
-        if response.status_code == 200:
-            result = response.json()
-            if result.get("message") == "Success" and "payload" in result:
-                predictions = result["payload"].get("predictions", [])
-                if predictions and len(predictions) > 0:
-                    top_prediction = predictions[0]
-                    plant_name_en = format_plant_name(top_prediction["name"])
-                    confidence = top_prediction["score"]
-                    common_names_en = [format_plant_name(p["name"]) for p in predictions[1:4]]
-
-                    # GPT-4o-mini로 식물 이름 번역
-                    plant_name = translate_to_korean(plant_name_en)
-                    common_names = [translate_to_korean(name) for name in common_names_en]
-
-                    return PlantIdentification(
-                        plant_name=plant_name,
-                        scientific_name=plant_name_en,  # 영어 이름을 scientific_name으로 저장
-                        confidence=confidence,
-                        common_names=common_names
-                    )
-        return get_default_identification()
+        return _translate_identification(_cached_classify("plantrecog", image, _classify_plantrecog)), None
+    except CircuitOpenError:
+        print("[PlantRecog] 회로 차단기 열림")
+        return None, "PlantRecog 회로 차단기가 열려 있습니다."
     except Exception as e:
         print(f"PlantRecog API 오류: {e}")
-        return get_default_identification()
+        return None, f"PlantRecog API 오류: {e}"
 
 
-def classify_plant_multi_model(image: bytes) -> dict:
-    """두 모델을 모두 사용하여 식물을 식별하고 결과를 비교합니다."""
-    vit_result = classify_plant(image)
-    plantrecog_result = classify_plant_with_plantrecog(image)
-    
+def classify_plant_with_plantrecog(image: bytes) -> PlantIdentification:
+    """
+    PlantRecog API를 사용하여 식물 종을 식별합니다. 같은 이미지는 캐시에서 바로 반환합니다.
+    원격 API가 실패하거나 회로 차단기가 열려 있으면 로컬 ViT 결과로 대체합니다.
+    """
+    result, error = _classify_plantrecog_or_error(image)
+    if result is None:
+        print(f"[PlantRecog] ViT 결과로 대체 ({error})")
+        return classify_plant(image)
+    return result
+
+
+ENSEMBLE_POLICIES = ("parallel", "local_first")
+
+
+def _get_ensemble_executor() -> ThreadPoolExecutor:
+    """원격 분류기 호출용 스레드 풀을 반환합니다 (처음 한 번만 생성)"""
+    global _ensemble_executor
+
+    if _ensemble_executor is None:
+        with _ensemble_lock:
+            if _ensemble_executor is None:
+                _ensemble_executor = ThreadPoolExecutor(
+                    max_workers=settings.executor_max_workers,
+                    thread_name_prefix="classifier-ensemble",
+                )
+    return _ensemble_executor
+
+
+def _timed(backend: str, classify_fn, image: bytes) -> PlantIdentification:
+    """분류기를 실행하고 백엔드별 지연 시간을 기록합니다."""
+    start = time.perf_counter()
+    try:
+        return classify_fn(image)
+    finally:
+        elapsed = time.perf_counter() - start
+        with _ensemble_lock:
+            entry = _backend_latency.setdefault(backend, {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            entry["calls"] += 1
+            entry["total_seconds"] += elapsed
+            entry["max_seconds"] = max(entry["max_seconds"], elapsed)
+
+
+def _count(key: str):
+    with _ensemble_lock:
+        _ensemble_stats[key] += 1
+
+
+def run_classifier_ensemble(
+    image: bytes,
+    policy: Optional[str] = None,
+    short_circuit: bool = True,
+) -> dict:
+    """
+    ViT(로컬)와 PlantRecog(원격) 분류기를 함께 실행합니다.
+
+    원격 호출은 전용 스레드 풀에서, ViT는 호출 스레드에서 동시에 실행되므로
+    전체 지연 시간은 두 분류기의 합이 아니라 느린 쪽(보통 원격)에 가깝습니다.
+
+    Args:
+        image: 식물 이미지 바이트
+        policy: "parallel" 또는 "local_first" (None이면 settings.classifier_ensemble_policy)
+        short_circuit: True면 ViT 신뢰도가 기준 이상일 때 원격 결과를 기다리지 않음
+            (parallel: 아직 시작 전이면 취소, 실행 중이면 백그라운드에서 끝나 캐시만 채움 /
+             local_first: 원격 호출 자체를 생략)
+
+    Returns:
+        dict: vit_model, plantrecog_model(생략/실패 시 None), plantrecog_error(실패 시 메시지),
+            latency_ms(백엔드별), policy, short_circuited
+        원격 분류가 실패해도 ViT 결과로 대체하지 않습니다 (대체 여부는 호출자가 결정).
+    """
+    policy = policy or settings.classifier_ensemble_policy
+    if policy not in ENSEMBLE_POLICIES:
+        print(f"[분류 앙상블] 알 수 없는 정책 '{policy}' → parallel 사용")
+        policy = "parallel"
+    threshold = settings.classifier_auto_select_threshold
+    _count("runs")
+
+    latency_ms = {}
+
+    def run(backend, classify_fn):
+        start = time.perf_counter()
+        result = _timed(backend, classify_fn, image)
+        latency_ms[backend] = round((time.perf_counter() - start) * 1000, 1)
+        return result
+
+    remote_future = None
+    if policy == "parallel":
+        remote_future = _get_ensemble_executor().submit(run, "plantrecog", _classify_plantrecog_or_error)
+
+    vit_result = run("vit", classify_plant)
+    plantrecog_result, plantrecog_error = None, None
+    short_circuited = short_circuit and vit_result.confidence >= threshold
+
+    if short_circuited:
+        _count("short_circuits")
+        if remote_future is None:
+            _count("remote_skipped")
+        elif remote_future.cancel():
+            _count("remote_cancelled")
+    elif remote_future is not None:
+        plantrecog_result, plantrecog_error = remote_future.result()
+    else:
+        plantrecog_result, plantrecog_error = run("plantrecog", _classify_plantrecog_or_error)
+    if plantrecog_error is not None:
+        _count("remote_failures")
+
     return {
         "vit_model": vit_result,
-        "plantrecog_model": plantrecog_result
+        "plantrecog_model": plantrecog_result,
+        "plantrecog_error": plantrecog_error,
+        # 단락된 원격 호출이 백그라운드에서 끝나도 반환값은 바뀌지 않도록 복사
+        "latency_ms": dict(latency_ms),
+        "policy": policy,
+        "short_circuited": short_circuited,
+    }
+
+
+def get_ensemble_stats() -> dict:
+    """분류 앙상블 지표(백엔드별 호출 수/평균·최대 지연, 단락 횟수)를 반환합니다."""
+    with _ensemble_lock:
+        backends = {
+            backend: {
+                "calls": entry["calls"],
+                "avg_ms": round(entry["total_seconds"] / entry["calls"] * 1000, 1) if entry["calls"] else None,
+                "max_ms": round(entry["max_seconds"] * 1000, 1),
+            }
+            for backend, entry in _backend_latency.items()
+        }
+        stats = dict(_ensemble_stats)
+    stats["policy"] = settings.classifier_ensemble_policy
+    stats["backends"] = backends
+    return stats
+
+
+def classify_plant_multi_model(image: bytes) -> dict:
+    """두 모델을 동시에 실행하여 식물을 식별하고 결과를 비교합니다."""
+    results = run_classifier_ensemble(image, policy="parallel", short_circuit=False)
+    print(f"[분류 앙상블] 지연 시간(ms): {results['latency_ms']}")
+
+    return {
+        "vit_model": results["vit_model"],
+        "plantrecog_model": results["plantrecog_model"],
+        "plantrecog_error": results["plantrecog_error"],
+        "latency_ms": results["latency_ms"],
     }
 
 
@@ -258,26 +504,34 @@ def classify_plant_multi_model_kr(image: bytes) -> dict:
 
 def classify_plant_auto_select(image: bytes) -> PlantIdentification:
     """
-    두 모델을 실행하고 최적의 결과를 자동으로 선택합니다.
+    두 모델을 동시에 실행하고 최적의 결과를 자동으로 선택합니다.
     
     선택 로직:
-    - 모델1 (20종 전문)이 50% 이상 → 모델1 선택
+    - 모델1 (20종 전문)이 50% 이상 → 모델1 선택 (모델2 결과는 기다리지 않음)
     - 모델1이 50% 미만 → 모델2 선택 (모델1이 해당 식물을 모름)
     """
-    vit_result = classify_plant(image)
-    plantrecog_result = classify_plant_with_plantrecog(image)
+    results = run_classifier_ensemble(image)
+    vit_result = results["vit_model"]
+    plantrecog_result = results["plantrecog_model"]
+    threshold = settings.classifier_auto_select_threshold
     
-    print(f"\n[자동 선택 로직]")
+    print(f"\n[자동 선택 로직] ({results['policy']}, 지연 시간(ms): {results['latency_ms']})")
     print(f"  모델1 (20종 전문): {vit_result.plant_name} - {vit_result.confidence*100:.1f}%")
-    print(f"  모델2 (299종 꽃): {plantrecog_result.plant_name} - {plantrecog_result.confidence*100:.1f}%")
+    if plantrecog_result is not None:
+        print(f"  모델2 (299종 꽃): {plantrecog_result.plant_name} - {plantrecog_result.confidence*100:.1f}%")
+    
+    # 모델1이 기준 이상이면 모델1 우선 (전문 모델이므로 신뢰)
+    if vit_result.confidence >= threshold:
+        print(f"  ✅ 선택: 모델1 (신뢰도 {vit_result.confidence*100:.1f}% >= {threshold*100:.0f}%)")
+        return vit_result
     
-    # 모델1이 50% 이상이면 모델1 우선 (전문 모델이므로 신뢰)
-    if vit_result.confidence >= 0.5:
-        print(f"  ✅ 선택: 모델1 (신뢰도 {vit_result.confidence*100:.1f}% >= 50%)")
+    # 모델2가 실패했으면 기준 미만이어도 모델1 결과 사용
+    if plantrecog_result is None:
+        print(f"  ✅ 선택: 모델1 (모델2 실패: {results['plantrecog_error']})")
         return vit_result
     
-    # 모델1이 50% 미만이면 모델2 선택 (모델1이 해당 식물을 인식하지 못함)
-    print(f"  ✅ 선택: 모델2 (모델1 신뢰도 {vit_result.confidence*100:.1f}% < 50%)")
+    # 모델1이 기준 미만이면 모델2 선택 (모델1이 해당 식물을 인식하지 못함)
+    print(f"  ✅ 선택: 모델2 (모델1 신뢰도 {vit_result.confidence*100:.1f}% < {threshold*100:.0f}%)")
     return plantrecog_result
 
 
@@ -1,9 +1,11 @@
-import json
-import os
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+from app.config import settings
 from app.models.schemas import PlantIdentification
+from app.services.growth_series import GrowthSeries
+from app.services.storage import JsonStorage, SqliteStorage, migrate_json_to_sqlite
 
 # 로컬 파일 저장 디렉토리 (프론트엔드 경로)
 # 백엔드 디렉토리 기준으로 상위 디렉토리의 plant-care-final/data 사용
@@ -16,14 +18,48 @@ DATA_DIR.mkdir(exist_ok=True, parents=True)
 IDENTIFICATION_FILE = DATA_DIR / "identifications.json"
 GROWTH_DATA_FILE = DATA_DIR / "growth_history.json"
 
-# 메모리 기반 저장 (서버 실행 중에만 유지, 창 닫으면 사라짐)
-# 형식: {plant_id: [{date: str, height: float}, ...]}
-_growth_data: Dict[str, List[Dict[str, Any]]] = {}
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_storage_path() -> Path:
+    """SQLite 저장소 파일 경로 (settings.storage_path, 기본값: DATA_DIR/seedai.sqlite3)"""
+    return Path(settings.storage_path) if settings.storage_path else DATA_DIR / "seedai.sqlite3"
+
+
+def get_storage():
+    """
+    설정된 저장소를 반환합니다 (처음 한 번만 생성).
+    SQLite 저장소는 처음 열 때 기존 JSON 파일을 한 번 가져옵니다 (storage_auto_migrate).
+    """
+    global _storage
+
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                if settings.storage_backend == "json":
+                    _storage = JsonStorage(
+                        IDENTIFICATION_FILE,
+                        GROWTH_DATA_FILE,
+                        journal_sync=settings.growth_journal_sync,
+                        journal_compact_threshold=settings.growth_journal_compact_threshold,
+                        journal_compact_interval=settings.growth_journal_compact_interval,
+                    )
+                else:
+                    storage = SqliteStorage(get_storage_path())
+                    if settings.storage_auto_migrate:
+                        try:
+                            migrate_json_to_sqlite(storage, IDENTIFICATION_FILE, GROWTH_DATA_FILE)
+                        except Exception as e:
+                            print(f"[db_utils] JSON 마이그레이션 실패 (빈 저장소로 시작): {e}")
+                    _storage = storage
+                print(f"[db_utils] 저장소: {type(_storage).__name__}")
+    return _storage
 
 
 def save_identification_data(identification: PlantIdentification, file_hash: Optional[str] = None) -> str:
     """
-    식물 분석 데이터를 로컬 파일에 저장합니다.
+    식물 분석 데이터를 저장소에 저장합니다.
     
     Args:
         identification: 식물 식별 결과
@@ -33,19 +69,6 @@ def save_identification_data(identification: PlantIdentification, file_hash: Opt
         저장된 데이터 ID
     """
     print(f"[db_utils] 식물 분석 데이터 저장 시작: {identification.plant_name}")
-    print(f"[db_utils] 저장 경로: {IDENTIFICATION_FILE}")
-    # 기존 데이터 로드
-    identifications = {}
-    if IDENTIFICATION_FILE.exists():
-        try:
-            with open(IDENTIFICATION_FILE, 'r', encoding='utf-8') as f:
-                identifications = json.load(f)
-            print(f"[db_utils] 기존 데이터 로드 완료: {len(identifications)}개 항목")
-        except Exception as e:
-            print(f"[db_utils] 기존 데이터 로드 실패: {e}")
-            identifications = {}
-        else:
-            print(f"[db_utils] 기존 데이터 파일 없음, 새로 생성")
     
     # 데이터 ID 생성 (식물명 + 타임스탬프)
     data_id = f"{identification.plant_name}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
@@ -63,13 +86,8 @@ def save_identification_data(identification: PlantIdentification, file_hash: Opt
         }
     }
     
-    # 데이터 저장
-    identifications[data_id] = identification_data
-    
-    # 파일에 저장
     try:
-        with open(IDENTIFICATION_FILE, 'w', encoding='utf-8') as f:
-            json.dump(identifications, f, ensure_ascii=False, indent=2)
+        get_storage().save_identification(identification_data)
         print(f"[db_utils] 데이터 저장 완료: {data_id}")
     except Exception as e:
         print(f"[db_utils] 데이터 저장 실패: {e}")
@@ -89,21 +107,12 @@ def load_identification_data(data_id: Optional[str] = None, plant_name: Optional
     Returns:
         식물 분석 데이터 또는 None
     """
-
     print(f"[db_utils] 식물 분석 데이터 로드 시도: data_id={data_id}, plant_name={plant_name}")
-    print(f"[db_utils] 로드 경로: {IDENTIFICATION_FILE}")
 
-    if not IDENTIFICATION_FILE.exists():
-        print(f"[db_utils] 데이터 파일이 존재하지 않음: {IDENTIFICATION_FILE}")
-        return None
-    
     try:
-        with open(IDENTIFICATION_FILE, 'r', encoding='utf-8') as f:
-            identifications = json.load(f)
-        print(f"[db_utils] 데이터 파일 로드 완료: {len(identifications)}개 항목")
-
+        storage = get_storage()
         if data_id:
-            result = identifications.get(data_id)
+            result = storage.get_identification(data_id)
             if result:
                 print(f"[db_utils] data_id로 데이터 찾음: {data_id}")
             else:
@@ -111,19 +120,12 @@ def load_identification_data(data_id: Optional[str] = None, plant_name: Optional
             return result
         elif plant_name:
             # 해당 식물명의 최신 데이터 찾기
-            matching = [
-                data for data in identifications.values()
-                if data.get("identification", {}).get("plant_name") == plant_name
-            ]
-            print(f"[db_utils] plant_name으로 검색: '{plant_name}' -> {len(matching)}개 매칭")
-            if matching:
-                # 최신 데이터 반환
-                result = sorted(matching, key=lambda x: x.get("timestamp", ""), reverse=True)[0]
+            result = storage.latest_identification(plant_name)
+            if result:
                 print(f"[db_utils] 최신 데이터 찾음: {result.get('id')} (timestamp: {result.get('timestamp')})")
-                return result
             else:
                 print(f"[db_utils] plant_name으로 데이터 찾기 실패: '{plant_name}'")
-                print(f"[db_utils] 저장된 식물명 목록: {[d.get('identification', {}).get('plant_name') for d in identifications.values()]}")
+            return result
 
         return None
     except Exception as e:
@@ -135,103 +137,66 @@ def load_identification_data(data_id: Optional[str] = None, plant_name: Optional
 
 def save_growth_log(plant_id: str, date: str, height: float):
     """
-    성장 기록을 로컬 파일과 메모리에 저장합니다.
+    성장 기록을 저장소에 저장합니다 (같은 날짜 기록은 덮어씀).
     
     Args:
         plant_id: 식물 ID
         date: 날짜 (문자열)
         height: 높이 (cm)
     """
-    # 메모리에 저장
-    if plant_id not in _growth_data:
-        _growth_data[plant_id] = []
-    
-    # 기존 기록 확인 및 업데이트 또는 추가
-    existing_index = None
-    for i, record in enumerate(_growth_data[plant_id]):
-        if record["date"] == date:
-            existing_index = i
-            break
-    
-    if existing_index is not None:
-        # 기존 기록 업데이트
-        _growth_data[plant_id][existing_index]["height"] = height
-    else:
-        # 새 기록 추가
-        _growth_data[plant_id].append({"date": date, "height": height})
-        # 날짜순 정렬
-        _growth_data[plant_id].sort(key=lambda x: x["date"])
+    get_storage().save_growth(plant_id, date, height)
+
+
+def save_growth_logs(records: List[Tuple[str, str, float]]) -> int:
+    """
+    여러 성장 기록을 한 번에 저장합니다 (SQLite: 트랜잭션 한 번, JSON: 저널 추가 한 번).
     
-    # 파일에도 저장
-    try:
-        growth_history = {}
-        if GROWTH_DATA_FILE.exists():
-            try:
-                with open(GROWTH_DATA_FILE, 'r', encoding='utf-8') as f:
-                    growth_history = json.load(f)
-            except:
-                growth_history = {}
-        
-        if plant_id not in growth_history:
-            growth_history[plant_id] = []
-        
-        # 파일에서도 중복 확인 및 업데이트
-        file_existing_index = None
-        for i, record in enumerate(growth_history[plant_id]):
-            if record.get("date") == date:
-                file_existing_index = i
-                break
-        
-        if file_existing_index is not None:
-            growth_history[plant_id][file_existing_index]["height"] = height
-        else:
-            growth_history[plant_id].append({"date": date, "height": height})
-            growth_history[plant_id].sort(key=lambda x: x.get("date", ""))
+    Args:
+        records: (plant_id, date, height) 목록
         
-        with open(GROWTH_DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(growth_history, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        print(f"성장 기록 파일 저장 오류: {e}")
+    Returns:
+        저장한 기록 수
+    """
+    return get_storage().save_growth_many(records)
 
 
 def load_growth_history(plant_id: str) -> List[Dict]:
     """
-    성장 기록을 로컬 파일에서 조회합니다.
+    성장 기록을 저장소에서 조회합니다.
     
     Args:
         plant_id: 식물 ID
         
     Returns:
-        성장 기록 리스트 [{"date": str, "height": float}, ...]
+        성장 기록 리스트 [{"date": str, "height": float}, ...] (날짜순)
     """
-    # 파일에서 로드 시도
-    if GROWTH_DATA_FILE.exists():
-        try:
-            with open(GROWTH_DATA_FILE, 'r', encoding='utf-8') as f:
-                growth_history = json.load(f)
-                if plant_id in growth_history:
-                    return sorted(growth_history[plant_id], key=lambda x: x.get("date", ""))
-        except Exception as e:
-            print(f"성장 기록 파일 로드 오류: {e}")
-    
-    # 메모리에서 조회
-    if plant_id in _growth_data:
-        return sorted(_growth_data[plant_id], key=lambda x: x["date"])
+    try:
+        return get_storage().growth_history(plant_id)
+    except Exception as e:
+        print(f"성장 기록 로드 오류: {e}")
+        return []
+
+
+def load_growth_series(plant_id: str, start: Optional[str] = None, end: Optional[str] = None) -> GrowthSeries:
+    """
+    성장 기록을 열 기반 시계열로 조회합니다 (범위 조회/다운샘플링/열 내보내기용).
     
-    return []
+    Args:
+        plant_id: 식물 ID
+        start: 시작 날짜 YYYY-MM-DD (포함, 선택)
+        end: 끝 날짜 YYYY-MM-DD (포함, 선택)
+        
+    Returns:
+        GrowthSeries: 날짜순 시계열 (날짜 ordinal, 높이)
+    """
+    return get_storage().growth_series(plant_id, start, end)
 
 
 def clear_growth_data():
     """
     모든 성장 데이터를 초기화합니다 (테스트용).
     """
-    global _growth_data
-    _growth_data = {}
-    if GROWTH_DATA_FILE.exists():
-        try:
-            os.remove(GROWTH_DATA_FILE)
-        except:
-            pass
+    get_storage().clear_growth()
 
 
 def get_all_plant_ids() -> List[str]:
@@ -241,18 +206,4 @@ def get_all_plant_ids() -> List[str]:
     Returns:
         식물 ID 리스트
     """
-    plant_ids = set()
-    
-    # 파일에서 로드
-    if GROWTH_DATA_FILE.exists():
-        try:
-            with open(GROWTH_DATA_FILE, 'r', encoding='utf-8') as f:
-                growth_history = json.load(f)
-                plant_ids.update(growth_history.keys())
-        except:
-            pass
-    
-    # 메모리에서 로드
-    plant_ids.update(_growth_data.keys())
-    
-    return list(plant_ids)
+    return get_storage().plant_ids()
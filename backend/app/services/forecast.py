@@ -0,0 +1,266 @@
+"""
+성장 기록 기반 키 예측
+
+식물별 기록에 로지스틱 성장 곡선 h(t) = K / (1 + exp(-r (t - t0)))을 맞춰 앞으로의 키를 예측합니다.
+- 적합: 상한 K 후보 격자 전체를 한 번에 선형화(ln(K/h - 1) = -r t + r t0)하여
+  NumPy 가중 최소제곱으로 (r, t0)를 구하고, 원래 척도의 오차가 가장 작은 K를 선택
+- 캐시: 식물별 적합 결과를 기록 버전(개수/마지막 날짜/합계)과 함께 보관, 같은 버전이면 재사용
+- 증분 재적합: 새 기록이 들어오면 이전 K 주변의 좁은 격자로 다시 맞춤
+- 예측 구간: 잔차 표준편차와 외삽 거리로 넓어지는 95% 구간
+- 기록이 적으면(4개 미만) 또는 성장률이 사실상 0이면(정체 구간) 선형 추세로 대체
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.services.caching import LRUTTLCache
+from app.services.growth_series import GrowthSeries, ordinal_to_date
+
+# 로지스틱 적합 최소 기록 수 (미만이면 선형 추세)
+MIN_LOGISTIC_POINTS = 4
+# 95% 예측 구간
+_Z = 1.96
+# K 후보: 최대 기록값의 (1 + 배수)배
+_K_GRID = np.concatenate([np.linspace(0.01, 1.0, 40), np.geomspace(1.05, 20.0, 40)])
+_K_REFINE = np.linspace(0.8, 1.25, 24)
+_EPS = 1e-6
+# 이보다 작은 성장률(1/일)은 정체로 보고 선형(상수) 모델 사용 (t0 = a / r 발산 방지)
+_MIN_RATE = 1e-4
+
+_cache: Optional[LRUTTLCache] = None
+_cache_lock = threading.Lock()
+_stats = {"fits": 0, "refits": 0, "cache_hits": 0}
+
+
+class GrowthModel:
+    """적합된 성장 모델 (로지스틱 또는 선형)"""
+
+    __slots__ = ("method", "params", "day0", "last_day", "sigma", "n", "t_mean", "t_ss", "version")
+
+    def __init__(self, method: str, params: Dict[str, float], day0: int, last_day: int,
+                 sigma: float, n: int, t_mean: float, t_ss: float, version: tuple):
+        self.method = method
+        self.params = params
+        self.day0 = day0
+        self.last_day = last_day
+        self.sigma = sigma
+        self.n = n
+        self.t_mean = t_mean
+        self.t_ss = t_ss
+        self.version = version
+
+    def evaluate(self, days: np.ndarray) -> np.ndarray:
+        """날짜 ordinal 배열에서의 예측 키"""
+        t = np.asarray(days, dtype=np.float64) - self.day0
+        p = self.params
+        if self.method == "logistic":
+            return p["K"] / (1.0 + np.exp(-p["r"] * (t - p["t0"])))
+        return p["intercept"] + p["slope"] * t
+
+    def predict(self, days: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        예측값과 95% 예측 구간을 반환합니다.
+
+        Returns:
+            Dict[str, np.ndarray]: height, lower, upper
+        """
+        days = np.asarray(days, dtype=np.float64)
+        height = self.evaluate(days)
+        t = days - self.day0
+        # 회귀 예측 표준오차 형태: 학습 구간에서 멀어질수록 넓어짐
+        spread = self.sigma * np.sqrt(1.0 + 1.0 / max(self.n, 1) + (t - self.t_mean) ** 2 / max(self.t_ss, _EPS))
+        return {
+            "height": height,
+            "lower": np.maximum(height - _Z * spread, 0.0),
+            "upper": height + _Z * spread,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "params": {k: round(float(v), 6) for k, v in self.params.items()},
+            "sigma": round(float(self.sigma), 6),
+            "points": self.n,
+            "fitted_through": ordinal_to_date(self.last_day),
+        }
+
+
+def series_version(series: GrowthSeries) -> tuple:
+    """기록이 바뀌면 달라지는 버전 키 (개수, 마지막 날짜, 높이 합, 날짜 합)"""
+    days, heights = series.columns()
+    if not len(days):
+        return (0,)
+    return (len(days), int(days[-1]), float(heights.sum()), int(days.sum()))
+
+
+def _fit_linear(t: np.ndarray, h: np.ndarray) -> Tuple[Dict[str, float], np.ndarray]:
+    if len(t) == 1 or np.ptp(t) == 0:
+        return {"intercept": float(h.mean()), "slope": 0.0}, np.full_like(h, h.mean())
+    slope, intercept = np.polyfit(t, h, 1)
+    return {"intercept": float(intercept), "slope": float(slope)}, intercept + slope * t
+
+
+def _fit_logistic(t: np.ndarray, h: np.ndarray, k_candidates: np.ndarray) -> Tuple[Dict[str, float], np.ndarray]:
+    """
+    K 후보 전체를 한 번의 브로드캐스트 연산으로 적합합니다.
+
+    Args:
+        t: 경과 일수 (n,)
+        h: 키 (n,), 0보다 커야 함
+        k_candidates: 상한 후보 (m,), 모두 max(h)보다 커야 함
+
+    Returns:
+        (params, fitted): 오차가 가장 작은 K의 (K, r, t0)와 적합값
+    """
+    K = k_candidates[:, None]                          # (m, 1)
+    y = np.log(K / h[None, :] - 1.0)                   # (m, n) 선형화: y = a + b t
+    # 선형화로 커지는 작은 키의 오차를 보정하는 가중치 (델타법: dy/dh = -K / (h (K - h)))
+    w = (h[None, :] * (K - h[None, :]) / K) ** 2
+    w_sum = w.sum(axis=1, keepdims=True)
+    t_mean = (w @ t)[:, None] / w_sum                  # (m, 1)
+    y_mean = (w * y).sum(axis=1, keepdims=True) / w_sum
+    tc = t[None, :] - t_mean
+    b = ((w * tc * (y - y_mean)).sum(axis=1) / np.maximum((w * tc * tc).sum(axis=1), _EPS))  # (m,)
+    a = y_mean[:, 0] - b * t_mean[:, 0]
+    fitted = K / (1.0 + np.exp(a[:, None] + b[:, None] * t[None, :]))
+    sse = ((fitted - h[None, :]) ** 2).sum(axis=1)
+    # 성장(r > 0)하는 후보만 (모두 감소 추세면 전체에서 선택)
+    sse = np.where(b < 0, sse, np.inf) if np.any(b < 0) else sse
+    best = int(np.argmin(sse))
+    r = -b[best]
+    if abs(r) < _MIN_RATE:
+        # 정체: t0를 정할 수 없음 (호출자가 선형 모델로 대체)
+        return {"K": float(k_candidates[best]), "r": float(r), "t0": float("nan")}, fitted[best]
+    return {"K": float(k_candidates[best]), "r": float(r), "t0": float(a[best] / r)}, fitted[best]
+
+
+def fit_growth_model(series: GrowthSeries, previous: Optional[GrowthModel] = None) -> Optional[GrowthModel]:
+    """
+    시계열에 성장 모델을 맞춥니다.
+
+    Args:
+        series: 식물 성장 시계열
+        previous: 이전 적합 결과 (있으면 이전 K 주변의 좁은 격자로 증분 재적합)
+
+    Returns:
+        GrowthModel: 적합 결과 (기록이 없으면 None)
+    """
+    days, heights = series.columns()
+    n = len(days)
+    if n == 0:
+        return None
+
+    day0 = int(days[0])
+    t = (days - day0).astype(np.float64)
+    h = np.maximum(heights.astype(np.float64), _EPS)
+    version = series_version(series)
+
+    if n < MIN_LOGISTIC_POINTS or np.ptp(t) == 0:
+        method = "linear"
+        params, fitted = _fit_linear(t, h)
+    else:
+        method = "logistic"
+        h_max = float(h.max())
+        if previous is not None and previous.method == "logistic" and previous.day0 == day0:
+            candidates = previous.params["K"] * _K_REFINE
+            candidates = candidates[candidates > h_max * 1.001]
+            if not len(candidates):
+                candidates = h_max * (1.0 + _K_GRID)
+        else:
+            candidates = h_max * (1.0 + _K_GRID)
+        params, fitted = _fit_logistic(t, h, candidates)
+        if abs(params["r"]) < _MIN_RATE:
+            method = "linear"
+            params, fitted = _fit_linear(t, h)
+
+    dof = max(n - (3 if method == "logistic" else 2), 1)
+    sigma = float(np.sqrt(((h - fitted) ** 2).sum() / dof))
+    t_mean = float(t.mean())
+    return GrowthModel(
+        method=method,
+        params=params,
+        day0=day0,
+        last_day=int(days[-1]),
+        sigma=sigma,
+        n=n,
+        t_mean=t_mean,
+        t_ss=float(((t - t_mean) ** 2).sum()),
+        version=version,
+    )
+
+
+def _get_cache() -> LRUTTLCache:
+    global _cache
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LRUTTLCache(maxsize=100_000)
+    return _cache
+
+
+def get_growth_model(plant_id: str, series: GrowthSeries) -> Optional[GrowthModel]:
+    """
+    식물의 적합 모델을 반환합니다. 기록 버전이 같으면 캐시를 쓰고, 바뀌었으면 증분 재적합합니다.
+
+    Args:
+        plant_id: 식물 ID
+        series: 현재 성장 시계열
+
+    Returns:
+        GrowthModel: 적합 결과 (기록이 없으면 None)
+    """
+    cache = _get_cache()
+    cached: Optional[GrowthModel] = cache.get(plant_id)
+    version = series_version(series)
+    if cached is not None and cached.version == version:
+        _stats["cache_hits"] += 1
+        return cached
+
+    model = fit_growth_model(series, previous=cached)
+    _stats["refits" if cached is not None else "fits"] += 1
+    if model is not None:
+        cache.set(plant_id, model)
+    return model
+
+
+def fit_many(series_by_plant: Dict[str, GrowthSeries]) -> Dict[str, Optional[GrowthModel]]:
+    """여러 식물을 한 번에 (재)적합합니다 (배치 작업용, 버전이 같은 식물은 건너뜀)."""
+    return {plant_id: get_growth_model(plant_id, series) for plant_id, series in series_by_plant.items()}
+
+
+def forecast(plant_id: str, series: GrowthSeries, horizon_days: int = 7) -> Dict[str, Any]:
+    """
+    마지막 기록 다음 날부터 horizon_days일 동안의 키를 예측합니다.
+
+    Args:
+        plant_id: 식물 ID
+        series: 성장 시계열
+        horizon_days: 예측 일수
+
+    Returns:
+        Dict[str, Any]: model(적합 정보), prediction([{date, height, lower, upper}, ...])
+    """
+    model = get_growth_model(plant_id, series)
+    if model is None:
+        return {"model": None, "prediction": []}
+
+    future = np.arange(model.last_day + 1, model.last_day + 1 + horizon_days, dtype=np.int64)
+    predicted = model.predict(future)
+    prediction = [
+        {"date": ordinal_to_date(day), "height": round(height, 2), "lower": round(lower, 2), "upper": round(upper, 2)}
+        for day, height, lower, upper in zip(
+            future.tolist(), predicted["height"].tolist(), predicted["lower"].tolist(), predicted["upper"].tolist()
+        )
+    ]
+    return {"model": model.to_dict(), "prediction": prediction}
+
+
+def get_forecast_stats() -> dict:
+    """예측 모델 캐시 지표를 반환합니다."""
+    stats = dict(_stats)
+    stats["cached_models"] = len(_cache) if _cache is not None else 0
+    return stats
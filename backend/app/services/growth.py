@@ -2,8 +2,6 @@ import base64
 from typing import List
 from typing import List, Tuple, Optional, Dict, Any
 from io import BytesIO
-import torch
-from diffusers import AutoPipelineForText2Image
 from app.config import settings
 from app.models.schemas import GrowthPrediction, GrowthStage
 from app.models.schemas import (
@@ -12,13 +10,28 @@ from app.models.schemas import (
     GrowthGraph,
     GrowthGraphPoint,
     PeriodAnalysis,
+    PeriodReference,
     PlantIdentification,
 )
 # koGPT2 모델 사용 중지 - Qwen 모델 사용
-# from app.services.guide import load_text_generatorfrom app.services.db_utils import load_identification_data
+# from app.services.guide import load_text_generator
+from app.services.db_utils import load_identification_data
 from app.services.textgen_adapter import render_plant_analysis
-import math
+from app.services.caching import LRUTTLCache
+from app.services.lazy_imports import lazy_import
+from app.services.growth_curve import (
+    GOOD_GROWTH_MULTIPLIER,
+    BAD_GROWTH_MULTIPLIER,
+    compute_growth_curves,
+    growth_periods,
+    to_graph_points,
+)
 import hashlib
+import threading
+
+# torch/diffusers는 이미지 생성 경로에서만 import
+torch = lazy_import("torch")
+diffusers = lazy_import("diffusers")
 
 # 전역 변수로 모델 캐싱
 _image_pipeline = None
@@ -31,7 +44,7 @@ def load_image_generator():
     if _image_pipeline is None:
         print(f"이미지 생성 모델 로딩 중: {settings.image_generation_model}")
         try:
-            _image_pipeline = AutoPipelineForText2Image.from_pretrained(
+            _image_pipeline = diffusers.AutoPipelineForText2Image.from_pretrained(
                 settings.image_generation_model,
                 torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
                 cache_dir=settings.cache_dir,
@@ -198,7 +211,7 @@ def get_plant_size_range(plant_name: str, identification: Optional[PlantIdentifi
     return round(initial_size, 1), round(max_size, 1)
 
 
-def generate_growth_graph(plant_name: str, period_unit: str = "month", max_periods: int = 12, identification: Optional[PlantIdentification] = None) -> GrowthGraph:
+def generate_growth_graph(plant_name: str, period_unit: str = "month", max_periods: int = 12, identification: Optional[PlantIdentification] = None, include_period_text: bool = True) -> GrowthGraph:
     """
     종분석 데이터를 기반으로 성장 예측 그래프를 생성합니다.
     좋은 생장/나쁜 생장 지표 2개를 생성합니다.
@@ -208,6 +221,7 @@ def generate_growth_graph(plant_name: str, period_unit: str = "month", max_perio
         period_unit: 기간 단위 ('week' 또는 'month')
         max_periods: 최대 기간 수 (주 또는 월)
         identification: 식물 종분석 데이터 (Y축 범위 계산에 사용)
+        include_period_text: False면 기간별 분석 텍스트 대신 숫자 참조(period_refs)만 포함
         
     Returns:
         GrowthGraph: 좋은/나쁜 생장 그래프 포함
@@ -219,64 +233,26 @@ def generate_growth_graph(plant_name: str, period_unit: str = "month", max_perio
     initial_size, max_size = get_plant_size_range(plant_name, identification)
     
     # 기간별 데이터 포인트 생성
-    if period_unit == "week":
-        periods = list(range(0, max_periods + 1, max(1, max_periods // 12)))  # 최대 12개 포인트
-        if periods[-1] != max_periods:
-            periods.append(max_periods)
-    else:  # month
-        periods = list(range(0, max_periods + 1))
-    
-    def generate_growth_curve(periods_list: List[int], growth_rate_multiplier: float) -> List[GrowthGraphPoint]:
-        """
-        성장 곡선을 생성합니다.
-        
-        Args:
-            periods_list: 기간 리스트
-            growth_rate_multiplier: 성장률 배수 (1.0 = 예상, 1.3 = 좋은 생장, 0.7 = 나쁜 생장)
-            
-        Returns:
-            GrowthGraphPoint 리스트
-        """
-        points = []
-        
-        for period in periods_list:
-            # 로지스틱 곡선 기반 성장 계산
-            # k: 성장 속도 (period_unit에 따라 조정)
-            if period_unit == "week":
-                k = (0.15 + 0.1 * seed) * growth_rate_multiplier  # 주별 성장률
-                x0 = (8.0 - 4.0 * seed) * growth_rate_multiplier  # 전환점 (주)
-                normalized_period = period / max_periods * 24  # 24주 기준 정규화
-            else:  # month
-                k = (0.35 + 0.2 * seed) * growth_rate_multiplier  # 월별 성장률
-                x0 = (3.0 - 1.5 * seed) * growth_rate_multiplier  # 전환점 (월)
-                normalized_period = period
-            
-            # 로지스틱 함수로 성장 지수 계산 (0-1)
-            growth_index = 1.0 / (1.0 + math.exp(-k * (normalized_period - x0)))
-            
-            # 초기 크기에서 최대 크기로 변환
-            current_size = initial_size + (max_size - initial_size) * growth_index
-            
-            # 작은 변동 추가 (자연스러운 성장 곡선)
-            variation = (seed * 0.1 - 0.05) * current_size
-            current_size += variation
-            
-            # 크기는 최소 초기 크기 이상, 최대 크기 이하로 제한
-            current_size = max(initial_size * 0.8, min(current_size, max_size * 1.1))
-            
-            points.append(GrowthGraphPoint(
-                period=period,
-                size=round(current_size, 1)
-            ))
-        
-        return points
-    
-    # 2가지 성장 곡선 생성 (좋은/나쁜 조건만)
-    good_growth = generate_growth_curve(periods, 1.3)  # 좋은 생장 (30% 빠른 성장)
-    bad_growth = generate_growth_curve(periods, 0.7)  # 나쁜 생장 (30% 느린 성장)
+    periods = growth_periods(period_unit, max_periods)
+
+    # 2가지 성장 곡선을 한 번에 계산 (좋은/나쁜 조건), pydantic 변환은 마지막에
+    good_sizes, bad_sizes = compute_growth_curves(
+        seed, initial_size, max_size, periods, period_unit, max_periods,
+        multipliers=(GOOD_GROWTH_MULTIPLIER, BAD_GROWTH_MULTIPLIER),
+    )
+    good_growth = to_graph_points(periods, good_sizes)
+    bad_growth = to_graph_points(periods, bad_sizes)
     
-    # 월별 상세 분석 생성 (identification 전달)
-    period_analyses = generate_period_analyses(plant_name, periods, period_unit, good_growth, bad_growth, identification)
+    # 월별 상세 분석 생성 (identification 전달), 생략 시 기간별 참조만
+    if include_period_text:
+        period_analyses = generate_period_analyses(plant_name, periods, period_unit, good_growth, bad_growth, identification)
+        period_refs = None
+    else:
+        period_analyses = []
+        period_refs = [
+            PeriodReference(period=good.period, stage=get_period_stage(good.period), good_size=good.size, bad_size=bad.size)
+            for good, bad in zip(good_growth, bad_growth)
+        ]
     
     # Y축 범위 계산 (발아단계부터 최대 크기까지, 약간의 여유 공간 추가)
     y_min = max(0, initial_size * 0.9)  # 발아단계 크기의 90% (여유 공간)
@@ -290,6 +266,7 @@ def generate_growth_graph(plant_name: str, period_unit: str = "month", max_perio
         min_size=round(y_min, 1),
         max_size=round(y_max, 1),
         period_analyses=period_analyses,
+        period_refs=period_refs,
         note=f"{plant_name}의 성장 그래프입니다. 좋은 생장(최적 관리)과 나쁜 생장(관리 부족)을 비교할 수 있습니다.",
         graph_config={
             "good_growth_color": "#22c55e",  # 초록색 (좋은 조건)
@@ -300,6 +277,86 @@ def generate_growth_graph(plant_name: str, period_unit: str = "month", max_perio
     )
 
 
+_graph_cache: Optional[LRUTTLCache] = None
+_graph_cache_lock = threading.Lock()
+
+
+def confidence_bucket(confidence: float) -> float:
+    """신뢰도를 growth_graph_confidence_step 간격으로 양자화합니다 (구간 중앙값)."""
+    step = settings.growth_graph_confidence_step
+    if step <= 0:
+        return confidence
+    buckets = max(1, round(1.0 / step))
+    index = min(int(max(0.0, min(confidence, 1.0)) * buckets), buckets - 1)
+    return round((index + 0.5) / buckets, 6)
+
+
+def _get_graph_cache() -> LRUTTLCache:
+    global _graph_cache
+
+    if _graph_cache is None:
+        with _graph_cache_lock:
+            if _graph_cache is None:
+                _graph_cache = LRUTTLCache(maxsize=settings.growth_graph_cache_size)
+    return _graph_cache
+
+
+def get_growth_graph(
+    plant_name: str,
+    period_unit: str = "month",
+    max_periods: int = 12,
+    identification: Optional[PlantIdentification] = None,
+    include_period_text: bool = True,
+) -> Tuple[GrowthGraph, bytes]:
+    """
+    generate_growth_graph의 캐시 버전. 결과와 JSON 직렬화 바이트를 함께 반환합니다.
+    그래프 수치는 이름 시드/기간/신뢰도로만 결정되므로 신뢰도를 구간으로 양자화해 키로 쓰고,
+    그 구간 대표값으로 계산합니다 (같은 키 → 항상 같은 그래프).
+    기간별 분석 텍스트를 포함하면 프롬프트에 들어가는 학명/일반명(최대 3개)도 키에 포함합니다.
+
+    Args:
+        plant_name: 식물 이름
+        period_unit: 기간 단위 ('week' 또는 'month')
+        max_periods: 최대 기간 수
+        identification: 식물 종분석 데이터 (신뢰도, 텍스트 포함 시 학명/일반명)
+        include_period_text: False면 기간별 분석 텍스트 대신 숫자 참조만 포함
+
+    Returns:
+        (GrowthGraph, bytes): 그래프 사본과 JSON 바이트
+    """
+    bucket = None
+    names: tuple = ()
+    if identification is not None:
+        bucket = confidence_bucket(identification.confidence)
+        scientific_name, common_names = None, []
+        if include_period_text:
+            scientific_name = identification.scientific_name
+            common_names = list(identification.common_names or [])[:3]
+            names = (scientific_name, tuple(common_names))
+        # 키에 없는 필드가 그래프에 섞이지 않도록 키에 쓴 값만 남긴 식별 정보로 계산
+        identification = PlantIdentification(
+            plant_name=identification.plant_name,
+            scientific_name=scientific_name,
+            confidence=bucket,
+            common_names=common_names,
+        )
+    key = (plant_name, period_unit, max_periods, bucket, include_period_text, names)
+    cache = _get_graph_cache()
+    cached = cache.get(key)
+    if cached is None:
+        graph = generate_growth_graph(plant_name, period_unit, max_periods, identification, include_period_text)
+        cached = (graph, graph.model_dump_json().encode("utf-8"))
+        cache.set(key, cached)
+    graph, graph_json = cached
+    # 캐시 항목은 공유되므로 호출자에게는 사본을 반환 (JSON 바이트는 불변)
+    return graph.model_copy(deep=True), graph_json
+
+
+def get_growth_graph_stats() -> dict:
+    """성장 그래프 캐시 지표를 반환합니다."""
+    return _get_graph_cache().stats()
+
+
 def generate_period_analyses(
     plant_name: str,
     periods: List[int],
@@ -329,58 +386,112 @@ def generate_period_analyses(
     for i, period in enumerate(periods):
         if i >= len(good_growth) or i >= len(bad_growth):
             continue
-            
-        good_size = good_growth[i].size
-        bad_size = bad_growth[i].size
-        size_diff = good_size - bad_size
-        
-        # 기간별 단계 분류
-        if period == 0:
-            stage = "초기"
-            growth_rate_desc = "적응"
-        elif period <= 3:
-            stage = "초기 성장"
-            growth_rate_desc = "활발한 성장"
-        elif period <= 6:
-            stage = "중기 성장"
-            growth_rate_desc = "안정적 성장"
-        else:
-            stage = "후기 성장"
-            growth_rate_desc = "성숙 단계"
-        
-        # 좋은 조건 분석
-        good_analysis = generate_good_condition_analysis(
-            plant_name, period, unit_label, stage, good_size, size_diff
-        )
-        
-        # 나쁜 조건 설명
-        bad_description = generate_bad_condition_description(
-            plant_name, period, unit_label, stage, bad_size
-        )
-        
-        # 나쁜 조건 영향
-        bad_impact = generate_bad_condition_impact(
-            plant_name, period, unit_label, stage, bad_size, size_diff
-        )
-        
-        # LLM 기반 전체 설명 생성 (식물종 분석 + 그래프 데이터 종합)
-        llm_analysis = generate_period_llm_analysis(
-            plant_name, period, unit_label, stage, good_size, bad_size, 
-            size_diff, identification
-        )
-        
-        analyses.append(PeriodAnalysis(
-            period=period,
-            good_condition_analysis=good_analysis,
-            bad_condition_description=bad_description,
-            bad_condition_impact=bad_impact,
-            llm_comprehensive_analysis=llm_analysis,
-            layout_type="split"  # 좌우 분할 레이아웃
+        analyses.append(generate_period_analysis(
+            plant_name, period, unit_label, good_growth[i].size, bad_growth[i].size, identification
         ))
     
     return analyses
 
 
+def get_period_stage(period: int) -> str:
+    """기간별 성장 단계 분류"""
+    if period == 0:
+        return "초기"
+    elif period <= 3:
+        return "초기 성장"
+    elif period <= 6:
+        return "중기 성장"
+    return "후기 성장"
+
+
+def generate_period_analysis(
+    plant_name: str,
+    period: int,
+    unit_label: str,
+    good_size: float,
+    bad_size: float,
+    identification: Optional[PlantIdentification] = None
+) -> PeriodAnalysis:
+    """
+    한 기간의 상세 분석 텍스트를 생성합니다.
+    
+    Args:
+        plant_name: 식물 이름
+        period: 기간
+        unit_label: 기간 단위 라벨 ('주' 또는 '개월')
+        good_size: 좋은 조건 크기
+        bad_size: 나쁜 조건 크기
+        identification: 식물 종분석 데이터
+        
+    Returns:
+        PeriodAnalysis
+    """
+    size_diff = good_size - bad_size
+    stage = get_period_stage(period)
+    
+    # 좋은 조건 분석
+    good_analysis = generate_good_condition_analysis(
+        plant_name, period, unit_label, stage, good_size, size_diff
+    )
+    
+    # 나쁜 조건 설명
+    bad_description = generate_bad_condition_description(
+        plant_name, period, unit_label, stage, bad_size
+    )
+    
+    # 나쁜 조건 영향
+    bad_impact = generate_bad_condition_impact(
+        plant_name, period, unit_label, stage, bad_size, size_diff
+    )
+    
+    # LLM 기반 전체 설명 생성 (식물종 분석 + 그래프 데이터 종합)
+    llm_analysis = generate_period_llm_analysis(
+        plant_name, period, unit_label, stage, good_size, bad_size, 
+        size_diff, identification
+    )
+    
+    return PeriodAnalysis(
+        period=period,
+        good_condition_analysis=good_analysis,
+        bad_condition_description=bad_description,
+        bad_condition_impact=bad_impact,
+        llm_comprehensive_analysis=llm_analysis,
+        layout_type="split"  # 좌우 분할 레이아웃
+    )
+
+
+def get_period_text(
+    plant_name: str,
+    period: int,
+    period_unit: str = "month",
+    max_periods: int = 12,
+    confidence: Optional[float] = None,
+) -> Optional[PeriodAnalysis]:
+    """
+    그래프의 한 기간에 대한 분석 텍스트만 생성합니다 (include_period_text=false 응답의 후속 조회용).
+    크기는 같은 키의 캐시된 그래프에서 가져오므로 그래프 응답과 일치합니다.
+    
+    Args:
+        plant_name: 식물 이름
+        period: 기간 (그래프의 period 값)
+        period_unit: 기간 단위 ('week' 또는 'month')
+        max_periods: 그래프 최대 기간 수
+        confidence: 식별 신뢰도 (그래프 요청과 같은 값, None이면 종분석 데이터 없이)
+        
+    Returns:
+        PeriodAnalysis: 그래프에 해당 기간이 없으면 None
+    """
+    identification = None
+    if confidence is not None:
+        identification = PlantIdentification(plant_name=plant_name, confidence=confidence, common_names=[])
+    graph, _ = get_growth_graph(plant_name, period_unit, max_periods, identification, include_period_text=False)
+    for ref in graph.period_refs or []:
+        if ref.period == period:
+            unit_label = "주" if period_unit == "week" else "개월"
+            return generate_period_analysis(plant_name, period, unit_label, ref.good_size, ref.bad_size, identification)
+    return None
+
+
 def generate_good_condition_analysis(
     plant_name: str,
     period: int,
@@ -642,7 +753,8 @@ def generate_comprehensive_monthly_analysis_template(
 def generate_monthly_data_analysis(
     plant_name: str,
     max_months: int = 12,
-    data_id: Optional[str] = None
+    data_id: Optional[str] = None,
+    include_period_text: bool = True
 ) -> Dict[str, Any]:
     """
     저장된 식물 데이터를 기반으로 월별 데이터 분석을 생성합니다.
@@ -652,6 +764,7 @@ def generate_monthly_data_analysis(
         plant_name: 식물 이름
         max_months: 최대 월 수 (기본값: 12)
         data_id: 저장된 데이터 ID (선택사항)
+        include_period_text: False면 그래프에 기간별 분석 텍스트 대신 숫자 참조만 포함
         
     Returns:
         월별 데이터 분석 결과 (dict)
@@ -680,12 +793,13 @@ def generate_monthly_data_analysis(
             common_names=[]
         )
     
-    # 성장 그래프 생성 (저장된 데이터 기반)
-    growth_graph = generate_growth_graph(
+    # 성장 그래프 생성 (저장된 데이터 기반, 캐시)
+    growth_graph, growth_graph_json = get_growth_graph(
         plant_name=identification.plant_name,
         period_unit="month",
         max_periods=max_months,
-        identification=identification
+        identification=identification,
+        include_period_text=include_period_text
     )
     
     # 월별 데이터 행 생성
@@ -755,6 +869,7 @@ def generate_monthly_data_analysis(
     return {
         "identification": identification,
         "growth_graph": growth_graph,  # 차트 데이터 포함
+        "growth_graph_json": growth_graph_json,
         "monthly_data": monthly_rows,
         "comprehensive_analysis": comprehensive_analysis
     }
@@ -0,0 +1,99 @@
+"""
+성장 예측 그래프 곡선 계산
+
+모든 기간 × 모든 시나리오(좋은/나쁜 생장 및 추가 배수)를 NumPy 브로드캐스트 한 번으로 계산합니다.
+pydantic 객체(GrowthGraphPoint)는 응답 직전에만 만듭니다.
+"""
+from __future__ import annotations
+
+from typing import List, Sequence
+
+import numpy as np
+from pydantic import TypeAdapter
+
+from app.models.schemas import GrowthGraphPoint
+
+# 시나리오별 성장률 배수 (좋은 생장: 30% 빠름, 나쁜 생장: 30% 느림)
+GOOD_GROWTH_MULTIPLIER = 1.3
+BAD_GROWTH_MULTIPLIER = 0.7
+
+_points_adapter = TypeAdapter(List[GrowthGraphPoint])
+
+
+def growth_periods(period_unit: str, max_periods: int) -> List[int]:
+    """
+    그래프 데이터 포인트의 기간 목록을 반환합니다.
+
+    Args:
+        period_unit: 기간 단위 ('week' 또는 'month')
+        max_periods: 최대 기간 수
+
+    Returns:
+        List[int]: 기간 목록 (week는 최대 12개 간격 + 마지막 기간)
+    """
+    if period_unit == "week":
+        periods = list(range(0, max_periods + 1, max(1, max_periods // 12)))  # 최대 12개 포인트
+        if periods[-1] != max_periods:
+            periods.append(max_periods)
+        return periods
+    return list(range(0, max_periods + 1))
+
+
+def compute_growth_curves(
+    seed,
+    initial_size,
+    max_size,
+    periods: Sequence[int],
+    period_unit: str,
+    max_periods: int,
+    multipliers: Sequence[float] = (GOOD_GROWTH_MULTIPLIER, BAD_GROWTH_MULTIPLIER),
+) -> np.ndarray:
+    """
+    로지스틱 성장 곡선을 시나리오와 기간 전체에 대해 한 번에 계산합니다.
+    seed/initial_size/max_size에 (식물 수, 1, 1) 모양 배열을 넘기면 여러 식물을 한 번에 계산합니다.
+
+    Args:
+        seed: 식물 이름 시드 (0-1)
+        initial_size: 초기 크기 (cm)
+        max_size: 최대 크기 (cm)
+        periods: 기간 목록
+        period_unit: 기간 단위 ('week' 또는 'month')
+        max_periods: 최대 기간 수 (week 정규화 기준)
+        multipliers: 시나리오별 성장률 배수
+
+    Returns:
+        np.ndarray: (시나리오 수, 기간 수) 크기 배열 (반올림 전)
+    """
+    m = np.asarray(multipliers, dtype=np.float64)[:, None]      # (S, 1)
+    p = np.asarray(periods, dtype=np.float64)[None, :]          # (1, P)
+    seed = np.asarray(seed, dtype=np.float64)
+    initial_size = np.asarray(initial_size, dtype=np.float64)
+    max_size = np.asarray(max_size, dtype=np.float64)
+
+    if period_unit == "week":
+        k = (0.15 + 0.1 * seed) * m          # 주별 성장률
+        x0 = (8.0 - 4.0 * seed) * m          # 전환점 (주)
+        normalized = p / max(max_periods, 1) * 24  # 24주 기준 정규화
+    else:  # month
+        k = (0.35 + 0.2 * seed) * m          # 월별 성장률
+        x0 = (3.0 - 1.5 * seed) * m          # 전환점 (월)
+        normalized = p
+
+    # 로지스틱 함수로 성장 지수 계산 (0-1) → 초기 크기에서 최대 크기로 변환
+    growth_index = 1.0 / (1.0 + np.exp(-k * (normalized - x0)))
+    sizes = initial_size + (max_size - initial_size) * growth_index
+    # 작은 변동 추가 (자연스러운 성장 곡선)
+    sizes = sizes + (seed * 0.1 - 0.05) * sizes
+    # 최소 초기 크기의 80% 이상, 최대 크기의 110% 이하로 제한
+    return np.clip(sizes, initial_size * 0.8, max_size * 1.1)
+
+
+def to_graph_points(periods: Sequence[int], sizes: np.ndarray) -> List[GrowthGraphPoint]:
+    """
+    곡선 하나를 응답용 GrowthGraphPoint 목록으로 변환합니다 (크기는 소수 첫째 자리 반올림).
+    포인트마다 생성자를 부르지 않고 목록 전체를 한 번에 검증합니다.
+    """
+    return _points_adapter.validate_python([
+        {"period": period, "size": round(size, 1)}
+        for period, size in zip(periods, np.asarray(sizes).tolist())
+    ])
@@ -0,0 +1,138 @@
+"""
+성장 기록 일괄 수집
+
+기기에서 몇 주치 측정값을 한 번에 보낼 때 사용합니다.
+- 본문: JSON 배열 또는 NDJSON (한 줄에 기록 하나)
+- 기록마다 검증하고, 통과한 기록만 저장소 트랜잭션 한 번으로 저장
+- 거부된 기록은 위치(index)와 사유를 반환
+"""
+from __future__ import annotations
+
+import json
+import math
+import time
+from datetime import date as date_type
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.services.db_utils import save_growth_logs
+
+GrowthRecord = Tuple[str, str, float]
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+def parse_growth_payload(body: bytes, content_type: Optional[str] = None) -> List[Any]:
+    """
+    요청 본문을 기록 목록으로 변환합니다.
+    NDJSON의 잘못된 줄은 목록에 ValueError로 남겨 해당 위치만 거부되도록 합니다.
+
+    Args:
+        body: 요청 본문
+        content_type: Content-Type 헤더 (NDJSON 여부 판단, 없으면 본문 모양으로 판단)
+
+    Returns:
+        List[Any]: 기록(dict) 또는 파싱 오류(ValueError) 목록
+
+    Raises:
+        ValueError: JSON 본문이 배열이 아닌 경우
+    """
+    text = body.decode("utf-8-sig")
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    is_ndjson = media_type in NDJSON_CONTENT_TYPES or (
+        media_type != "application/json" and not text.lstrip().startswith("[")
+    )
+
+    if not is_ndjson:
+        items = json.loads(text)
+        if not isinstance(items, list):
+            raise ValueError("JSON 본문은 기록 배열이어야 합니다.")
+        return items
+
+    items: List[Any] = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            items.append(json.loads(line))
+        except ValueError as e:
+            items.append(ValueError(f"{line_no}번째 줄 JSON 오류: {e}"))
+    return items
+
+
+def validate_growth_record(item: Any) -> GrowthRecord:
+    """
+    기록 하나를 검증합니다.
+
+    Args:
+        item: {"plant_id": str, "date": "YYYY-MM-DD", "height": 숫자(cm, 0 이상)}
+
+    Returns:
+        GrowthRecord: (plant_id, date, height)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우 (메시지에 사유)
+    """
+    if isinstance(item, ValueError):
+        raise item
+    if not isinstance(item, dict):
+        raise ValueError("기록은 객체여야 합니다.")
+
+    plant_id = item.get("plant_id")
+    if not isinstance(plant_id, str) or not plant_id.strip():
+        raise ValueError("plant_id가 비어 있습니다.")
+
+    date = item.get("date")
+    if not isinstance(date, str):
+        raise ValueError("date가 없습니다.")
+    try:
+        date = date_type.fromisoformat(date).isoformat()
+    except ValueError:
+        raise ValueError(f"date 형식 오류 (YYYY-MM-DD): {date}")
+
+    height = item.get("height")
+    if isinstance(height, bool) or not isinstance(height, (int, float)):
+        raise ValueError("height는 숫자여야 합니다.")
+    height = float(height)
+    if not math.isfinite(height) or height < 0:
+        raise ValueError(f"height 범위 오류: {height}")
+
+    return plant_id, date, height
+
+
+def ingest_growth_records(
+    items: Iterable[Any],
+    save_fn: Callable[[List[GrowthRecord]], int] = save_growth_logs,
+    max_errors: int = 1000,
+) -> Dict[str, Any]:
+    """
+    기록들을 검증하고 통과한 기록을 한 번에 저장합니다.
+
+    Args:
+        items: parse_growth_payload 결과
+        save_fn: 저장 함수 (기본값: db_utils.save_growth_logs, 트랜잭션 한 번)
+        max_errors: 응답에 담을 최대 거부 사유 수
+
+    Returns:
+        Dict[str, Any]: received, accepted, rejected, errors([{index, error}]), plants, elapsed_ms
+    """
+    start = time.perf_counter()
+    valid: List[GrowthRecord] = []
+    errors: List[Dict[str, Any]] = []
+    received = 0
+    for index, item in enumerate(items):
+        received += 1
+        try:
+            valid.append(validate_growth_record(item))
+        except ValueError as e:
+            if len(errors) < max_errors:
+                errors.append({"index": index, "error": str(e)})
+
+    accepted = save_fn(valid) if valid else 0
+    return {
+        "received": received,
+        "accepted": accepted,
+        "rejected": received - len(valid),
+        "errors": errors,
+        "plants": len({plant_id for plant_id, _, _ in valid}),
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+    }
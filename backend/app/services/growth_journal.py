@@ -0,0 +1,388 @@
+"""
+성장 기록 추가 전용 저널 (JSON 파일 저장소용)
+
+- 기록 하나 = 저널 파일의 JSON 한 줄 {"plant_id", "date", "height"} → 저장은 상수 시간 추가
+- 그룹 커밋: 동시에 들어온 쓰기들을 fsync 한 번으로 묶어 디스크에 반영
+- 백그라운드 압축: 저널이 일정 줄 수를 넘거나 주기마다 정렬된 스냅샷(growth_history.json)으로 합침
+- 복구: 시작 시 스냅샷 → 회전된 저널 → 현재 저널 순으로 다시 적용 (마지막 줄이 잘려 있으면 무시)
+- 날짜를 해석할 수 없는 예전 스냅샷 기록은 시계열에는 넣지 않되, 압축 시 스냅샷에 그대로 다시 씀 (삭제하지 않음)
+
+스냅샷은 기존 growth_history.json과 같은 형식 ({plant_id: [{date, height}, ...]})입니다.
+메모리 상태는 식물별 열 기반 시계열(growth_series.GrowthSeries)입니다.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from app.services.growth_series import GrowthSeries, date_to_ordinal, ordinal_to_date
+
+
+class GrowthJournal:
+    """성장 기록 저널 + 스냅샷 + 메모리 상태"""
+
+    def __init__(
+        self,
+        snapshot_path: Union[str, Path],
+        journal_path: Optional[Union[str, Path]] = None,
+        sync: bool = True,
+        compact_threshold: int = 10_000,
+        compact_interval: float = 300.0,
+    ):
+        """
+        Args:
+            snapshot_path: 스냅샷 JSON 파일 (기존 growth_history.json)
+            journal_path: 저널 파일 (None이면 스냅샷 옆 <이름>.journal)
+            sync: True면 저장이 fsync까지 끝난 뒤 반환 (그룹 커밋으로 묶임)
+            compact_threshold: 저널 줄 수가 이 값을 넘으면 압축
+            compact_interval: 저널에 기록이 있으면 이 주기(초)마다 압축 (0이면 주기 압축 안 함)
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = Path(journal_path) if journal_path else _default_journal_path(self.snapshot_path)
+        self.rotated_path = self.journal_path.with_name(self.journal_path.name + ".1")
+        self.sync = sync
+        self.compact_threshold = max(1, compact_threshold)
+        self.compact_interval = compact_interval
+
+        # 메모리 상태: {plant_id: GrowthSeries}
+        self._data: Dict[str, GrowthSeries] = {}
+        # 해석할 수 없는 예전 스냅샷 기록 (압축 시 원본 그대로 보존): {plant_id: [record, ...]}
+        self._legacy: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+        self._journal_lines = 0
+
+        # 그룹 커밋 상태
+        self._sync_cond = threading.Condition(threading.Lock())
+        self._written_seq = 0
+        self._synced_seq = 0
+        self._syncing = False
+
+        self._compact_lock = threading.Lock()
+        self._compact_event = threading.Event()
+        self._closed = False
+
+        self._stats = {"appends": 0, "records": 0, "fsyncs": 0, "compactions": 0, "recovered": 0}
+
+        self._recover()
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._compactor = threading.Thread(target=self._compact_loop, name="growth-journal-compactor", daemon=True)
+        self._compactor.start()
+
+    # ---- 복구 ----
+
+    def _recover(self):
+        """스냅샷 → 회전된 저널 → 현재 저널 순으로 메모리 상태를 복원합니다."""
+        if not _load_snapshot(self.snapshot_path, self._data, self._legacy):
+            # 읽을 수 없는 스냅샷은 압축이 덮어쓰기 전에 사본을 남김
+            backup = self.snapshot_path.with_name(f"{self.snapshot_path.name}.corrupt-{int(time.time())}")
+            shutil.copy2(self.snapshot_path, backup)
+            print(f"[성장 저널] 읽을 수 없는 스냅샷을 {backup.name}으로 백업")
+        # 압축 도중 종료됐다면 회전된 저널이 남아 있음 (다시 적용해도 결과는 같음)
+        replayed = _replay_journal(self.rotated_path, self._data)
+        lines = _replay_journal(self.journal_path, self._data)
+        _truncate_partial_tail(self.journal_path)
+        self._journal_lines = lines
+        self._stats["recovered"] = replayed + lines
+        if replayed or lines:
+            print(f"[성장 저널] 복구 완료: 저널 {replayed + lines}건 적용")
+
+    # ---- 쓰기 ----
+
+    def append(self, records: Iterable[Tuple[str, str, float]]) -> int:
+        """
+        기록들을 저널에 추가하고 메모리 상태에 반영합니다 (같은 날짜는 덮어씀).
+
+        Args:
+            records: (plant_id, date, height) 목록
+
+        Returns:
+            int: 추가한 기록 수
+
+        Raises:
+            ValueError: date가 YYYY-MM-DD 형식이 아닌 경우 (아무 기록도 저장하지 않음)
+        """
+        records = [(plant_id, date, float(height)) for plant_id, date, height in records]
+        ordinals = [date_to_ordinal(date) for _, date, _ in records]
+        if not records:
+            return 0
+        payload = "".join(
+            json.dumps({"plant_id": plant_id, "date": date, "height": height}, ensure_ascii=False) + "\n"
+            for plant_id, date, height in records
+        )
+        with self._lock:
+            self._journal.write(payload)
+            for (plant_id, _, height), day in zip(records, ordinals):
+                _series_for(self._data, plant_id).upsert(day, height)
+            self._journal_lines += len(records)
+            self._stats["appends"] += 1
+            self._stats["records"] += len(records)
+            with self._sync_cond:
+                self._written_seq += 1
+                seq = self._written_seq
+            needs_compaction = self._journal_lines >= self.compact_threshold
+
+        if self.sync:
+            self._wait_durable(seq)
+        if needs_compaction:
+            self._compact_event.set()
+        return len(records)
+
+    def _wait_durable(self, seq: int):
+        """그룹 커밋: fsync 중이 아니면 직접 fsync하고, 중이면 끝나기를 기다렸다 필요 시 다시 fsync."""
+        with self._sync_cond:
+            while self._synced_seq < seq:
+                if self._syncing:
+                    self._sync_cond.wait()
+                    continue
+                self._syncing = True
+                target = self._written_seq
+                self._sync_cond.release()
+                synced = False
+                try:
+                    # 파일 교체(_file_swap)는 _syncing이 풀릴 때까지 기다리므로 fd가 유효함
+                    with self._lock:
+                        self._journal.flush()
+                        fd = self._journal.fileno()
+                    os.fsync(fd)
+                    synced = True
+                finally:
+                    self._sync_cond.acquire()
+                    self._syncing = False
+                    if synced:
+                        # 이 fsync가 target까지의 쓰기를 모두 디스크에 반영
+                        self._synced_seq = max(self._synced_seq, target)
+                        self._stats["fsyncs"] += 1
+                    self._sync_cond.notify_all()
+
+    @contextmanager
+    def _file_swap(self):
+        """
+        저널 파일을 닫거나 교체하는 동안 그룹 커밋 fsync가 끼어들지 않도록 막습니다.
+        교체 전에 기존 파일을 fsync하므로 그때까지의 쓰기는 모두 디스크에 반영된 것으로 처리합니다.
+        """
+        with self._sync_cond:
+            while self._syncing:
+                self._sync_cond.wait()
+            self._syncing = True
+        try:
+            with self._lock:
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+                with self._sync_cond:
+                    self._synced_seq = self._written_seq
+                yield
+        finally:
+            with self._sync_cond:
+                self._syncing = False
+                self._sync_cond.notify_all()
+
+    # ---- 읽기 ----
+
+    def series(self, plant_id: str) -> GrowthSeries:
+        """식물의 시계열 (정렬된 상태, 범위 조회/열 내보내기는 복사 없는 뷰)"""
+        with self._lock:
+            series = self._data.get(plant_id)
+        return series if series is not None else GrowthSeries(capacity=1)
+
+    def history(self, plant_id: str) -> List[Dict[str, Any]]:
+        return self.series(plant_id).to_records()
+
+    def plant_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._data.keys())
+
+    def count(self) -> int:
+        with self._lock:
+            return sum(len(series) for series in self._data.values())
+
+    # ---- 압축 ----
+
+    def _compact_loop(self):
+        while not self._closed:
+            triggered = self._compact_event.wait(self.compact_interval or None)
+            self._compact_event.clear()
+            if self._closed:
+                return
+            if triggered or self._journal_lines:
+                try:
+                    self.compact()
+                except Exception as e:
+                    print(f"[성장 저널] 압축 실패: {e}")
+
+    def compact(self):
+        """
+        저널을 정렬된 스냅샷으로 합칩니다.
+        저널을 회전(rename)한 뒤 잠금 밖에서 스냅샷을 쓰므로 그동안의 쓰기는 새 저널로 갑니다.
+        """
+        with self._compact_lock:
+            start = time.perf_counter()
+            if not self._journal_lines:
+                return
+            with self._file_swap():
+                self._journal.close()
+                os.replace(self.journal_path, self.rotated_path)
+                self._journal = open(self.journal_path, "a", encoding="utf-8")
+                lines, self._journal_lines = self._journal_lines, 0
+                # 열 뷰만 잡아 두면 됨 (이후 쓰기는 copy-on-write라 뷰가 바뀌지 않음)
+                snapshot = {plant_id: series.columns() for plant_id, series in self._data.items()}
+
+            data = {
+                plant_id: [
+                    {"date": ordinal_to_date(day), "height": height}
+                    for day, height in zip(days.tolist(), heights.tolist())
+                ]
+                for plant_id, (days, heights) in snapshot.items()
+            }
+            for plant_id, records in self._legacy.items():
+                data.setdefault(plant_id, []).extend(records)
+            tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            os.remove(self.rotated_path)
+            self._stats["compactions"] += 1
+            print(f"[성장 저널] 압축 완료: 저널 {lines}줄 → 스냅샷 ({time.perf_counter() - start:.2f}초)")
+
+    def clear(self):
+        """모든 기록을 삭제합니다 (테스트용)."""
+        with self._compact_lock, self._file_swap():
+            self._data = {}
+            self._legacy = {}
+            self._journal.close()
+            for path in (self.journal_path, self.rotated_path, self.snapshot_path):
+                if path.exists():
+                    os.remove(path)
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+            self._journal_lines = 0
+
+    def close(self):
+        """압축 스레드를 멈추고 남은 저널을 디스크에 반영합니다."""
+        self._closed = True
+        self._compact_event.set()
+        with self._compact_lock, self._file_swap():
+            self._journal.close()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats["journal_lines"] = self._journal_lines
+        stats["legacy_records"] = sum(len(records) for records in self._legacy.values())
+        stats["sync"] = self.sync
+        return stats
+
+
+def _default_journal_path(snapshot_path: Path) -> Path:
+    return snapshot_path.with_name(snapshot_path.name + ".journal")
+
+
+def _series_for(data: Dict[str, GrowthSeries], plant_id: str) -> GrowthSeries:
+    series = data.get(plant_id)
+    if series is None:
+        series = data[plant_id] = GrowthSeries()
+    return series
+
+
+def _load_snapshot(
+    path: Path,
+    data: Dict[str, GrowthSeries],
+    legacy: Optional[Dict[str, List[Any]]] = None,
+) -> bool:
+    """
+    스냅샷을 data에 적용합니다.
+
+    Args:
+        path: 스냅샷 파일
+        data: 채울 메모리 상태
+        legacy: 주어지면 날짜/키를 해석할 수 없는 기록을 원본 그대로 모음 (압축 시 보존용)
+
+    Returns:
+        bool: 파일이 없거나 정상적으로 읽었으면 True, 읽을 수 없으면 False
+    """
+    if not path.exists():
+        return True
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except Exception as e:
+        print(f"[성장 저널] 스냅샷 로드 실패: {e}")
+        return False
+    skipped = 0
+    for plant_id, records in snapshot.items():
+        series = _series_for(data, plant_id)
+        days, heights = [], []
+        for record in records:
+            try:
+                day, height = date_to_ordinal(record["date"]), float(record["height"])
+            except (ValueError, KeyError, TypeError):
+                # 날짜 형식이 YYYY-MM-DD가 아닌 예전 기록 등
+                skipped += 1
+                if legacy is not None:
+                    legacy.setdefault(plant_id, []).append(record)
+                continue
+            days.append(day)
+            heights.append(height)
+        # 스냅샷은 정렬되어 있으므로 보통 한 번에 추가됨
+        series.upsert_many(days, heights)
+    if skipped:
+        kept = " (압축 시 원본 그대로 보존)" if legacy is not None else ""
+        print(f"[성장 저널] 스냅샷에서 형식이 잘못된 기록 {skipped}건 무시{kept}")
+    return True
+
+
+def _replay_journal(path: Path, data: Dict[str, GrowthSeries]) -> int:
+    if not path.exists():
+        return 0
+    count = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+                _series_for(data, event["plant_id"]).upsert(date_to_ordinal(event["date"]), float(event["height"]))
+                count += 1
+            except (ValueError, KeyError, TypeError):
+                # 쓰는 도중 종료되어 잘린 마지막 줄 등은 무시
+                print(f"[성장 저널] 손상된 줄 무시: {path.name}")
+    return count
+
+
+def _truncate_partial_tail(path: Path):
+    """마지막 줄이 개행 없이 잘려 있으면 잘라내어, 이후 추가되는 줄과 붙지 않도록 합니다."""
+    if not path.exists():
+        return
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+def load_growth_state(
+    snapshot_path: Union[str, Path],
+    journal_path: Optional[Union[str, Path]] = None,
+    legacy: Optional[Dict[str, List[Any]]] = None,
+) -> Dict[str, GrowthSeries]:
+    """
+    저널을 열지 않고 스냅샷 + 저널을 읽어 현재 상태를 반환합니다 (마이그레이션 등 읽기 전용).
+
+    Args:
+        snapshot_path: 스냅샷 파일
+        journal_path: 저널 파일 (None이면 스냅샷 경로 + .journal)
+        legacy: 주어지면 스냅샷에서 해석할 수 없는 기록을 원본 그대로 모음
+
+    Returns:
+        Dict[str, GrowthSeries]: {plant_id: 시계열}
+    """
+    snapshot_path = Path(snapshot_path)
+    journal_path = Path(journal_path) if journal_path else _default_journal_path(snapshot_path)
+    data: Dict[str, GrowthSeries] = {}
+    _load_snapshot(snapshot_path, data, legacy)
+    _replay_journal(journal_path.with_name(journal_path.name + ".1"), data)
+    _replay_journal(journal_path, data)
+    return data
@@ -0,0 +1,204 @@
+"""
+식물별 성장 기록 열(column) 기반 시계열
+
+측정값 하나를 dict 대신 두 개의 병렬 NumPy 배열(날짜 ordinal int64, 높이 float64)로 보관합니다.
+- 측정값당 16바이트 (dict 하나는 수백 바이트)
+- 항상 날짜순 정렬 유지 (이분 탐색 삽입) → 읽을 때 정렬하지 않음
+- 날짜 범위 조회/다운샘플링은 벡터 연산, 범위 조회 결과는 복사 없는 뷰
+
+뷰 안전성: 끝에 추가하는 경우(가장 흔함)는 여유 용량에 쓰므로 기존 뷰가 보는 구간은 바뀌지 않고,
+중간 삽입/기존 날짜 갱신은 새 배열을 만들어 교체하므로(copy-on-write) 이미 내보낸 뷰는 그대로 유지됩니다.
+"""
+from __future__ import annotations
+
+import threading
+from datetime import date as date_type
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_INITIAL_CAPACITY = 8
+
+
+def date_to_ordinal(value: str) -> int:
+    """'YYYY-MM-DD' → 날짜 ordinal (형식이 잘못되면 ValueError)"""
+    return date_type.fromisoformat(value).toordinal()
+
+
+def ordinal_to_date(ordinal: int) -> str:
+    """날짜 ordinal → 'YYYY-MM-DD'"""
+    return date_type.fromordinal(int(ordinal)).isoformat()
+
+
+class GrowthSeries:
+    """날짜순으로 정렬된 (날짜 ordinal, 높이) 병렬 배열"""
+
+    __slots__ = ("_days", "_heights", "_size", "_lock")
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY):
+        self._days = np.empty(max(1, capacity), dtype=np.int64)
+        self._heights = np.empty(max(1, capacity), dtype=np.float64)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_columns(cls, days: np.ndarray, heights: np.ndarray, copy: bool = True) -> "GrowthSeries":
+        """
+        정렬된 열로 시계열을 만듭니다.
+
+        Args:
+            days: 날짜 ordinal (오름차순, 중복 없음)
+            heights: 높이
+            copy: False면 전달받은 배열을 그대로 사용 (읽기 전용 뷰를 감쌀 때)
+        """
+        series = cls.__new__(cls)
+        days = np.asarray(days, dtype=np.int64)
+        heights = np.asarray(heights, dtype=np.float64)
+        series._days = days.copy() if copy else days
+        series._heights = heights.copy() if copy else heights
+        series._size = len(days)
+        series._lock = threading.Lock()
+        return series
+
+    @classmethod
+    def from_records(cls, records: Iterable[Tuple[str, float]]) -> "GrowthSeries":
+        """(date 문자열, height) 목록으로 시계열을 만듭니다 (순서 무관, 같은 날짜는 나중 값)."""
+        series = cls()
+        for date, height in records:
+            series.upsert(date_to_ordinal(date), height)
+        return series
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """측정값이 차지하는 배열 메모리 (여유 용량 포함)"""
+        return self._days.nbytes + self._heights.nbytes
+
+    # ---- 쓰기 ----
+
+    def upsert(self, day: int, height: float):
+        """측정값 하나를 넣습니다. 같은 날짜가 있으면 높이를 바꿉니다."""
+        with self._lock:
+            size = self._size
+            days = self._days[:size]
+            if size and day > days[-1]:
+                self._append(day, height)
+                return
+            index = int(np.searchsorted(days, day))
+            if index < size and days[index] == day:
+                # copy-on-write: 내보낸 뷰가 바뀌지 않도록 새 배열에서 갱신
+                heights = self._heights.copy()
+                heights[index] = height
+                self._heights = heights
+                return
+            if index == size:
+                self._append(day, height)
+                return
+            capacity = max(len(self._days), size + 1)
+            new_days = np.empty(capacity, dtype=np.int64)
+            new_heights = np.empty(capacity, dtype=np.float64)
+            new_days[:index] = days[:index]
+            new_days[index] = day
+            new_days[index + 1:size + 1] = days[index:]
+            new_heights[:index] = self._heights[:index]
+            new_heights[index] = height
+            new_heights[index + 1:size + 1] = self._heights[index:size]
+            self._days, self._heights = new_days, new_heights
+            self._size = size + 1
+
+    def upsert_many(self, days: Iterable[int], heights: Iterable[float]):
+        """여러 측정값을 넣습니다 (모두 마지막 날짜 이후면 한 번에 추가)."""
+        days = np.fromiter(days, dtype=np.int64)
+        heights = np.fromiter(heights, dtype=np.float64, count=len(days))
+        with self._lock:
+            last = self._days[self._size - 1] if self._size else None
+            fast = len(days) and (last is None or days[0] > last) and bool(np.all(np.diff(days) > 0))
+            if fast:
+                self._reserve(self._size + len(days))
+                self._days[self._size:self._size + len(days)] = days
+                self._heights[self._size:self._size + len(days)] = heights
+                self._size += len(days)
+                return
+        for day, height in zip(days.tolist(), heights.tolist()):
+            self.upsert(day, height)
+
+    def _append(self, day: int, height: float):
+        self._reserve(self._size + 1)
+        self._days[self._size] = day
+        self._heights[self._size] = height
+        self._size += 1
+
+    def _reserve(self, needed: int):
+        capacity = len(self._days)
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2)
+        new_days = np.empty(capacity, dtype=np.int64)
+        new_heights = np.empty(capacity, dtype=np.float64)
+        new_days[:self._size] = self._days[:self._size]
+        new_heights[:self._size] = self._heights[:self._size]
+        self._days, self._heights = new_days, new_heights
+
+    # ---- 읽기 ----
+
+    def columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(날짜 ordinal, 높이) 읽기 전용 뷰 (복사 없음)"""
+        with self._lock:
+            days, heights = self._days[:self._size], self._heights[:self._size]
+        days.flags.writeable = False
+        heights.flags.writeable = False
+        return days, heights
+
+    def range(self, start: Optional[int] = None, end: Optional[int] = None) -> "GrowthSeries":
+        """
+        날짜 범위 [start, end]의 측정값을 복사 없는 뷰로 반환합니다.
+
+        Args:
+            start: 시작 날짜 ordinal (포함, None이면 처음부터)
+            end: 끝 날짜 ordinal (포함, None이면 끝까지)
+        """
+        days, heights = self.columns()
+        lo = 0 if start is None else int(np.searchsorted(days, start, side="left"))
+        hi = len(days) if end is None else int(np.searchsorted(days, end, side="right"))
+        return GrowthSeries.from_columns(days[lo:hi], heights[lo:hi], copy=False)
+
+    def downsample(self, bucket_days: int, how: str = "mean") -> "GrowthSeries":
+        """
+        bucket_days일 단위 구간으로 묶습니다 (구간 날짜는 구간의 마지막 측정일).
+
+        Args:
+            bucket_days: 구간 길이 (일)
+            how: "mean" (구간 평균) 또는 "last" (구간 마지막 값)
+        """
+        days, heights = self.columns()
+        if bucket_days <= 1 or len(days) == 0:
+            return GrowthSeries.from_columns(days, heights, copy=False)
+        buckets = days // bucket_days
+        # 정렬되어 있으므로 구간 경계 = 구간 번호가 바뀌는 위치
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(days)] - 1
+        if how == "last":
+            values = heights[ends]
+        elif how == "mean":
+            values = np.add.reduceat(heights, starts) / (ends - starts + 1)
+        else:
+            raise ValueError(f"지원하지 않는 다운샘플링 방식: {how}")
+        return GrowthSeries.from_columns(days[ends], values, copy=False)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """API 응답용 [{"date": "YYYY-MM-DD", "height": float}, ...] (날짜순)"""
+        days, heights = self.columns()
+        return [
+            {"date": ordinal_to_date(day), "height": height}
+            for day, height in zip(days.tolist(), heights.tolist())
+        ]
+
+    def to_columns_json(self) -> Dict[str, Any]:
+        """API 응답용 열 형식 {"dates": [...], "heights": [...]}"""
+        days, heights = self.columns()
+        return {
+            "dates": [ordinal_to_date(day) for day in days.tolist()],
+            "heights": heights.tolist(),
+        }
@@ -1,17 +1,28 @@
-from transformers import AutoTokenizer, AutoModelForCausalLM, pipeline
-import torch
 import json
 import re
-from typing import Optional
-from openai import OpenAI
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
 from app.config import settings
 from app.models.schemas import CareGuide
+from app.services.caching import LRUTTLCache, SingleFlight, SqliteKVStore
 
 # 전역 변수로 모델 캐싱
 _text_model = None
 _tokenizer = None
 _openai_client = None
 
+# 관리 가이드 프롬프트 버전 (프롬프트/출력 형식을 바꾸면 올려서 기존 저장 가이드와 분리)
+CARE_GUIDE_PROMPT_VERSION = "v1"
+
+_guide_memory = None
+_guide_store = None
+_guide_store_lock = threading.Lock()
+_guide_flight = SingleFlight()
+_guide_stats = {"memory_hits": 0, "disk_hits": 0, "generated": 0, "failures": 0}
+
 
 def load_text_generator():
     """
@@ -35,6 +46,7 @@ def load_openai_client():
                 # httpx 클라이언트를 직접 생성하여 proxies 문제 해결
                 import httpx
                 import os
+                from openai import OpenAI  # 클라이언트가 처음 필요할 때만 import
 
                 # 환경 변수에서 proxies 완전히 제거
                 proxy_env_vars = ['HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy', 'ALL_PROXY', 'all_proxy']
@@ -144,45 +156,165 @@ def generate_care_guide_with_gpt(plant_name: str) -> Optional[dict]:
         return None
 
 
-def generate_care_guide(plant_name: str) -> CareGuide:
+def normalize_plant_name(plant_name: str) -> str:
+    """가이드 저장 키용 식물 이름 정규화 (유니코드 NFKC, 공백 정리, 소문자)"""
+    name = unicodedata.normalize("NFKC", plant_name or "")
+    return " ".join(name.split()).lower()
+
+
+def _care_guide_key(plant_name: str) -> str:
+    return f"{CARE_GUIDE_PROMPT_VERSION}:{normalize_plant_name(plant_name)}"
+
+
+def _get_guide_caches():
+    """관리 가이드 캐시(메모리 LRU + SQLite 저장소)를 반환합니다 (처음 한 번만 생성)"""
+    global _guide_memory, _guide_store
+
+    if _guide_memory is None:
+        with _guide_store_lock:
+            if _guide_memory is None:
+                path = settings.care_guide_store_path or str(Path(settings.cache_dir) / "care_guides.sqlite3")
+                try:
+                    _guide_store = SqliteKVStore(path, table="care_guides", ttl=settings.care_guide_ttl)
+                except Exception as e:
+                    print(f"[가이드 저장소] 초기화 실패 (메모리만 사용): {e}")
+                    _guide_store = None
+                _guide_memory = LRUTTLCache(maxsize=settings.care_guide_cache_size, ttl=settings.care_guide_ttl)
+    return _guide_memory, _guide_store
+
+
+def _lookup_care_guide(key: str) -> Optional[CareGuide]:
+    """메모리 → 디스크 순으로 저장된 가이드를 찾습니다."""
+    memory, store = _get_guide_caches()
+    guide = memory.get(key)
+    if guide is not None:
+        _guide_stats["memory_hits"] += 1
+        return guide.model_copy(deep=True)
+
+    if store is not None:
+        try:
+            data = store.get(key)
+        except Exception as e:
+            print(f"[가이드 저장소] 조회 실패: {e}")
+            data = None
+        if data is not None:
+            _guide_stats["disk_hits"] += 1
+            guide = CareGuide(**data)
+            memory.set(key, guide)
+            return guide.model_copy(deep=True)
+    return None
+
+
+def _generate_and_store_care_guide(plant_name: str, key: str) -> Optional[CareGuide]:
+    """GPT로 가이드를 생성해 저장합니다. 실패하면 None (저장하지 않음)."""
+    korean_guide = generate_care_guide_with_gpt(plant_name)
+    if not korean_guide:
+        _guide_stats["failures"] += 1
+        return None
+
+    print(f"[GPT 직접 생성 성공] {plant_name}: {korean_guide}")
+    try:
+        care_guide = CareGuide(
+            watering=korean_guide.get("watering", ""),
+            sunlight=korean_guide.get("sunlight", ""),
+            temperature=korean_guide.get("temperature", ""),
+            humidity=korean_guide.get("humidity", ""),
+            fertilizer=korean_guide.get("fertilizer", ""),
+            soil=korean_guide.get("soil", ""),
+            tips=korean_guide.get("tips", [])
+        )
+    except Exception as e:
+        print(f"[GPT 직접 생성 CareGuide 변환 오류] {e}")
+        import traceback
+        traceback.print_exc()
+        _guide_stats["failures"] += 1
+        return None
+
+    _guide_stats["generated"] += 1
+    memory, store = _get_guide_caches()
+    memory.set(key, care_guide)
+    if store is not None:
+        try:
+            store.set(key, care_guide.model_dump())
+        except Exception as e:
+            print(f"[가이드 저장소] 저장 실패: {e}")
+    return care_guide
+
+
+def generate_care_guide(plant_name: str, force: bool = False) -> CareGuide:
     """
     GPT-4o-mini를 사용하여 식물 관리 가이드를 생성합니다.
+    가이드는 (정규화된 식물 이름 + 프롬프트 버전) 키로 저장되어 TTL 동안 재사용되며,
+    같은 식물에 대한 동시 요청은 한 번의 생성 결과를 함께 기다립니다.
 
     Args:
         plant_name: 식물 종명
+        force: True면 저장된 가이드를 무시하고 다시 생성
         
     Returns:
         CareGuide: 식물 관리 가이드
     """
+    key = _care_guide_key(plant_name)
+    if not force:
+        cached = _lookup_care_guide(key)
+        if cached is not None:
+            return cached
+
     print(f"[가이드 생성 시작] 식물명: {plant_name}")
 
-    # GPT-4o-mini로 직접 생성
-    korean_guide = generate_care_guide_with_gpt(plant_name)
+    def generate():
+        # 앞선 생성이 방금 끝났을 수 있으므로 한 번 더 확인
+        if not force:
+            cached = _lookup_care_guide(key)
+            if cached is not None:
+                return cached
+        return _generate_and_store_care_guide(plant_name, key)
 
-    if korean_guide:
-        print(f"[GPT 직접 생성 성공] {plant_name}: {korean_guide}")
-        try:
-            care_guide = CareGuide(
-                watering=korean_guide.get("watering", ""),
-                sunlight=korean_guide.get("sunlight", ""),
-                temperature=korean_guide.get("temperature", ""),
-                humidity=korean_guide.get("humidity", ""),
-                fertilizer=korean_guide.get("fertilizer", ""),
-                soil=korean_guide.get("soil", ""),
-                tips=korean_guide.get("tips", [])
-            )
-            print(f"[AI 가이드 생성 성공 (GPT 직접)] {plant_name}")
-            return care_guide
-        except Exception as e:
-            print(f"[GPT 직접 생성 CareGuide 변환 오류] {e}")
-            import traceback
-            traceback.print_exc()
+    care_guide = _guide_flight.do(key, generate)
+    if care_guide is not None:
+        print(f"[AI 가이드 생성 성공 (GPT 직접)] {plant_name}")
+        return care_guide.model_copy(deep=True)
 
-    # 최종 fallback: 기본 가이드 반환
+    # 최종 fallback: 기본 가이드 반환 (저장하지 않음)
     print(f"[경고] AI 생성 실패, 기본 가이드 사용: {plant_name}")
     return get_default_care_guide(plant_name)
 
 
+def pregenerate_care_guides(plant_names: Iterable[str], force: bool = False, max_workers: int = 4) -> Dict[str, str]:
+    """
+    여러 식물의 관리 가이드를 미리 생성해 저장합니다 (관리자용).
+
+    Args:
+        plant_names: 식물 이름 목록
+        force: True면 이미 저장된 가이드도 다시 생성
+        max_workers: 동시 생성 수
+
+    Returns:
+        Dict[str, str]: {식물 이름: "cached" | "generated" | "failed"}
+    """
+    names = [name for name in dict.fromkeys(plant_names) if name and name.strip()]
+
+    def run(name: str) -> str:
+        key = _care_guide_key(name)
+        if not force and _lookup_care_guide(key) is not None:
+            return "cached"
+        guide = _guide_flight.do(key, lambda: _generate_and_store_care_guide(name, key))
+        return "generated" if guide is not None else "failed"
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="care-guide") as pool:
+        return dict(zip(names, pool.map(run, names)))
+
+
+def get_care_guide_stats() -> dict:
+    """관리 가이드 캐시 지표를 반환합니다."""
+    stats = dict(_guide_stats)
+    stats["prompt_version"] = CARE_GUIDE_PROMPT_VERSION
+    stats["single_flight"] = _guide_flight.stats()
+    if _guide_memory is not None:
+        stats["memory"] = _guide_memory.stats()
+    return stats
+
+
 def parse_care_guide(text: str, plant_name: str) -> CareGuide:
     """생성된 텍스트를 CareGuide 객체로 파싱합니다."""
     
@@ -0,0 +1,94 @@
+"""
+무거운 의존성 지연 import
+
+torch/transformers/diffusers/ultralytics/cv2 등은 import만으로 수 초가 걸립니다.
+모듈 최상단에서 `torch = lazy_import("torch")`로 선언하면 실제 속성에 처음 접근하는 코드 경로에서만
+import되므로, 라우터 import(서버 시작)와 /health 응답이 이 모듈들을 기다리지 않습니다.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+import time
+import types
+from typing import Any, Dict, Optional
+
+# 서버 시작 시 import되면 안 되는 무거운 모듈 (벤치마크/헬스 지표에서 확인)
+HEAVY_MODULES = ("torch", "transformers", "diffusers", "ultralytics", "cv2", "scipy", "openai")
+
+_import_lock = threading.Lock()
+# 지연 import된 모듈별 실제 import 소요 시간 (ms)
+_import_times: Dict[str, float] = {}
+
+
+class LazyModule(types.ModuleType):
+    """첫 속성 접근 시 실제 모듈을 import하는 대리 객체"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_name"] = name
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with _import_lock:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    name = self.__dict__["_lazy_name"]
+                    start = time.perf_counter()
+                    module = importlib.import_module(name)
+                    _import_times[name] = round((time.perf_counter() - start) * 1000, 1)
+                    print(f"[지연 import] {name}: {_import_times[name]}ms")
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__dict__['_lazy_name']}' ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    모듈을 지연 import합니다 (이미 import되어 있으면 그 모듈을 그대로 반환).
+
+    Args:
+        name: 모듈 이름 (예: "torch", "cv2", "transformers")
+
+    Returns:
+        ModuleType: 실제 모듈 또는 LazyModule 대리 객체
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def is_loaded(module: types.ModuleType) -> bool:
+    """lazy_import 결과가 실제로 import되었는지 여부"""
+    if isinstance(module, LazyModule):
+        return module.__dict__["_lazy_module"] is not None
+    return True
+
+
+def get_lazy_import_stats(modules: Optional[tuple] = HEAVY_MODULES) -> dict:
+    """
+    지연 import 현황을 반환합니다.
+
+    Args:
+        modules: sys.modules 적재 여부를 함께 확인할 모듈 이름 목록
+
+    Returns:
+        dict: import_ms(지연 import된 모듈별 소요 시간), loaded(모듈별 적재 여부)
+    """
+    stats: Dict[str, Any] = {"import_ms": dict(_import_times)}
+    if modules:
+        stats["loaded"] = {name: name in sys.modules for name in modules}
+    return stats
@@ -0,0 +1,376 @@
+"""
+로컬 LLM(llama.cpp) 엔진
+
+GGUF 모델을 프로세스당 한 번만 로드하여 모든 요청이 공유합니다.
+- 최초 사용 시(또는 서버 시작 시) 로드, 이후 재사용
+- 고정 크기 워커 풀 (워커마다 llama.cpp 컨텍스트 1개)
+- 대기열 크기 제한 (가득 차면 즉시 거절 → 호출 측에서 템플릿 폴백)
+- 토큰 단위 취소: 타임아웃/취소 시 다음 토큰에서 생성을 중단하여 코어를 반환
+- 토큰 스트리밍: stream=True로 제출하면 생성되는 즉시 토큰을 받아볼 수 있음
+- 고정 시스템 프롬프트의 KV 캐시 재사용 (LlamaRAMCache + 워밍업)
+- 로드 시간 / 생성 시간 / 타임아웃 / 취소 / 대기열 길이 지표 수집
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class EngineBusyError(RuntimeError):
+    """대기열이 가득 차 요청을 받을 수 없을 때 발생합니다."""
+
+
+class LlmJob:
+    """워커 풀에 제출된 생성 작업"""
+
+    def __init__(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        timeout: Optional[float],
+        stream: bool = False,
+    ):
+        self.messages = messages
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.result: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        self.status = "queued"  # queued, running, done, failed, cancelled, timeout
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        # 스트리밍 모드: 워커가 토큰을 넣고, 종료 시 None(종료 표시)을 넣음
+        self._tokens: Optional["queue.Queue[Optional[str]]"] = queue.Queue() if stream else None
+
+    @property
+    def done(self) -> bool:
+        return self._done_event.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def cancel(self):
+        """생성 중단을 요청합니다. 워커는 다음 토큰에서 멈춥니다."""
+        self._cancel_event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        작업 완료를 기다립니다. 시간 안에 끝나지 않으면 작업을 취소하고 None을 반환합니다.
+
+        Raises:
+            생성 중 발생한 예외
+        """
+        if not self._done_event.wait(timeout):
+            self.cancel()
+            return None
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def iter_tokens(self, grace: float = 1.0) -> Iterator[str]:
+        """
+        생성되는 토큰을 순서대로 반환합니다 (stream=True로 제출한 작업만).
+        제한 시간(+grace) 안에 다음 토큰이 오지 않으면 작업을 취소하고 종료합니다.
+        """
+        if self._tokens is None:
+            raise RuntimeError("stream=True로 제출한 작업이 아닙니다.")
+        while True:
+            wait = None
+            if self.deadline is not None:
+                wait = max(0.0, self.deadline - time.monotonic()) + grace
+            try:
+                text = self._tokens.get(timeout=wait)
+            except queue.Empty:
+                self.cancel()
+                return
+            if text is None:
+                return
+            yield text
+
+    def _emit(self, text: str):
+        if self._tokens is not None:
+            self._tokens.put(text)
+
+    def _finish(self, status: str, result: Optional[str] = None, error: Optional[BaseException] = None):
+        self.status = status
+        self.result = result
+        self.error = error
+        self._done_event.set()
+        if self._tokens is not None:
+            self._tokens.put(None)
+
+
+class LlamaEngine:
+    """프로세스 전역에서 공유하는 llama.cpp 엔진 (고정 크기 워커 풀)"""
+
+    def __init__(
+        self,
+        model_path: str,
+        n_ctx: int = 4096,
+        n_threads: int = 4,
+        max_pending: int = 4,
+        num_workers: int = 1,
+        system_prompt: Optional[str] = None,
+        prompt_cache_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Args:
+            model_path: GGUF 모델 파일 경로
+            n_ctx: 컨텍스트 길이
+            n_threads: 워커당 llama.cpp 연산 스레드 수
+            max_pending: 대기열에 쌓일 수 있는 최대 요청 수 (초과 시 EngineBusyError)
+            num_workers: 워커 수 (워커마다 독립 컨텍스트, 가중치는 mmap으로 공유)
+            system_prompt: 로드 직후 KV 캐시에 미리 올려둘 고정 시스템 프롬프트
+            prompt_cache_bytes: 프롬프트 상태 캐시(LlamaRAMCache) 용량, 0이면 사용 안 함
+        """
+        self.model_path = model_path
+        self.n_ctx = n_ctx
+        self.n_threads = n_threads
+        self.max_pending = max_pending
+        self.num_workers = max(1, num_workers)
+        self.system_prompt = system_prompt
+        self.prompt_cache_bytes = prompt_cache_bytes
+
+        self._contexts: List[Any] = [None] * self.num_workers
+        self._context_locks = [threading.Lock() for _ in range(self.num_workers)]
+        self._queue: "queue.Queue[LlmJob]" = queue.Queue(maxsize=max_pending)
+        self._workers: List[threading.Thread] = []
+        self._workers_lock = threading.Lock()
+
+        self._metrics_lock = threading.Lock()
+        self._metrics: Dict[str, Any] = {
+            "loaded": False,
+            "load_seconds": None,
+            "warmup_seconds": None,
+            "submitted": 0,
+            "generations": 0,
+            "failures": 0,
+            "rejected": 0,
+            "timeouts": 0,
+            "cancelled": 0,
+            "active": 0,
+            "generation_seconds_total": 0.0,
+            "last_generation_seconds": None,
+        }
+
+    @property
+    def loaded(self) -> bool:
+        return any(ctx is not None for ctx in self._contexts)
+
+    def _count(self, key: str, delta: int = 1):
+        with self._metrics_lock:
+            self._metrics[key] += delta
+
+    def load(self):
+        """모든 워커의 컨텍스트를 로드하고 워커를 시작합니다 (처음 한 번만 로드)"""
+        for idx in range(self.num_workers):
+            self._load_context(idx)
+        self._ensure_workers()
+        return self._contexts[0]
+
+    def _load_context(self, idx: int):
+        if self._contexts[idx] is not None:
+            return self._contexts[idx]
+
+        with self._context_locks[idx]:
+            if self._contexts[idx] is not None:
+                return self._contexts[idx]
+
+            from llama_cpp import Llama
+
+            print(f"[llm_engine] LLM 모델 로드 시작 (worker={idx}): {self.model_path}")
+            start = time.perf_counter()
+            llm = Llama(
+                model_path=self.model_path,
+                n_ctx=self.n_ctx,
+                n_threads=self.n_threads,
+                verbose=False,
+            )
+            load_seconds = time.perf_counter() - start
+
+            if self.prompt_cache_bytes > 0:
+                try:
+                    from llama_cpp import LlamaRAMCache
+                    llm.set_cache(LlamaRAMCache(capacity_bytes=self.prompt_cache_bytes))
+                except Exception as e:
+                    print(f"[llm_engine] 프롬프트 캐시 설정 실패 (무시): {e}")
+
+            warmup_seconds = self._warmup(llm)
+
+            self._contexts[idx] = llm
+            with self._metrics_lock:
+                self._metrics["loaded"] = True
+                if self._metrics["load_seconds"] is None:
+                    self._metrics["load_seconds"] = round(load_seconds, 3)
+                    self._metrics["warmup_seconds"] = warmup_seconds
+            print(f"[llm_engine] LLM 모델 로드 완료 (worker={idx}, {load_seconds:.2f}초)")
+            return llm
+
+    def _warmup(self, llm) -> Optional[float]:
+        """시스템 프롬프트를 한 번 평가하여 KV 캐시에 프리픽스를 올려둡니다."""
+        if not self.system_prompt:
+            return None
+        try:
+            start = time.perf_counter()
+            llm.create_chat_completion(
+                messages=[
+                    {"role": "system", "content": self.system_prompt},
+                    {"role": "user", "content": "."},
+                ],
+                max_tokens=1,
+                temperature=0.0,
+            )
+            return round(time.perf_counter() - start, 3)
+        except Exception as e:
+            print(f"[llm_engine] 시스템 프롬프트 워밍업 실패 (무시): {e}")
+            return None
+
+    def _ensure_workers(self):
+        if self._workers:
+            return
+        with self._workers_lock:
+            if self._workers:
+                return
+            for idx in range(self.num_workers):
+                worker = threading.Thread(target=self._worker_loop, args=(idx,), name=f"llm-worker-{idx}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def _worker_loop(self, idx: int):
+        while True:
+            job = self._queue.get()
+            try:
+                self._run_job(idx, job)
+            finally:
+                self._queue.task_done()
+
+    def _run_job(self, idx: int, job: LlmJob):
+        # 대기 중에 취소/만료된 작업은 실행하지 않음
+        if job.expired():
+            self._count("timeouts")
+            job._finish("timeout")
+            return
+        if job.cancelled:
+            self._count("cancelled")
+            job._finish("cancelled")
+            return
+
+        job.status = "running"
+        self._count("active")
+        start = time.perf_counter()
+        stream = None
+        try:
+            llm = self._load_context(idx)
+            stream = llm.create_chat_completion(
+                messages=job.messages,
+                max_tokens=job.max_tokens,
+                temperature=job.temperature,
+                stream=True,
+            )
+            parts: List[str] = []
+            stopped = None
+            for chunk in stream:
+                # 토큰마다 취소/타임아웃 확인 → 즉시 생성 중단
+                if job.expired():
+                    stopped = "timeout"
+                    break
+                if job.cancelled:
+                    stopped = "cancelled"
+                    break
+                delta = chunk["choices"][0].get("delta", {})
+                text = delta.get("content")
+                if text:
+                    parts.append(text)
+                    job._emit(text)
+
+            elapsed = time.perf_counter() - start
+            with self._metrics_lock:
+                if stopped == "cancelled":
+                    self._metrics["cancelled"] += 1
+                elif stopped == "timeout":
+                    self._metrics["timeouts"] += 1
+                else:
+                    self._metrics["generations"] += 1
+                    self._metrics["generation_seconds_total"] += elapsed
+                    self._metrics["last_generation_seconds"] = round(elapsed, 3)
+
+            if stopped:
+                job._finish(stopped)
+            else:
+                job._finish("done", result="".join(parts).strip())
+        except Exception as e:
+            self._count("failures")
+            job._finish("failed", error=e)
+        finally:
+            if stream is not None and hasattr(stream, "close"):
+                stream.close()
+            self._count("active", -1)
+
+    def submit(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> LlmJob:
+        """
+        생성 작업을 대기열에 넣습니다.
+
+        Args:
+            messages: 채팅 메시지 리스트
+            max_tokens: 최대 생성 토큰 수
+            temperature: 샘플링 온도
+            timeout: 제출 시점부터의 제한 시간 (초). 초과 시 다음 토큰에서 중단
+            stream: True면 LlmJob.iter_tokens()로 토큰을 생성 즉시 받을 수 있음
+
+        Returns:
+            LlmJob: 제출된 작업
+
+        Raises:
+            EngineBusyError: 대기열이 가득 찬 경우 (기다리지 않고 즉시 발생)
+        """
+        self._ensure_workers()
+        job = LlmJob(messages, max_tokens, temperature, timeout, stream=stream)
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            self._count("rejected")
+            raise EngineBusyError(f"LLM 대기열 포화 (max_pending={self.max_pending})")
+        self._count("submitted")
+        return job
+
+    def generate(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        작업을 제출하고 결과를 기다립니다. 타임아웃 시 생성을 중단하고 None을 반환합니다.
+        """
+        job = self.submit(messages, max_tokens, temperature, timeout=timeout)
+        return job.wait(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """엔진 지표(로드 시간, 생성 시간, 타임아웃/취소 수, 대기열 길이 등)를 반환합니다."""
+        with self._metrics_lock:
+            stats = dict(self._metrics)
+        generations = stats["generations"]
+        stats["generation_seconds_total"] = round(stats["generation_seconds_total"], 3)
+        stats["avg_generation_seconds"] = (
+            round(stats["generation_seconds_total"] / generations, 3) if generations else None
+        )
+        stats["queue_depth"] = self._queue.qsize()
+        stats["max_pending"] = self.max_pending
+        stats["num_workers"] = self.num_workers
+        stats["model_path"] = self.model_path
+        return stats
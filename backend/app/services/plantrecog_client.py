@@ -0,0 +1,392 @@
+"""
+PlantRecog 원격 분류 API 클라이언트
+
+- httpx.AsyncClient 하나를 공유하는 커넥션 풀 (keep-alive, h2 패키지가 있으면 HTTP/2)
+- 연결/읽기 타임아웃 분리, 지수 백오프 + 지터 재시도 (연결 오류/5xx/429만), 재시도 포함 전체 제한 시간
+- 연속 실패 시 회로 차단기(circuit breaker)가 열려 일정 시간 원격 호출을 건너뜀
+- 지연 시간 히스토그램 지표
+- 스레드(실행기)에서 호출할 수 있도록 전용 이벤트 루프 스레드에서 코루틴을 실행
+
+URL/타임아웃은 settings로 바꿀 수 있어 로컬 스텁 서버로도 테스트할 수 있습니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import bisect
+import concurrent.futures
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+import httpx
+
+from app.config import settings
+
+
+class CircuitOpenError(RuntimeError):
+    """회로 차단기가 열려 원격 호출을 건너뛸 때 발생"""
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 회로 차단기
+
+    closed → (연속 failure_threshold회 실패) → open → (reset_timeout 경과) → half_open
+    half_open에서는 한 요청만 시험 삼아 통과시키고, 성공하면 closed, 실패하면 다시 open.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self.opened_count = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 반환합니다 (half_open에서는 한 번에 한 요청만)."""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """시험 요청이 성공/실패 판정 없이 끝났을 때(취소 등) 다음 요청이 다시 시험할 수 있게 합니다."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            # 시험 요청 실패 또는 연속 실패가 기준 도달 → (다시) open
+            if self._probe_in_flight or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._probe_in_flight:
+                    self.opened_count += 1
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._state(),
+                "consecutive_failures": self._failures,
+                "opened_count": self.opened_count,
+            }
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램 (밀리초)"""
+
+    DEFAULT_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self._counts = [0] * (len(self.buckets_ms) + 1)
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        ms = seconds * 1000
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets_ms, ms)] += 1
+            self._total_ms += ms
+            self._max_ms = max(self._max_ms, ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            count = sum(self._counts)
+            labels = [f"<={b:g}ms" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]:g}ms"]
+            return {
+                "count": count,
+                "avg_ms": round(self._total_ms / count, 1) if count else None,
+                "max_ms": round(self._max_ms, 1),
+                "buckets": dict(zip(labels, self._counts)),
+            }
+
+
+class _RetryableError(Exception):
+    """재시도 대상 응답 (5xx/429)"""
+
+
+class PlantRecogClient:
+    """커넥션 풀을 공유하는 PlantRecog 비동기 클라이언트"""
+
+    def __init__(
+        self,
+        base_url: str,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 15.0,
+        max_retries: int = 2,
+        retry_backoff: float = 0.2,
+        max_connections: int = 20,
+        http2: bool = True,
+        breaker: Optional[CircuitBreaker] = None,
+        total_timeout: Optional[float] = 30.0,
+    ):
+        """
+        Args:
+            base_url: API 주소 (예: https://plantrecog.sarthak.work)
+            connect_timeout: 연결 타임아웃 (초)
+            read_timeout: 응답 읽기 타임아웃 (초)
+            max_retries: 첫 시도 이후 재시도 횟수
+            retry_backoff: 재시도 백오프 기본값 (초), 시도마다 두 배 + 전체 지터
+            max_connections: 풀 최대 연결 수
+            http2: HTTP/2 사용 여부 (h2 패키지가 없으면 HTTP/1.1 keep-alive)
+            breaker: 회로 차단기 (None이면 기본값으로 생성)
+            total_timeout: 재시도와 백오프를 포함한 요청 전체 제한 시간 (초), None이면 제한 없음
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.total_timeout = total_timeout
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.http2 = http2 and _h2_available()
+        self.breaker = breaker or CircuitBreaker()
+        self.latency = LatencyHistogram()
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "requests": 0, "attempts": 0, "retries": 0, "failures": 0, "timeouts": 0, "short_circuited": 0,
+        }
+
+    # ---- 이벤트 루프 ----
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """동기 호출용 전용 이벤트 루프 스레드를 시작합니다 (처음 한 번만)."""
+        if self._loop is not None:
+            return self._loop
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="plantrecog-client", daemon=True)
+                thread.start()
+                self._loop_thread = thread
+                self._loop = loop
+        return self._loop
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # AsyncClient는 생성된 이벤트 루프에 묶이므로 항상 전용 루프 안에서 생성/사용
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+        return self._client
+
+    # ---- 요청 ----
+
+    def _count(self, key: str, n: int = 1):
+        with self._stats_lock:
+            self._stats[key] += n
+
+    async def _predict(self, image: bytes) -> Dict[str, Any]:
+        if not self.breaker.allow():
+            self._count("short_circuited")
+            raise CircuitOpenError("PlantRecog 회로 차단기 열림")
+
+        self._count("requests")
+        start = time.perf_counter()
+        settled = False
+        try:
+            try:
+                result = await asyncio.wait_for(self._attempts(image), self.total_timeout)
+            except asyncio.TimeoutError:
+                self._count("timeouts")
+                last_error: BaseException = TimeoutError(f"전체 제한 시간 {self.total_timeout}초 초과")
+            except RuntimeError as e:
+                last_error = e
+            else:
+                self.latency.observe(time.perf_counter() - start)
+                self.breaker.record_success()
+                settled = True
+                return result
+
+            self.latency.observe(time.perf_counter() - start)
+            self.breaker.record_failure()
+            settled = True
+            self._count("failures")
+            raise RuntimeError(f"PlantRecog 요청 실패: {last_error}") from last_error
+        finally:
+            if not settled:
+                # 취소(CancelledError 등)로 판정 없이 끝나면 half_open 시험 요청 자리를 반납
+                self.breaker.release_probe()
+
+    async def _attempts(self, image: bytes) -> Dict[str, Any]:
+        """재시도/백오프를 포함한 요청 시도 (모두 실패하면 RuntimeError)"""
+        client = self._get_client()
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._count("retries")
+                # 전체 지터: [0, backoff * 2^(attempt-1)] 사이 무작위 대기
+                await asyncio.sleep(random.uniform(0, self.retry_backoff * (2 ** (attempt - 1))))
+            self._count("attempts")
+            try:
+                files = {"image": ("plant.jpg", image, "image/jpeg")}
+                response = await client.post("/predict", files=files)
+                if response.status_code == 429 or response.status_code >= 500:
+                    raise _RetryableError(f"HTTP {response.status_code}")
+                if response.status_code != 200:
+                    # 4xx는 재시도해도 같은 결과
+                    last_error = RuntimeError(f"HTTP {response.status_code}")
+                    break
+                return response.json()
+            except (httpx.TransportError, _RetryableError) as e:
+                last_error = e
+            except Exception as e:
+                last_error = e
+                break
+        raise RuntimeError(str(last_error)) from last_error
+
+    async def predict(self, image: bytes) -> Dict[str, Any]:
+        """
+        이미지를 PlantRecog API로 분류합니다 (비동기).
+
+        Args:
+            image: 이미지 바이트
+
+        Returns:
+            Dict[str, Any]: API 응답 JSON
+
+        Raises:
+            CircuitOpenError: 회로 차단기가 열려 있는 경우
+            RuntimeError: 재시도 후에도 요청이 실패한 경우
+        """
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            return await self._predict(image)
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._predict(image), loop))
+
+    def predict_sync(self, image: bytes) -> Dict[str, Any]:
+        """
+        스레드에서 호출하는 동기 버전 (전용 이벤트 루프에서 실행하고 결과를 기다림).
+
+        Args:
+            image: 이미지 바이트
+
+        Returns:
+            Dict[str, Any]: API 응답 JSON
+        """
+        # 사전 차단: 회로가 열려 있으면 루프를 거치지 않고 바로 실패
+        if self.breaker.state == "open":
+            self._count("short_circuited")
+            raise CircuitOpenError("PlantRecog 회로 차단기 열림")
+        future = asyncio.run_coroutine_threadsafe(self._predict(image), self._ensure_loop())
+        # _predict가 total_timeout을 지키지만, 루프가 막힌 경우에도 호출 스레드가 무한히 기다리지 않도록
+        wait = self.total_timeout + 1.0 if self.total_timeout is not None else None
+        try:
+            return future.result(timeout=wait)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            self._count("timeouts")
+            raise RuntimeError(f"PlantRecog 요청 실패: 전체 제한 시간 {self.total_timeout}초 초과")
+
+    def close(self):
+        """커넥션 풀과 이벤트 루프 스레드를 정리합니다."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._client is not None:
+            client, self._client = self._client, None
+            try:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+            except Exception as e:
+                print(f"[PlantRecog] 클라이언트 종료 오류: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+
+    def stats(self) -> Dict[str, Any]:
+        """요청/재시도/실패 수, 회로 차단기 상태, 지연 시간 히스토그램을 반환합니다."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["base_url"] = self.base_url
+        stats["http2"] = self.http2
+        stats["circuit"] = self.breaker.stats()
+        stats["latency"] = self.latency.snapshot()
+        return stats
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+_client: Optional[PlantRecogClient] = None
+_client_lock = threading.Lock()
+
+
+def get_plantrecog_client() -> PlantRecogClient:
+    """설정값으로 만든 공유 PlantRecog 클라이언트를 반환합니다 (처음 한 번만 생성)"""
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PlantRecogClient(
+                    base_url=settings.plantrecog_url,
+                    connect_timeout=settings.plantrecog_connect_timeout,
+                    read_timeout=settings.plantrecog_read_timeout,
+                    max_retries=settings.plantrecog_max_retries,
+                    retry_backoff=settings.plantrecog_retry_backoff,
+                    max_connections=settings.plantrecog_max_connections,
+                    http2=settings.plantrecog_http2,
+                    total_timeout=settings.plantrecog_total_timeout,
+                    breaker=CircuitBreaker(
+                        failure_threshold=settings.plantrecog_breaker_failures,
+                        reset_timeout=settings.plantrecog_breaker_reset,
+                    ),
+                )
+    return _client
+
+
+def close_plantrecog_client():
+    """공유 클라이언트를 정리합니다 (서버 종료 시 호출)."""
+    global _client
+
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+def get_plantrecog_stats() -> dict:
+    """PlantRecog 클라이언트 지표를 반환합니다."""
+    if _client is None:
+        return {"requests": 0}
+    return _client.stats()
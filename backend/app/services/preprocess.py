@@ -0,0 +1,84 @@
+"""
+식물 분류기 입력 전처리
+
+업로드 이미지 바이트 → (1, 3, 224, 224) float32 텐서.
+- JPEG는 draft 모드로 목표 크기에 가깝게 축소 디코딩 (12MP 전체 디코딩 회피)
+- float32 유지, 정규화는 제자리(in-place) 연산
+- HWC uint8 → CHW float32 변환을 한 번의 복사로 수행, torch.from_numpy로 복사 없이 텐서화
+"""
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+# 모델 입력 크기
+TARGET_SIZE = 224
+
+# 정규화 값 (umutbozdag/plant-identity: mean=std=0.5)
+IMAGE_MEAN = (0.5, 0.5, 0.5)
+IMAGE_STD = (0.5, 0.5, 0.5)
+
+# (x / 255 - mean) / std  ==  x * scale + offset
+_SCALE = (1.0 / (255.0 * np.asarray(IMAGE_STD, dtype=np.float32))).reshape(3, 1, 1)
+_OFFSET = (-np.asarray(IMAGE_MEAN, dtype=np.float32) / np.asarray(IMAGE_STD, dtype=np.float32)).reshape(3, 1, 1)
+
+
+def decode_image(image: bytes, size: int = TARGET_SIZE) -> Image.Image:
+    """
+    이미지 바이트를 RGB 이미지로 디코딩합니다.
+    JPEG는 DCT 스케일링(1/2, 1/4, 1/8)으로 size 이상인 가장 작은 크기로 디코딩합니다.
+
+    Args:
+        image: 이미지 바이트
+        size: 목표 한 변 크기
+
+    Returns:
+        Image.Image: RGB 이미지
+    """
+    img = Image.open(BytesIO(image))
+    # JPEG가 아니면 draft는 아무 것도 하지 않음
+    img.draft("RGB", (size, size))
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return img
+
+
+def preprocess_to_array(image: bytes, size: int = TARGET_SIZE) -> np.ndarray:
+    """
+    이미지 바이트를 정규화된 (1, 3, size, size) float32 배열로 변환합니다.
+
+    Args:
+        image: 이미지 바이트
+        size: 모델 입력 크기
+
+    Returns:
+        np.ndarray: C-contiguous (1, 3, size, size) float32 배열
+    """
+    img = decode_image(image, size)
+    if img.size != (size, size):
+        img = img.resize((size, size), Image.Resampling.LANCZOS)
+
+    pixels = np.asarray(img)  # (H, W, C) uint8
+
+    out = np.empty((1, 3, size, size), dtype=np.float32)
+    # 전치 + float32 변환을 한 번에 (추가 중간 배열 없음)
+    np.copyto(out[0], pixels.transpose(2, 0, 1))
+    out[0] *= _SCALE
+    out[0] += _OFFSET
+    return out
+
+
+def preprocess_image(image: bytes, size: int = TARGET_SIZE):
+    """
+    이미지 바이트를 분류기 입력 텐서로 변환합니다.
+
+    Args:
+        image: 이미지 바이트
+        size: 모델 입력 크기
+
+    Returns:
+        torch.Tensor: (1, 3, size, size) float32 텐서 (배열 메모리 공유)
+    """
+    import torch
+
+    return torch.from_numpy(preprocess_to_array(image, size))
@@ -0,0 +1,474 @@
+"""
+식물 분석/성장 기록 저장소
+
+- SqliteStorage: SQLite(WAL) 트랜잭션 저장소 (기본값)
+  기록 하나를 저장할 때 해당 행만 쓰므로 쓰기 비용이 데이터 크기와 무관하고,
+  동시 요청의 쓰기가 서로 덮어쓰지 않습니다.
+- JsonStorage: 기존 JSON 파일 저장 방식 (storage_backend="json"으로 선택)
+  성장 기록은 추가 전용 저널 + 주기적 스냅샷 압축(growth_journal.GrowthJournal)으로 저장하고,
+  식물 분석 데이터는 메모리 인덱스(data_id → 기록, plant_name → 최신 기록)로 O(1) 조회하며,
+  파일이 외부에서 바뀌면(mtime/크기) 인덱스를 다시 만듭니다.
+- migrate_json_to_sqlite: 기존 JSON 파일을 SQLite로 옮기는 일회성 마이그레이터
+
+db_utils의 함수 시그니처는 그대로이며, 내부에서 이 모듈의 저장소를 사용합니다.
+
+마이그레이션 CLI (backend 디렉토리에서):
+    python -m app.services.storage migrate
+    python -m app.services.storage migrate --force
+"""
+from __future__ import annotations
+
+import copy
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from app.services.growth_journal import GrowthJournal, load_growth_state
+from app.services.growth_series import GrowthSeries, date_to_ordinal, ordinal_to_date
+
+# 마이그레이션 완료 표시 (meta 테이블 키)
+_MIGRATED_KEY = "json_migrated"
+
+
+class SqliteStorage:
+    """SQLite(WAL) 기반 식물 분석/성장 기록 저장소"""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: SQLite 파일 경로 (상위 디렉토리는 자동 생성)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        conn = self._conn()
+        with conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS identifications (
+                    id TEXT PRIMARY KEY,
+                    plant_name TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    file_hash TEXT,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_identifications_plant_name
+                    ON identifications (plant_name, timestamp);
+                CREATE INDEX IF NOT EXISTS idx_identifications_timestamp
+                    ON identifications (timestamp);
+
+                CREATE TABLE IF NOT EXISTS growth_records (
+                    plant_id TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    height REAL NOT NULL,
+                    PRIMARY KEY (plant_id, date)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                """
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간 공유하지 않고 스레드마다 하나씩 사용
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # ---- 식물 분석 데이터 ----
+
+    def save_identification(self, record: Dict[str, Any]):
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO identifications (id, plant_name, timestamp, file_hash, data)"
+                " VALUES (?, ?, ?, ?, ?)",
+                _identification_row(record),
+            )
+
+    def save_identifications(self, records: Iterable[Dict[str, Any]]) -> int:
+        rows = [_identification_row(record) for record in records]
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO identifications (id, plant_name, timestamp, file_hash, data)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def get_identification(self, data_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute("SELECT data FROM identifications WHERE id = ?", (data_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def latest_identification(self, plant_name: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(
+            "SELECT data FROM identifications WHERE plant_name = ? ORDER BY timestamp DESC LIMIT 1",
+            (plant_name,),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count_identifications(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM identifications").fetchone()[0]
+
+    # ---- 성장 기록 ----
+
+    def save_growth(self, plant_id: str, date: str, height: float):
+        self.save_growth_many([(plant_id, date, height)])
+
+    def save_growth_many(self, records: Iterable[Tuple[str, str, float]]) -> int:
+        """
+        (plant_id, date, height) 기록들을 한 트랜잭션으로 저장합니다 (같은 날짜는 덮어씀).
+        날짜는 YYYY-MM-DD로 정규화해 저장하므로 "20250131"과 "2025-01-31"은 같은 기록입니다.
+        날짜 형식이 잘못되면 ValueError (아무 기록도 저장하지 않음).
+        """
+        rows = [
+            (plant_id, ordinal_to_date(date_to_ordinal(date)), float(height))
+            for plant_id, date, height in records
+        ]
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO growth_records (plant_id, date, height) VALUES (?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def _save_growth_verbatim(self, records: Iterable[Tuple[str, str, float]]) -> int:
+        """날짜를 정규화하지 않고 그대로 저장합니다 (마이그레이션 시 날짜를 해석할 수 없는 예전 기록용)."""
+        rows = list(records)
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO growth_records (plant_id, date, height) VALUES (?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def growth_history(self, plant_id: str) -> List[Dict[str, Any]]:
+        rows = self._conn().execute(
+            "SELECT date, height FROM growth_records WHERE plant_id = ? ORDER BY date",
+            (plant_id,),
+        ).fetchall()
+        return [{"date": date, "height": height} for date, height in rows]
+
+    def growth_series(self, plant_id: str, start: Optional[str] = None, end: Optional[str] = None) -> GrowthSeries:
+        """날짜 범위 [start, end]의 기록을 열 기반 시계열로 반환합니다 (기본키 (plant_id, date) 범위 조회)."""
+        rows = self._conn().execute(
+            "SELECT date, height FROM growth_records WHERE plant_id = ? AND date >= ? AND date <= ? ORDER BY date",
+            (
+                plant_id,
+                ordinal_to_date(date_to_ordinal(start)) if start else "",
+                ordinal_to_date(date_to_ordinal(end)) if end else "\uffff",
+            ),
+        ).fetchall()
+        days, heights = [], []
+        for date, height in rows:
+            try:
+                days.append(date_to_ordinal(date))
+            except ValueError:
+                continue  # YYYY-MM-DD가 아닌 예전 기록
+            heights.append(height)
+        # save_growth_many가 날짜를 YYYY-MM-DD로 정규화해 저장하므로 문자열 정렬 = 날짜순, 중복 없음
+        return GrowthSeries.from_columns(days, heights, copy=False)
+
+    def plant_ids(self) -> List[str]:
+        rows = self._conn().execute("SELECT DISTINCT plant_id FROM growth_records").fetchall()
+        return [row[0] for row in rows]
+
+    def count_growth_records(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM growth_records").fetchone()[0]
+
+    def clear_growth(self):
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM growth_records")
+
+    # ---- 메타 ----
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        conn = self._conn()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def _identification_row(record: Dict[str, Any]) -> tuple:
+    return (
+        record["id"],
+        record.get("identification", {}).get("plant_name", ""),
+        record.get("timestamp", ""),
+        record.get("file_hash"),
+        json.dumps(record, ensure_ascii=False),
+    )
+
+
+class JsonStorage:
+    """
+    기존 JSON 파일 저장소 (호환용)
+    식물 분석 데이터는 파일 전체를 다시 쓰므로 쓰기 비용이 데이터 크기에 비례합니다.
+    같은 프로세스 안의 동시 쓰기는 잠금으로 직렬화하고, 임시 파일 + 교체로 원자적으로 씁니다.
+    성장 기록은 저널에 한 줄씩 추가하고 백그라운드에서 growth_file 스냅샷으로 합칩니다.
+    """
+
+    def __init__(
+        self,
+        identification_file: Union[str, Path],
+        growth_file: Union[str, Path],
+        journal_sync: bool = True,
+        journal_compact_threshold: int = 10_000,
+        journal_compact_interval: float = 300.0,
+    ):
+        """
+        Args:
+            identification_file: 식물 분석 데이터 JSON 파일
+            growth_file: 성장 기록 JSON 스냅샷 파일 (저널은 <growth_file>.journal)
+            journal_sync: True면 성장 기록 저장이 fsync(그룹 커밋)까지 끝난 뒤 반환
+            journal_compact_threshold: 저널 줄 수가 이 값을 넘으면 스냅샷으로 압축
+            journal_compact_interval: 주기 압축 간격 (초)
+        """
+        self.identification_file = Path(identification_file)
+        self.growth_file = Path(growth_file)
+        self._lock = threading.RLock()
+        # 식물 분석 데이터 인덱스 (파일 서명이 바뀌면 다시 만듦)
+        self._by_id: Optional[Dict[str, Dict[str, Any]]] = None
+        self._latest_by_name: Dict[str, Dict[str, Any]] = {}
+        self._index_signature: Optional[Tuple[int, int]] = None
+        self.index_builds = 0
+        self._journal_options = {
+            "sync": journal_sync,
+            "compact_threshold": journal_compact_threshold,
+            "compact_interval": journal_compact_interval,
+        }
+        self._journal: Optional[GrowthJournal] = None
+
+    # ---- 식물 분석 데이터 ----
+
+    def _load_identifications(self) -> Dict[str, Any]:
+        if not self.identification_file.exists():
+            return {}
+        try:
+            with open(self.identification_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[db_utils] 기존 데이터 로드 실패: {e}")
+            return {}
+
+    def _identification_index(self) -> Dict[str, Dict[str, Any]]:
+        """인덱스를 반환합니다. 처음이거나 파일이 외부에서 바뀌었으면 다시 만듭니다."""
+        signature = _file_signature(self.identification_file)
+        with self._lock:
+            if self._by_id is None or signature != self._index_signature:
+                # 서명을 읽은 뒤 파일이 또 바뀌면 다음 조회에서 서명이 달라져 다시 만들어짐
+                self._by_id = self._load_identifications()
+                self._latest_by_name = {}
+                for record in self._by_id.values():
+                    self._index_latest(record)
+                self._index_signature = signature
+                self.index_builds += 1
+            return self._by_id
+
+    def _index_latest(self, record: Dict[str, Any]):
+        plant_name = record.get("identification", {}).get("plant_name")
+        if plant_name is None:
+            return
+        current = self._latest_by_name.get(plant_name)
+        if current is None or record.get("timestamp", "") >= current.get("timestamp", ""):
+            self._latest_by_name[plant_name] = record
+
+    def save_identification(self, record: Dict[str, Any]):
+        self.save_identifications([record])
+
+    def save_identifications(self, records: Iterable[Dict[str, Any]]) -> int:
+        with self._lock:
+            by_id = self._identification_index()
+            records = list(records)
+            for record in records:
+                replaced = by_id.get(record["id"])
+                by_id[record["id"]] = record
+                if replaced is not None and self._latest_by_name.get(
+                        replaced.get("identification", {}).get("plant_name")) is replaced:
+                    # 최신 기록이 교체된 경우에만 해당 식물의 최신 기록을 다시 계산
+                    name = replaced.get("identification", {}).get("plant_name")
+                    del self._latest_by_name[name]
+                    for other in by_id.values():
+                        if other.get("identification", {}).get("plant_name") == name:
+                            self._index_latest(other)
+                self._index_latest(record)
+            try:
+                _atomic_write_json(self.identification_file, by_id)
+            except Exception:
+                # 파일과 어긋난 인덱스는 버리고 다음 조회에서 파일 기준으로 다시 만듦
+                self._by_id = None
+                raise
+            self._index_signature = _file_signature(self.identification_file)
+        return len(records)
+
+    def get_identification(self, data_id: str) -> Optional[Dict[str, Any]]:
+        record = self._identification_index().get(data_id)
+        return copy.deepcopy(record) if record is not None else None
+
+    def latest_identification(self, plant_name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._identification_index()
+            record = self._latest_by_name.get(plant_name)
+        return copy.deepcopy(record) if record is not None else None
+
+    def count_identifications(self) -> int:
+        return len(self._identification_index())
+
+    # ---- 성장 기록 ----
+
+    def _growth_journal(self) -> GrowthJournal:
+        """성장 기록 저널을 반환합니다 (처음 사용할 때 복구 후 열림)."""
+        if self._journal is None:
+            with self._lock:
+                if self._journal is None:
+                    self._journal = GrowthJournal(self.growth_file, **self._journal_options)
+        return self._journal
+
+    def save_growth(self, plant_id: str, date: str, height: float):
+        self.save_growth_many([(plant_id, date, height)])
+
+    def save_growth_many(self, records: Iterable[Tuple[str, str, float]]) -> int:
+        return self._growth_journal().append(records)
+
+    def growth_history(self, plant_id: str) -> List[Dict[str, Any]]:
+        return self._growth_journal().history(plant_id)
+
+    def growth_series(self, plant_id: str, start: Optional[str] = None, end: Optional[str] = None) -> GrowthSeries:
+        """날짜 범위 [start, end]의 기록 (메모리 시계열의 복사 없는 뷰)"""
+        series = self._growth_journal().series(plant_id)
+        return series.range(
+            date_to_ordinal(start) if start else None,
+            date_to_ordinal(end) if end else None,
+        )
+
+    def plant_ids(self) -> List[str]:
+        return self._growth_journal().plant_ids()
+
+    def count_growth_records(self) -> int:
+        return self._growth_journal().count()
+
+    def clear_growth(self):
+        self._growth_journal().clear()
+
+    def close(self):
+        if self._journal is not None:
+            self._journal.close()
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """파일 변경 감지용 서명 (mtime ns, 크기), 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _atomic_write_json(path: Path, data: Any):
+    """임시 파일에 쓴 뒤 교체하여, 쓰는 도중 실패해도 기존 파일이 깨지지 않도록 합니다."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def migrate_json_to_sqlite(
+    storage: SqliteStorage,
+    identification_file: Union[str, Path],
+    growth_file: Union[str, Path],
+    force: bool = False,
+) -> Dict[str, int]:
+    """
+    기존 JSON 파일의 데이터를 SQLite 저장소로 옮깁니다 (한 번만 실행, 원본 파일은 유지).
+
+    Args:
+        storage: 대상 SQLite 저장소
+        identification_file: 식물 분석 데이터 JSON 파일
+        growth_file: 성장 기록 JSON 파일
+        force: True면 이미 마이그레이션했더라도 다시 실행 (같은 키는 덮어씀)
+
+    Returns:
+        Dict[str, int]: 옮긴 식물 분석 데이터/성장 기록 수 (이미 완료된 경우 skipped=1)
+            legacy_records: 날짜를 해석할 수 없어 원본 문자열 그대로 옮긴 예전 기록 수
+            legacy_skipped: 날짜/높이가 없어 옮기지 못한 기록 수 (0이 아니면 완료 표시를 남기지 않음)
+    """
+    if not force and storage.get_meta(_MIGRATED_KEY):
+        return {"identifications": 0, "growth_records": 0, "legacy_records": 0, "legacy_skipped": 0, "skipped": 1}
+
+    legacy = JsonStorage(identification_file, growth_file)
+    identifications = [
+        record for record in legacy._load_identifications().values()
+        if isinstance(record, dict) and record.get("id")
+    ]
+    # 저널을 열지 않고 스냅샷 + 저널을 읽음
+    legacy_records: Dict[str, List[Any]] = {}
+    growth_rows = [
+        (plant_id, record["date"], record["height"])
+        for plant_id, series in load_growth_state(growth_file, legacy=legacy_records).items()
+        for record in series.to_records()
+    ]
+    # 기존 /update-growth는 날짜 형식을 검사하지 않았으므로 "2024/01/02" 같은 기록은 원본 그대로 옮김
+    # (시계열/예측에서는 제외되지만 기록 조회에는 남음)
+    legacy_rows, legacy_skipped = [], 0
+    for plant_id, records in legacy_records.items():
+        for record in records:
+            try:
+                if not isinstance(record["date"], str):
+                    raise TypeError(record["date"])
+                legacy_rows.append((plant_id, record["date"], float(record["height"])))
+            except (ValueError, KeyError, TypeError):
+                legacy_skipped += 1
+
+    migrated = {
+        "identifications": storage.save_identifications(identifications),
+        "growth_records": storage.save_growth_many(growth_rows),
+        "legacy_records": storage._save_growth_verbatim(legacy_rows),
+        "legacy_skipped": legacy_skipped,
+        "skipped": 0,
+    }
+    if legacy_skipped:
+        # 완료 표시를 남기지 않아 원본을 고친 뒤 다시 실행되도록 함
+        print(f"[storage] 옮기지 못한 성장 기록 {legacy_skipped}건 → 마이그레이션 미완료로 유지: {migrated}")
+        return migrated
+    storage.set_meta(_MIGRATED_KEY, json.dumps(migrated))
+    print(f"[storage] JSON → SQLite 마이그레이션 완료: {migrated}")
+    return migrated
+
+
+def main():
+    import argparse
+
+    from app.services import db_utils
+
+    parser = argparse.ArgumentParser(description="식물 데이터 저장소 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate = sub.add_parser("migrate", help="기존 JSON 파일을 SQLite 저장소로 옮깁니다")
+    migrate.add_argument("--force", action="store_true", help="이미 마이그레이션했더라도 다시 실행")
+    migrate.add_argument("--db", default=None, help="SQLite 파일 경로 (기본값: 설정값)")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        storage = SqliteStorage(args.db or db_utils.get_storage_path())
+        result = migrate_json_to_sqlite(
+            storage, db_utils.IDENTIFICATION_FILE, db_utils.GROWTH_DATA_FILE, force=args.force
+        )
+        print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
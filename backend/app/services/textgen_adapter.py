@@ -1,49 +1,109 @@
-
 from __future__ import annotations
 import os
-from typing import List
+from typing import Iterator, List, Optional
 import threading
 
+from app.services.llm_engine import LlamaEngine, EngineBusyError
+
 LLM_PROVIDER = os.getenv("LLM_PROVIDER", "none")  # 기본값을 "none"으로 변경하여 LLM 비활성화
 LLM_MODEL_PATH = os.getenv("LLM_MODEL_PATH", "./models/Qwen2.5-1.5B-Instruct-Q4_K_M.gguf")
 LLM_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS", "512"))
 LLM_THREADS = int(os.getenv("LLM_THREADS", str(os.cpu_count() or 4)))
 LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.6"))
 LLM_TIMEOUT = int(os.getenv("LLM_TIMEOUT", "10"))  # LLM 호출 타임아웃 (초, 기본 10초)
+LLM_N_CTX = int(os.getenv("LLM_N_CTX", "4096"))
+LLM_MAX_PENDING = int(os.getenv("LLM_MAX_PENDING", "4"))  # 대기열 최대 길이 (초과 시 즉시 템플릿 폴백)
+LLM_WORKERS = int(os.getenv("LLM_WORKERS", "1"))  # LLM 워커 수 (워커마다 컨텍스트 1개)
+LLM_PROMPT_CACHE_MB = int(os.getenv("LLM_PROMPT_CACHE_MB", "256"))  # 0이면 프롬프트 캐시 비활성화
+LLM_PRELOAD = os.getenv("LLM_PRELOAD", "1") == "1"  # 서버 시작 시 모델 미리 로드
 
+SYSTEM_PROMPT = "당신은 한국어로 간결하게 조언하는 원예 보조가이드입니다."
 
-def _llm_call_with_timeout(llm, messages, max_tokens, temperature, timeout):
-    """LLM 호출을 타임아웃과 함께 실행"""
-    result = [None]
-    exception = [None]
-    
-    def target():
-        try:
-            out = llm.create_chat_completion(
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature
-            )
-            content = out["choices"][0]["message"]["content"].strip()
-            if content and len(content) > 20:
-                result[0] = content
-        except Exception as e:
-            exception[0] = e
-    
-    thread = threading.Thread(target=target)
-    thread.daemon = True
-    thread.start()
-    thread.join(timeout=timeout)
-    
-    if thread.is_alive():
-        # 타임아웃 발생
-        print(f"[textgen_adapter] LLM 호출 타임아웃 ({timeout}초 초과)")
+# 전역 엔진 (프로세스당 한 번만 로드)
+_engine: Optional[LlamaEngine] = None
+_engine_lock = threading.Lock()
+
+
+def llm_enabled() -> bool:
+    """로컬 LLM 사용 가능 여부 (설정 + 모델 파일 존재)"""
+    return LLM_PROVIDER == "llama_cpp" and os.path.exists(LLM_MODEL_PATH)
+
+
+def get_llm_engine() -> LlamaEngine:
+    """공유 LLM 엔진을 반환합니다 (모델은 첫 생성 또는 preload 시 로드)."""
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = LlamaEngine(
+                    model_path=LLM_MODEL_PATH,
+                    n_ctx=LLM_N_CTX,
+                    n_threads=LLM_THREADS,
+                    max_pending=LLM_MAX_PENDING,
+                    num_workers=LLM_WORKERS,
+                    system_prompt=SYSTEM_PROMPT,
+                    prompt_cache_bytes=LLM_PROMPT_CACHE_MB * 1024 * 1024,
+                )
+    return _engine
+
+
+def preload_llm_engine() -> bool:
+    """서버 시작 시 LLM 모델을 미리 로드합니다. 로드 여부를 반환합니다."""
+    if not LLM_PRELOAD or not llm_enabled():
+        return False
+    try:
+        get_llm_engine().load()
+        return True
+    except Exception as e:
+        print(f"[textgen_adapter] LLM 미리 로드 실패 (첫 요청 시 재시도): {e}")
+        return False
+
+
+def get_llm_stats() -> dict:
+    """LLM 엔진 지표를 반환합니다."""
+    stats = {"provider": LLM_PROVIDER, "enabled": llm_enabled()}
+    if _engine is not None:
+        stats.update(_engine.stats())
+    return stats
+
+
+def _build_messages(plant_name: str, K: float, start_cm: float, unit: str, periods: int, good_series: List[float], bad_series: List[float]) -> List[dict]:
+    """성장 분석 프롬프트 메시지를 구성합니다. 시스템 프롬프트는 고정(KV 캐시 재사용)."""
+    return [
+        {"role":"system","content":SYSTEM_PROMPT},
+        {"role":"user","content": (
+            "아래 데이터(식물명, 성장시나리오)로 8~12문장 내 "
+            f"{plant_name}의 월별 성장 경향 요약, 관리 팁 4개, 주의사항 3개를 bullet로 제시하세요.\n"
+            f"- 식물명: {plant_name}\n"
+            f"- 단위: {unit}, 기간: {periods}\n"
+            f"- 초기 높이: {start_cm} cm\n"
+            f"- 상한(추정 K): {K} cm\n"
+            f"- 좋은 성장(연속값): {good_series}\n"
+            f"- 나쁜 성장(연속값): {bad_series}\n"
+            "한국어로 짧고 실무적으로 쓰며, 불필요한 수식어는 피하고, 동일한 사실 반복 금지.\n"
+            "섹션 제목은 '요약', '관리 팁', '주의할 점'을 사용하세요."
+        )}
+    ]
+
+
+def _llm_call_with_timeout(engine, messages, max_tokens, temperature, timeout):
+    """
+    LLM 호출을 타임아웃과 함께 실행.
+    시간 초과 시 워커가 다음 토큰에서 생성을 중단하므로 코어를 계속 점유하지 않습니다.
+    대기열이 가득 차면 EngineBusyError가 즉시 발생합니다.
+    """
+    job = engine.submit(messages, max_tokens, temperature, timeout=timeout)
+    content = job.wait(timeout)
+
+    if content is None:
+        # 타임아웃 발생 (생성 중단 요청됨)
+        print(f"[textgen_adapter] LLM 호출 타임아웃 ({timeout}초 초과, 상태={job.status})")
         return None
-    
-    if exception[0]:
-        raise exception[0]
-    
-    return result[0]
+
+    if len(content) > 20:
+        return content
+    return None
 
 
 def render_plant_analysis(plant_name: str, K: float, start_cm: float, unit: str, periods: int, good_series: List[float], bad_series: List[float]) -> str:
@@ -55,30 +115,12 @@ def render_plant_analysis(plant_name: str, K: float, start_cm: float, unit: str,
         print(f"[textgen_adapter] LLM 비활성화됨 (LLM_PROVIDER={LLM_PROVIDER}, 모델파일존재={os.path.exists(LLM_MODEL_PATH)})")
     elif LLM_PROVIDER == "llama_cpp":      
         try:
-            from llama_cpp import Llama
-            print(f"[textgen_adapter] LLM 모델 로드 시도: {LLM_MODEL_PATH}")
-            llm = Llama(model_path=LLM_MODEL_PATH, n_ctx=4096, n_threads=LLM_THREADS, verbose=False)
-            print(f"[textgen_adapter] LLM 모델 로드 완료")
+            engine = get_llm_engine()
+            messages = _build_messages(plant_name, K, start_cm, unit, periods, good_series, bad_series)
             
-            messages = [
-                {"role":"system","content":"당신은 한국어로 간결하게 조언하는 원예 보조가이드입니다."},
-                {"role":"user","content": (
-                    "아래 데이터(식물명, 성장시나리오)로 8~12문장 내 "
-                    f"{plant_name}의 월별 성장 경향 요약, 관리 팁 4개, 주의사항 3개를 bullet로 제시하세요.\n"
-                    f"- 식물명: {plant_name}\n"
-                    f"- 단위: {unit}, 기간: {periods}\n"
-                    f"- 초기 높이: {start_cm} cm\n"
-                    f"- 상한(추정 K): {K} cm\n"
-                    f"- 좋은 성장(연속값): {good_series}\n"
-                    f"- 나쁜 성장(연속값): {bad_series}\n"
-                    "한국어로 짧고 실무적으로 쓰며, 불필요한 수식어는 피하고, 동일한 사실 반복 금지.\n"
-                    "섹션 제목은 '요약', '관리 팁', '주의할 점'을 사용하세요."
-                )}
-            ]
-            
-            print(f"[textgen_adapter] LLM 생성 호출 (타임아웃: {LLM_TIMEOUT}초)")
+            print(f"[textgen_adapter] LLM 생성 호출 (타임아웃: {LLM_TIMEOUT}초, 모델 로드됨={engine.loaded})")
             content = _llm_call_with_timeout(
-                llm, messages, LLM_MAX_TOKENS, LLM_TEMPERATURE, LLM_TIMEOUT
+                engine, messages, LLM_MAX_TOKENS, LLM_TEMPERATURE, LLM_TIMEOUT
             )
             
             if content:
@@ -87,7 +129,9 @@ def render_plant_analysis(plant_name: str, K: float, start_cm: float, unit: str,
             else:
                 print(f"[textgen_adapter] LLM 생성 실패 또는 타임아웃, 템플릿 폴백 사용")
 
-
+        except EngineBusyError as e:
+            # 대기열 포화 → 기다리지 않고 즉시 템플릿 폴백
+            print(f"[textgen_adapter] {e}, 템플릿 폴백 사용")
         except Exception as e:
             # LLM 실패 시 템플릿 폴백으로 계속 진행
             print(f"[textgen_adapter] LLM 사용 실패, 템플릿 폴백 사용: {e}")
@@ -96,6 +140,44 @@ def render_plant_analysis(plant_name: str, K: float, start_cm: float, unit: str,
             pass
 
     # fallback (no LLM or LLM failed) - 항상 텍스트 반환 보장
+    return _template_analysis(plant_name, K, start_cm, unit, periods, good_series, bad_series)
+
+
+def stream_plant_analysis(plant_name: str, K: float, start_cm: float, unit: str, periods: int, good_series: List[float], bad_series: List[float]) -> Iterator[str]:
+    """
+    render_plant_analysis의 스트리밍 버전. LLM이 생성하는 즉시 텍스트 조각을 반환합니다.
+    LLM을 쓸 수 없거나 첫 토큰 전에 실패/타임아웃되면 템플릿 텍스트를 한 번에 반환합니다.
+    제너레이터를 중간에 닫으면(클라이언트 연결 종료 등) 생성도 중단됩니다.
+    """
+    if not llm_enabled():
+        yield _template_analysis(plant_name, K, start_cm, unit, periods, good_series, bad_series)
+        return
+
+    job = None
+    emitted = False
+    try:
+        engine = get_llm_engine()
+        messages = _build_messages(plant_name, K, start_cm, unit, periods, good_series, bad_series)
+        job = engine.submit(messages, LLM_MAX_TOKENS, LLM_TEMPERATURE, timeout=LLM_TIMEOUT, stream=True)
+        for text in job.iter_tokens():
+            emitted = True
+            yield text
+        if job.status not in ("done", "running"):
+            print(f"[textgen_adapter] LLM 스트리밍 종료 (상태={job.status})")
+    except EngineBusyError as e:
+        print(f"[textgen_adapter] {e}, 템플릿 폴백 사용")
+    except Exception as e:
+        print(f"[textgen_adapter] LLM 스트리밍 실패, 템플릿 폴백 사용: {e}")
+    finally:
+        if job is not None and not job.done:
+            job.cancel()
+
+    if not emitted:
+        yield _template_analysis(plant_name, K, start_cm, unit, periods, good_series, bad_series)
+
+
+def _template_analysis(plant_name: str, K: float, start_cm: float, unit: str, periods: int, good_series: List[float], bad_series: List[float]) -> str:
+    """템플릿 기반 성장 분석 텍스트 (LLM 미사용/실패 시)"""
     tips = [
         "밝은 간접광을 유지하고 흙이 60~70% 마르면 충분히 관수하세요.",
         "배수력 유지(펄라이트/마사 혼합)와 통풍 확보가 중요합니다.",
@@ -0,0 +1,196 @@
+"""
+식물 이름 번역 (영어 → 한국어)
+
+- 요청 하나에서 번역이 필요한 이름을 모아 GPT-4o-mini 한 번 호출로 번역 (JSON 맵 응답)
+- 번역 결과는 SQLite에 저장되어 재시작 후에도 유지되고 워커 간 공유됨
+- 분류기 레이블 목록으로 미리 채워두면(prewarm) 해당 이름은 네트워크를 타지 않음
+"""
+from __future__ import annotations
+
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from app.config import settings
+from app.services.caching import SqliteKVStore
+
+# 저장 키 접두어 (프롬프트/대상 언어가 바뀌면 올려서 기존 번역과 분리)
+_KEY_PREFIX = "ko:v1:"
+# GPT 한 번 호출에 넣을 최대 이름 수
+_BATCH_LIMIT = 50
+
+_memory: Dict[str, str] = {}
+_memory_lock = threading.Lock()  # _memory와 _stats를 함께 보호
+_store: Optional[SqliteKVStore] = None
+_store_lock = threading.Lock()
+_stats = {"memory_hits": 0, "disk_hits": 0, "translated": 0, "llm_calls": 0, "failures": 0}
+
+
+def _get_store() -> Optional[SqliteKVStore]:
+    """번역 저장소를 반환합니다 (처음 한 번만 생성, 실패 시 None → 메모리만 사용)"""
+    global _store
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                path = settings.translation_store_path or str(Path(settings.cache_dir) / "translations.sqlite3")
+                try:
+                    _store = SqliteKVStore(path, table="translations")
+                except Exception as e:
+                    print(f"[번역 저장소] 초기화 실패 (메모리만 사용): {e}")
+                    return None
+    return _store
+
+
+def _translate_batch_with_gpt(names: List[str]) -> Dict[str, str]:
+    """
+    GPT-4o-mini 한 번 호출로 여러 식물 이름을 번역합니다.
+
+    Args:
+        names: 영어 식물 이름 리스트
+
+    Returns:
+        Dict[str, str]: {영어 이름: 한국어 이름} (번역에 실패한 이름은 빠짐)
+    """
+    from app.services.guide import load_openai_client
+
+    client = load_openai_client()
+    if client is None:
+        print(f"[번역 실패] OpenAI 클라이언트 없음: {names}")
+        return {}
+
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {
+                "role": "system",
+                "content": "You are a plant name translator. Translate English plant names to Korean names that are commonly used in South Korea. Respond with a JSON object that maps each given English name (exactly as given) to its Korean name, no additional text."
+            },
+            {
+                "role": "user",
+                "content": f"Translate these plant names to Korean: {json.dumps(names, ensure_ascii=False)}"
+            }
+        ],
+        temperature=0.3,
+        max_tokens=50 + 30 * len(names),
+        response_format={"type": "json_object"},
+    )
+    content = response.choices[0].message.content.strip()
+    json_match = re.search(r'\{[\s\S]*\}', content)
+    mapping = json.loads(json_match.group(0) if json_match else content)
+
+    translated = {}
+    for name in names:
+        value = mapping.get(name)
+        if isinstance(value, str) and value.strip():
+            translated[name] = value.strip()
+    return translated
+
+
+def translate_names(names: Iterable[str]) -> Dict[str, str]:
+    """
+    영어 식물 이름들을 한국어로 번역합니다. 메모리 → 디스크 → GPT(일괄 1회) 순으로 조회합니다.
+
+    Args:
+        names: 영어 식물 이름들
+
+    Returns:
+        Dict[str, str]: {영어 이름: 한국어 이름}. 번역 실패 시 원문을 그대로 사용 (저장하지 않음)
+    """
+    names = [name for name in dict.fromkeys(names) if name]
+    result: Dict[str, str] = {}
+
+    # 1) 메모리
+    missing = []
+    with _memory_lock:
+        for name in names:
+            if name in _memory:
+                result[name] = _memory[name]
+                _stats["memory_hits"] += 1
+            else:
+                missing.append(name)
+    if not missing:
+        return result
+
+    # 2) 디스크 (재시작/다른 워커가 저장한 번역)
+    store = _get_store()
+    if store is not None:
+        try:
+            stored = store.get_many(_KEY_PREFIX + name for name in missing)
+        except Exception as e:
+            print(f"[번역 저장소] 조회 실패: {e}")
+            stored = {}
+        found = {name: stored[_KEY_PREFIX + name] for name in missing if _KEY_PREFIX + name in stored}
+        if found:
+            with _memory_lock:
+                _stats["disk_hits"] += len(found)
+                _memory.update(found)
+            result.update(found)
+            missing = [name for name in missing if name not in found]
+    if not missing:
+        return result
+
+    # 3) GPT 일괄 번역
+    translated: Dict[str, str] = {}
+    for i in range(0, len(missing), _BATCH_LIMIT):
+        chunk = missing[i:i + _BATCH_LIMIT]
+        with _memory_lock:
+            _stats["llm_calls"] += 1
+        try:
+            translated.update(_translate_batch_with_gpt(chunk))
+        except Exception as e:
+            with _memory_lock:
+                _stats["failures"] += 1
+            print(f"[번역 오류] {chunk}: {e}")
+
+    if translated:
+        with _memory_lock:
+            _stats["translated"] += len(translated)
+            _memory.update(translated)
+        if store is not None:
+            try:
+                store.set_many({_KEY_PREFIX + name: value for name, value in translated.items()})
+            except Exception as e:
+                print(f"[번역 저장소] 저장 실패: {e}")
+        for name, value in translated.items():
+            print(f"[GPT 번역] {name} → {value}")
+
+    for name in missing:
+        # 오류 발생 시 원문 반환
+        result[name] = translated.get(name, name)
+    return result
+
+
+def translate_to_korean(text: str) -> str:
+    """
+    영어 식물 이름 하나를 한국어로 번역합니다.
+
+    Args:
+        text: 영어 식물 이름
+
+    Returns:
+        str: 한국어 번역 결과 (실패 시 원문)
+    """
+    return translate_names([text]).get(text, text)
+
+
+def prewarm(names: Iterable[str]) -> int:
+    """
+    이름 목록을 미리 번역해 저장해 둡니다. 이미 저장된 이름은 네트워크를 타지 않습니다.
+
+    Returns:
+        int: 번역된(또는 이미 저장된) 이름 수
+    """
+    names = list(names)
+    result = translate_names(names)
+    return sum(1 for name in names if result.get(name, name) != name)
+
+
+def get_translation_stats() -> dict:
+    """번역 캐시 지표를 반환합니다."""
+    with _memory_lock:
+        stats = dict(_stats)
+        stats["memory_size"] = len(_memory)
+    return stats
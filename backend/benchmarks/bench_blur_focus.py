@@ -0,0 +1,98 @@
+"""
+블러 초점 렌더링(_render_blur_focus) 벤치마크
+
+- legacy: 기존 방식 (전체 해상도 51x51 블러 + 전체 프레임 거리장 + scipy gaussian_filter + float64 3채널 블렌딩)
+- fast: 현재 구현 (축소본 블러 후 확대 + 반지름 방향 조회표 마스크 + 초점 ROI에서만 cv2.blendLinear)
+이미지 크기별 렌더링 시간과 두 결과의 차이(평균 절대 오차, PSNR)를 보고합니다.
+
+실행 (backend 디렉토리에서, opencv 필요 / legacy 비교는 scipy 필요):
+    python -m benchmarks.bench_blur_focus
+    python -m benchmarks.bench_blur_focus --sizes 640x480 1920x1080 4000x3000 --repeat 5
+"""
+import argparse
+import logging
+import time
+
+import cv2
+import numpy as np
+
+from inference import PlantDiseaseDetector
+
+
+def legacy_blur_focus(image, center_x, center_y, focus_radius):
+    from scipy.ndimage import gaussian_filter
+
+    h, w = image.shape[:2]
+    blurred = cv2.GaussianBlur(image, (51, 51), 30)
+    y_coords, x_coords = np.ogrid[:h, :w]
+    distances = np.sqrt((x_coords - center_x)**2 + (y_coords - center_y)**2)
+    mask = np.clip(1.0 - (distances / focus_radius), 0, 1)
+    mask = np.clip(gaussian_filter(mask, sigma=15), 0, 1)
+    mask_3ch = np.stack([mask] * 3, axis=2)
+    return (image * mask_3ch + blurred * (1 - mask_3ch)).astype(np.uint8)
+
+
+def synthetic_image(w: int, h: int) -> np.ndarray:
+    """잎 사진과 비슷한 저주파 배경 + 잡음 (블러 차이가 드러나도록)"""
+    rng = np.random.default_rng(0)
+    small = rng.integers(0, 256, size=(max(h // 32, 2), max(w // 32, 2), 3), dtype=np.uint8)
+    image = cv2.resize(small, (w, h), interpolation=cv2.INTER_CUBIC)
+    noise = rng.integers(-20, 21, size=image.shape, dtype=np.int16)
+    return np.clip(image.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def measure(fn, repeat: int):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="블러 초점 렌더링: 기존 vs 축소본/ROI")
+    parser.add_argument("--sizes", nargs="+", default=["640x480", "1280x960", "1920x1080", "4000x3000"])
+    parser.add_argument("--bbox-fraction", type=float, default=0.25, help="bbox 한 변 / 이미지 짧은 변")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger("inference").setLevel(logging.WARNING)  # 단계별 로그 생략
+    detector = PlantDiseaseDetector.__new__(PlantDiseaseDetector)  # 모델 로드 없이 렌더링만 측정
+    try:
+        import scipy  # noqa: F401
+        has_scipy = True
+    except ImportError:
+        has_scipy = False
+        print("scipy 없음: legacy 비교 생략")
+
+    for size in args.sizes:
+        w, h = (int(v) for v in size.lower().split("x"))
+        image = synthetic_image(w, h)
+        side = int(min(w, h) * args.bbox_fraction)
+        x1, y1 = w // 2 - side // 2, h // 2 - side // 2
+        detection = {"name": "Tomato Early blight leaf", "confidence": 0.9, "bbox": [x1, y1, x1 + side, y1 + side]}
+
+        fast_ms, fast = measure(
+            lambda: detector._render_blur_focus(image, detection, "high_confidence"), args.repeat
+        )
+        line = f"{w:>5}x{h:<5} ({w * h / 1e6:5.1f}MP): fast {fast_ms:8.1f}ms"
+        if has_scipy:
+            radius = int(int(np.sqrt(side**2 + side**2)) * 0.6)
+            cx, cy = x1 + side // 2, y1 + side // 2
+            legacy_ms, legacy = measure(lambda: legacy_blur_focus(image, cx, cy, radius), args.repeat)
+            # 테두리/중심점은 두 방식 모두 같은 위치에 그리므로 블렌딩 결과만 비교
+            ring = np.zeros((h, w), dtype=np.uint8)
+            cv2.circle(ring, (cx, cy), radius + 10, 255, 16)
+            cv2.circle(ring, (cx, cy), 8, 255, -1)
+            valid = ring == 0
+            diff = np.abs(fast.astype(np.int16) - legacy.astype(np.int16))[valid]
+            mse = float(np.mean(diff.astype(np.float64) ** 2))
+            psnr = float("inf") if mse == 0 else 10 * np.log10(255**2 / mse)
+            line += (f" | legacy {legacy_ms:8.1f}ms | x{legacy_ms / fast_ms:6.1f}"
+                     f" | mean abs diff {diff.mean():5.2f} PSNR {psnr:5.1f}dB")
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+성장 기록 일괄 수집 처리량 벤치마크 (records/second)
+
+- single: 기록마다 저장 (기존 /update-growth를 기록 수만큼 호출하는 것과 같은 저장 경로)
+- bulk: app.services.growth_ingest (본문 파싱 + 기록별 검증 + 트랜잭션 한 번 저장)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_bulk_ingest
+    python -m benchmarks.bench_bulk_ingest --records 100000 --plants 200 --backend sqlite json
+"""
+import argparse
+import json
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from app.services.growth_ingest import ingest_growth_records, parse_growth_payload
+from app.services.storage import JsonStorage, SqliteStorage
+
+
+def make_payload(records: int, plants: int, ndjson: bool) -> bytes:
+    base = date(2024, 1, 1)
+    items = [
+        {"plant_id": f"device-{i % plants}", "date": (base + timedelta(days=i // plants)).isoformat(),
+         "height": round(5 + (i // plants) * 0.1, 2)}
+        for i in range(records)
+    ]
+    if ndjson:
+        return "\n".join(json.dumps(item) for item in items).encode()
+    return json.dumps(items).encode()
+
+
+def make_storage(backend: str, directory: Path):
+    if backend == "json":
+        return JsonStorage(directory / "identifications.json", directory / "growth_history.json",
+                           journal_compact_threshold=10_000_000)
+    return SqliteStorage(directory / "bench.sqlite3")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="성장 기록 일괄 수집 벤치마크")
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--plants", type=int, default=100)
+    parser.add_argument("--single", type=int, default=2_000, help="single 방식으로 저장할 기록 수 (느림)")
+    parser.add_argument("--backend", nargs="+", default=["sqlite", "json"])
+    args = parser.parse_args()
+
+    print(f"records={args.records} plants={args.plants}")
+    print(f"{'backend':>7} {'mode':>12} {'records':>9} {'seconds':>9} {'records/s':>12}")
+    for backend in args.backend:
+        for mode in ("single", "bulk-json", "bulk-ndjson"):
+            with tempfile.TemporaryDirectory() as tmp:
+                storage = make_storage(backend, Path(tmp))
+                if mode == "single":
+                    items = parse_growth_payload(make_payload(args.single, args.plants, ndjson=False))
+                    start = time.perf_counter()
+                    for item in items:
+                        storage.save_growth(item["plant_id"], item["date"], item["height"])
+                    count = len(items)
+                else:
+                    payload = make_payload(args.records, args.plants, ndjson=(mode == "bulk-ndjson"))
+                    content_type = "application/x-ndjson" if mode == "bulk-ndjson" else "application/json"
+                    start = time.perf_counter()
+                    result = ingest_growth_records(parse_growth_payload(payload, content_type),
+                                                   save_fn=storage.save_growth_many)
+                    count = result["accepted"]
+                elapsed = time.perf_counter() - start
+                print(f"{backend:>7} {mode:>12} {count:>9,} {elapsed:>9.3f} {count / elapsed:>12,.0f}")
+                if backend == "json":
+                    storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+병충해 감지 처리량 벤치마크 (images/s)
+
+- sequential: 기존 방식 (이미지마다 detect_image → YOLO 순전파 1회/장)
+- batch: detect_batch (batch_size장씩 YOLO 순전파 한 번)
+각각 렌더링(원본/결과 이미지 base64) 포함/생략으로 측정하고, 배치 결과가 순차 결과와 같은지 확인합니다.
+
+실행 (backend 디렉토리에서, ultralytics/opencv 및 모델 파일 필요):
+    python -m benchmarks.bench_detect_batch
+    python -m benchmarks.bench_detect_batch --images ./samples --batch-size 16 --repeat 3
+    python -m benchmarks.bench_detect_batch --count 64 --size 640
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from inference import PlantDiseaseDetector, decode_image
+
+
+def load_images(directory, count: int, size: int):
+    """디렉토리의 이미지(인코딩된 바이트)를 읽거나, 없으면 합성 이미지를 만듭니다."""
+    if directory:
+        paths = sorted(
+            p for p in Path(directory).iterdir()
+            if p.suffix.lower() in {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+        )
+        images = [decode_image(p.read_bytes()) for p in paths[:count]]
+        return [img for img in images if img is not None]
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, size=(size, size, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def summarize(results):
+    return [
+        (r["detection_count"], r["diagnosis_status"], [(d["name"], round(d["confidence"], 3)) for d in r["diseases"]])
+        for r in results
+    ]
+
+
+def measure(fn, repeat: int):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="병충해 감지: 순차 vs 배치 처리량")
+    parser.add_argument("--model", default="models/plant_disease.pt")
+    parser.add_argument("--images", default=None, help="이미지 디렉토리 (없으면 합성 이미지)")
+    parser.add_argument("--count", type=int, default=32)
+    parser.add_argument("--size", type=int, default=640, help="합성 이미지 한 변 크기")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--conf", type=float, default=0.01)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    detector = PlantDiseaseDetector(disease_model_path=args.model)
+    if detector.disease_model is None:
+        raise SystemExit(f"모델을 로드할 수 없습니다: {args.model}")
+    images = load_images(args.images, args.count, args.size)
+    print(f"images={len(images)} batch_size={args.batch_size} repeat={args.repeat}")
+
+    # 워밍업 (모델 초기화/커널 선택 시간 제외)
+    detector.detect_batch(images[:args.batch_size], conf_threshold=args.conf, render_images=False)
+
+    for render in (True, False):
+        seq_s, seq_out = measure(
+            lambda: [detector.detect_image(img, conf_threshold=args.conf, render_images=render) for img in images],
+            args.repeat,
+        )
+        batch_s, batch_out = measure(
+            lambda: detector.detect_batch(
+                images, conf_threshold=args.conf, render_images=render, batch_size=args.batch_size
+            ),
+            args.repeat,
+        )
+        label = "render" if render else "no-render"
+        print(f"{label:>10}: sequential {len(images) / seq_s:8.1f} img/s | "
+              f"batch {len(images) / batch_s:8.1f} img/s | x{seq_s / batch_s:5.2f} | "
+              f"results match={summarize(seq_out) == summarize(batch_out)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+성장 예측 모델 일괄 적합 벤치마크
+
+식물 수천 개에 로지스틱 곡선을 맞추는 배치 작업 시간을 측정합니다.
+- cold: 처음 적합 (K 후보 전체 격자)
+- warm: 모든 식물에 새 기록 하루치 추가 후 재적합 (이전 K 주변 좁은 격자)
+- cached: 기록 변화 없이 다시 요청 (버전 일치 → 캐시)
+- plateau: 키가 그대로인(정체) 기록의 예측이 마지막 키 근처에 머무는지 확인 (실패 시 종료 코드 1)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_forecast
+    python -m benchmarks.bench_forecast --plants 10000 --days 120
+"""
+import argparse
+import time
+from datetime import date
+
+import numpy as np
+
+from app.services.forecast import fit_many, forecast
+from app.services.growth_series import GrowthSeries
+
+_BASE = date(2024, 1, 1).toordinal()
+
+
+def logistic_height(t: np.ndarray, K: float, r: float, t0: float) -> np.ndarray:
+    return K / (1.0 + np.exp(-r * (t - t0)))
+
+
+def build_series(plants: int, days: int, rng: np.random.Generator) -> dict:
+    t = np.arange(days, dtype=np.float64)
+    data = {}
+    for p in range(plants):
+        K, r, t0 = rng.uniform(20, 120), rng.uniform(0.03, 0.15), rng.uniform(20, 80)
+        heights = np.maximum(logistic_height(t, K, r, t0) + rng.normal(0, 0.5, days), 0.1)
+        data[f"plant-{p}"] = GrowthSeries.from_columns(_BASE + t.astype(np.int64), heights)
+    return data
+
+
+def timed(label: str, data: dict):
+    start = time.perf_counter()
+    models = fit_many(data)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:>6}: {elapsed:8.3f}s  {len(data) / elapsed:>10,.0f} plants/s")
+    return models
+
+
+def main():
+    parser = argparse.ArgumentParser(description="성장 예측 모델 일괄 적합 벤치마크")
+    parser.add_argument("--plants", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    data = build_series(args.plants, args.days, rng)
+    print(f"plants={args.plants} days={args.days}")
+
+    models = timed("cold", data)
+    for series in data.values():
+        _, heights = series.columns()
+        series.upsert(_BASE + args.days, float(heights[-1]) + 0.2)
+    timed("warm", data)
+    timed("cached", data)
+
+    sigmas = np.array([m.sigma for m in models.values() if m is not None])
+    print(f"  residual sigma median={np.median(sigmas):.3f}cm p95={np.percentile(sigmas, 95):.3f}cm (noise 0.5cm)")
+
+    if not check_plateau(rng):
+        raise SystemExit(1)
+
+
+def check_plateau(rng: np.random.Generator) -> bool:
+    """정체 기록(완전히 평평 / 아주 작은 잡음 / 미세한 증가)의 7일 예측이 30cm 근처인지 확인합니다."""
+    t = np.arange(8, dtype=np.int64)
+    cases = {
+        "flat": np.full(8, 30.0),
+        "flat+noise": 30.0 + rng.normal(0, 1e-9, 8),
+        "near-flat": 30.0 + 1e-7 * t,
+    }
+    ok = True
+    for name, heights in cases.items():
+        result = forecast(f"plateau-{name}", GrowthSeries.from_columns(_BASE + t, heights), horizon_days=7)
+        last = result["prediction"][-1]
+        params = result["model"]["params"]
+        passed = abs(last["height"] - 30.0) < 0.5 and np.isfinite(list(params.values())).all()
+        ok &= passed
+        print(f"  plateau {name:>10}: {result['model']['method']:>8} day+7={last['height']:.2f}cm "
+              f"[{last['lower']:.2f}, {last['upper']:.2f}] {'OK' if passed else 'FAIL'}")
+    return ok
+
+
+if __name__ == "__main__":
+    main()
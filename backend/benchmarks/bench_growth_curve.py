@@ -0,0 +1,78 @@
+"""
+성장 예측 그래프 곡선 계산 벤치마크
+
+- loop: 기존 방식 (기간마다 math.exp 스칼라 계산 + 곡선마다 GrowthGraphPoint 생성)
+- numpy: app.services.growth_curve (시나리오 × 기간 브로드캐스트 한 번, 응답 직전에만 pydantic 변환)
+- numpy-raw: 배치 재계산용 (pydantic 변환 없이 배열만)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_growth_curve
+    python -m benchmarks.bench_growth_curve --max-periods 520 --repeat 200
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+from app.models.schemas import GrowthGraphPoint
+from app.services.growth_curve import compute_growth_curves, growth_periods, to_graph_points
+
+_SEED, _INITIAL, _MAX = 0.42, 8.5, 48.0
+
+
+def legacy_curve(periods, period_unit, max_periods, multiplier):
+    points = []
+    for period in periods:
+        if period_unit == "week":
+            k = (0.15 + 0.1 * _SEED) * multiplier
+            x0 = (8.0 - 4.0 * _SEED) * multiplier
+            normalized_period = period / max_periods * 24
+        else:
+            k = (0.35 + 0.2 * _SEED) * multiplier
+            x0 = (3.0 - 1.5 * _SEED) * multiplier
+            normalized_period = period
+        growth_index = 1.0 / (1.0 + math.exp(-k * (normalized_period - x0)))
+        current_size = _INITIAL + (_MAX - _INITIAL) * growth_index
+        current_size += (_SEED * 0.1 - 0.05) * current_size
+        current_size = max(_INITIAL * 0.8, min(current_size, _MAX * 1.1))
+        points.append(GrowthGraphPoint(period=period, size=round(current_size, 1)))
+    return points
+
+
+def bench(label, fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    print(f"  {label:>10}: {(time.perf_counter() - start) / repeat * 1e6:10.1f}us")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="성장 곡선 계산 벤치마크")
+    parser.add_argument("--max-periods", type=int, default=104)
+    parser.add_argument("--repeat", type=int, default=500)
+    parser.add_argument("--scenarios", type=int, default=2, help="시나리오(성장률 배수) 수")
+    args = parser.parse_args()
+
+    multipliers = list(np.linspace(1.3, 0.7, args.scenarios)) if args.scenarios > 2 else [1.3, 0.7]
+    for period_unit in ("month", "week"):
+        # week는 기존 방식과 동일하게 최대 12개 간격, 배치 재계산은 모든 기간
+        for periods in (growth_periods(period_unit, args.max_periods), list(range(args.max_periods + 1))):
+            print(f"{period_unit}: periods={len(periods)} scenarios={len(multipliers)}")
+            legacy = bench("loop", lambda: [
+                legacy_curve(periods, period_unit, args.max_periods, m) for m in multipliers
+            ], args.repeat)
+            fast = bench("numpy", lambda: [
+                to_graph_points(periods, sizes) for sizes in compute_growth_curves(
+                    _SEED, _INITIAL, _MAX, periods, period_unit, args.max_periods, multipliers)
+            ], args.repeat)
+            bench("numpy-raw", lambda: compute_growth_curves(
+                _SEED, _INITIAL, _MAX, periods, period_unit, args.max_periods, multipliers), args.repeat)
+            assert legacy == fast, "결과 불일치"
+            if period_unit == "month":
+                break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+성장 기록 메모리 표현 벤치마크
+
+기존 표현(식물별 [{"date": str, "height": float}, ...] 리스트)과
+app.services.growth_series.GrowthSeries(날짜 ordinal/높이 병렬 배열)의
+측정값당 메모리, 범위 조회 시간을 비교합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_growth_series
+    python -m benchmarks.bench_growth_series --plants 1000 --days 730
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from app.services.growth_series import GrowthSeries, date_to_ordinal
+
+_BASE = date(2023, 1, 1)
+
+
+def build_dicts(plants: int, days: int) -> dict:
+    return {
+        f"plant-{p}": [
+            {"date": (_BASE + timedelta(days=d)).isoformat(), "height": 5.0 + d * 0.1 + p}
+            for d in range(days)
+        ]
+        for p in range(plants)
+    }
+
+
+def build_series(plants: int, days: int) -> dict:
+    base = _BASE.toordinal()
+    data = {}
+    for p in range(plants):
+        series = GrowthSeries()
+        series.upsert_many(range(base, base + days), (5.0 + d * 0.1 + p for d in range(days)))
+        data[f"plant-{p}"] = series
+    return data
+
+
+def measure_memory(builder, plants: int, days: int):
+    tracemalloc.start()
+    data = builder(plants, days)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return data, current / (plants * days)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="성장 기록 메모리 표현 벤치마크")
+    parser.add_argument("--plants", type=int, default=200)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    dicts, dict_bytes = measure_memory(build_dicts, args.plants, args.days)
+    series, series_bytes = measure_memory(build_series, args.plants, args.days)
+    print(f"plants={args.plants} days={args.days} readings={args.plants * args.days:,}")
+    print(f"  bytes/reading   list[dict]: {dict_bytes:8.1f}   GrowthSeries: {series_bytes:8.1f}")
+
+    # 최근 30일 범위 조회 (기존: 정렬 + 문자열 비교 필터 / 신규: 이분 탐색 뷰)
+    start = (_BASE + timedelta(days=args.days - 30)).isoformat()
+    end = (_BASE + timedelta(days=args.days - 1)).isoformat()
+    plant = "plant-0"
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        rows = sorted(dicts[plant], key=lambda x: x["date"])
+        legacy = [r for r in rows if start <= r["date"] <= end]
+    legacy_us = (time.perf_counter() - t0) / args.repeat * 1e6
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        view = series[plant].range(date_to_ordinal(start), date_to_ordinal(end))
+    series_us = (time.perf_counter() - t0) / args.repeat * 1e6
+    assert len(view) == len(legacy)
+    print(f"  30-day range    list[dict]: {legacy_us:8.1f}us  GrowthSeries: {series_us:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
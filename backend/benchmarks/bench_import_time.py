@@ -0,0 +1,97 @@
+"""
+서버 콜드 스타트 import 시간 측정 (python -X importtime)
+
+새 인터프리터에서 `import app.main`을 실행해
+- 전체 import 시간 (여러 번 실행 중 중앙값)과 예산(--budget-ms) 비교
+- 누적 시간 상위 모듈 목록
+- 시작 시 import되면 안 되는 무거운 모듈(torch/transformers/diffusers/ultralytics/cv2/scipy/openai) 적재 여부
+를 보고합니다. 예산 초과 또는 무거운 모듈이 import되면 종료 코드 1.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --budget-ms 1500 --top 25 --repeat 5
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from app.services.lazy_imports import HEAVY_MODULES
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+# 콜드 스타트 목표: 무거운 ML 모듈 없이 FastAPI + 라우터 import
+DEFAULT_BUDGET_MS = 1500.0
+
+
+def run_importtime(target: str):
+    """
+    -X importtime으로 target을 import하고 (모듈별 self/누적 us, 전체 경과 ms)를 반환합니다.
+    """
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        tail = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")][-10:]
+        raise RuntimeError(f"import {target} 실패:\n" + "\n".join(tail))
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules, elapsed_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 콜드 스타트 import 시간 측정")
+    parser.add_argument("--target", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    runs = [run_importtime(args.target) for _ in range(args.repeat)]
+    modules, _ = runs[-1]
+    wall_ms = statistics.median(elapsed for _, elapsed in runs)
+    import_ms = statistics.median(
+        sum(cumulative for _, cumulative, depth in mods.values() if depth == 0) / 1000 for mods, _ in runs
+    )
+
+    print(f"import {args.target}: imports={import_ms:.0f}ms  process={wall_ms:.0f}ms  "
+          f"budget={args.budget_ms:.0f}ms  modules={len(modules)}")
+    print(f"\n누적 시간 상위 {args.top}개 ({args.target} 제외, 들여쓰기 = import 깊이):")
+    top = sorted(
+        ((cum, depth, name) for name, (_, cum, depth) in modules.items() if name != args.target),
+        reverse=True,
+    )
+    for cumulative, depth, name in top[:args.top]:
+        print(f"  {cumulative / 1000:9.1f}ms  {'  ' * depth}{name}")
+
+    heavy = [name for name in HEAVY_MODULES if name in modules]
+    print("\n무거운 모듈:")
+    for name in HEAVY_MODULES:
+        if name in modules:
+            print(f"  {name:<13} import됨 ({modules[name][1] / 1000:.1f}ms)")
+        else:
+            print(f"  {name:<13} 지연됨")
+
+    failures = []
+    if import_ms > args.budget_ms:
+        failures.append(f"import 시간 {import_ms:.0f}ms > 예산 {args.budget_ms:.0f}ms")
+    if heavy:
+        failures.append(f"시작 시 무거운 모듈 import: {', '.join(heavy)}")
+    if failures:
+        print("\nFAIL: " + "; ".join(failures))
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
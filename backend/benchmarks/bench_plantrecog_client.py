@@ -0,0 +1,120 @@
+"""
+PlantRecog 클라이언트 벤치마크 (로컬 스텁 서버 사용)
+
+요청마다 새 연결을 여는 기존 방식(requests.post)과
+app.services.plantrecog_client(공유 커넥션 풀)를 비교하고,
+스텁 서버가 실패할 때 재시도/회로 차단기 동작을 보여줍니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_plantrecog_client
+    python -m benchmarks.bench_plantrecog_client --requests 200 --concurrency 16 --latency-ms 20
+"""
+import argparse
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from app.services.plantrecog_client import CircuitBreaker, CircuitOpenError, PlantRecogClient
+
+_RESPONSE = json.dumps({
+    "message": "Success",
+    "payload": {"predictions": [{"name": "rose", "score": 0.91}, {"name": "tulip", "score": 0.05}]},
+}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """PlantRecog /predict 스텁 (지연 시간, 실패 모드 설정 가능)"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive
+    latency = 0.0
+    fail = False
+
+    def setup(self):
+        super().setup()
+        # 헤더와 본문이 따로 전송되므로 Nagle + 지연 ACK로 keep-alive 연결에서 ~40ms 지연되지 않도록 함
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.latency)
+        status, body = (503, b"{}") if self.fail else (200, _RESPONSE)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(latency_ms: float):
+    StubHandler.latency = latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def run_load(fn, total: int, concurrency: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda _: fn(), range(total)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PlantRecog 클라이언트 벤치마크")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="스텁 서버 응답 지연")
+    args = parser.parse_args()
+
+    server, url = start_stub(args.latency_ms)
+    image = b"\xff\xd8" + b"\x00" * 200_000  # 200KB 페이로드
+
+    def legacy():
+        files = {"image": ("plant.jpg", image, "image/jpeg")}
+        return requests.post(f"{url}/predict", files=files, timeout=30).json()
+
+    client = PlantRecogClient(url, max_retries=2, retry_backoff=0.05,
+                              breaker=CircuitBreaker(failure_threshold=5, reset_timeout=1.0))
+
+    def pooled():
+        return client.predict_sync(image)
+
+    print(f"stub={url} requests={args.requests} concurrency={args.concurrency} latency={args.latency_ms}ms")
+    for name, fn in (("requests.post", legacy), ("pooled client", pooled)):
+        fn()  # 워밍업
+        elapsed = run_load(fn, args.requests, args.concurrency)
+        print(f"  {name:<14} {elapsed:7.3f}s  {args.requests / elapsed:8.1f} req/s")
+    print(f"  latency histogram: {client.latency.snapshot()['buckets']}")
+
+    # 실패 모드: 재시도 후 회로 차단기가 열려 원격 호출을 건너뛰는지 확인
+    StubHandler.fail = True
+    outcomes = {"failed": 0, "short_circuited": 0}
+    start = time.perf_counter()
+    for _ in range(20):
+        try:
+            pooled()
+        except CircuitOpenError:
+            outcomes["short_circuited"] += 1
+        except RuntimeError:
+            outcomes["failed"] += 1
+    print(f"  failing stub: {outcomes} in {time.perf_counter() - start:.3f}s, circuit={client.breaker.stats()}")
+
+    StubHandler.fail = False
+    time.sleep(1.1)
+    pooled()
+    print(f"  after reset timeout: circuit={client.breaker.stats()['state']}")
+
+    client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+분류기 전처리 마이크로 벤치마크
+
+기존 경로(전체 해상도 디코딩 + LANCZOS + float64 중간 배열)와
+app.services.preprocess(draft 축소 디코딩 + float32 in-place)를 비교합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_preprocess
+    python -m benchmarks.bench_preprocess --sizes 4000x3000 1920x1080 --repeat 20
+"""
+import argparse
+import time
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from app.services.preprocess import preprocess_to_array
+
+
+def legacy_preprocess(image: bytes) -> np.ndarray:
+    """변경 전 classify_plant의 전처리 (비교 기준)"""
+    img = Image.open(BytesIO(image))
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    img_resized = img.resize((224, 224), Image.Resampling.LANCZOS)
+    img_array = np.array(img_resized).astype(np.float32) / 255.0
+    mean = np.array([0.5, 0.5, 0.5])
+    std = np.array([0.5, 0.5, 0.5])
+    img_array = (img_array - mean) / std
+    img_array = np.transpose(img_array, (2, 0, 1))
+    return np.array(img_array, dtype=np.float32)[None]
+
+
+def make_jpeg(width: int, height: int, quality: int = 90) -> bytes:
+    """사진과 비슷한 부드러운 그라데이션 + 노이즈 JPEG를 생성합니다."""
+    rng = np.random.default_rng(0)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    x = np.linspace(0, 255, width, dtype=np.float32)[None, :]
+    base = np.stack([x + 0 * y, y + 0 * x, (x + y) / 2], axis=2)
+    noise = rng.normal(0, 12, size=(height, width, 3)).astype(np.float32)
+    pixels = np.clip(base + noise, 0, 255).astype(np.uint8)
+    buf = BytesIO()
+    Image.fromarray(pixels).save(buf, format="JPEG", quality=quality)
+    return buf.getvalue()
+
+
+def bench(fn, data: bytes, repeat: int) -> float:
+    fn(data)  # 워밍업
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(data)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분류기 전처리 벤치마크")
+    parser.add_argument("--sizes", nargs="+", default=["4000x3000", "1920x1080", "640x480"])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'legacy ms':>10} {'new ms':>10} {'speedup':>8} {'max |diff|':>11}")
+    for size in args.sizes:
+        width, height = (int(v) for v in size.lower().split("x"))
+        data = make_jpeg(width, height)
+        legacy_ms = bench(legacy_preprocess, data, args.repeat)
+        new_ms = bench(preprocess_to_array, data, args.repeat)
+        diff = float(np.abs(legacy_preprocess(data) - preprocess_to_array(data)).max())
+        print(f"{size:>10} {legacy_ms:>10.2f} {new_ms:>10.2f} {legacy_ms / new_ms:>7.1f}x {diff:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
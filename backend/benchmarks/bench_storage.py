@@ -0,0 +1,97 @@
+"""
+저장소 쓰기 비용 벤치마크
+
+저장된 기록 수가 늘어날 때 기록 하나를 저장하는 비용을 측정합니다.
+- json: 식물 분석 데이터는 파일 전체를 다시 씀 (기록 수에 비례),
+        성장 기록은 추가 전용 저널 + fsync 그룹 커밋 (거의 일정)
+- sqlite: app.services.storage.SqliteStorage (WAL, 행 단위 트랜잭션 → 거의 일정)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_storage
+    python -m benchmarks.bench_storage --max 1000000 --json-max 20000 --writes 200
+"""
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from app.services.storage import JsonStorage, SqliteStorage
+
+_BASE_DATE = date(2020, 1, 1)
+
+
+def make_records(start: int, count: int, plants: int = 1000):
+    """(plant_id, date, height) 기록 생성 (식물 plants개에 날짜가 하루씩 늘어남)"""
+    for i in range(start, start + count):
+        plant, day = divmod(i, plants)[::-1]
+        yield f"plant-{plant}", (_BASE_DATE + timedelta(days=day)).isoformat(), 10.0 + i % 97
+
+
+def make_identification(i: int) -> dict:
+    return {
+        "id": f"식물{i % 500}_{i:012d}",
+        "timestamp": f"2025-01-01T00:00:00.{i:06d}",
+        "file_hash": None,
+        "identification": {"plant_name": f"식물{i % 500}", "scientific_name": None,
+                           "confidence": 0.9, "common_names": []},
+    }
+
+
+def measure_writes(storage, start: int, writes: int) -> dict:
+    """기록을 하나씩 저장하며 건당 시간(ms)의 중앙값을 잽니다 (성장 기록, 식물 분석 데이터)."""
+    growth, ident = [], []
+    for offset, (plant_id, day, height) in enumerate(make_records(start, writes)):
+        t0 = time.perf_counter()
+        storage.save_growth(plant_id, day, height)
+        growth.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        storage.save_identification(make_identification(start + offset))
+        ident.append(time.perf_counter() - t0)
+    return {"growth_ms": float(np.median(growth)) * 1000, "ident_ms": float(np.median(ident)) * 1000}
+
+
+def checkpoints(maximum: int):
+    sizes, size = [0], 1000
+    while size <= maximum:
+        sizes.append(size)
+        size *= 10
+    if sizes[-1] != maximum:
+        sizes.append(maximum)
+    return sizes
+
+
+def run(name: str, storage, maximum: int, writes: int):
+    filled = 0
+    for size in checkpoints(maximum):
+        # 다음 측정 지점까지 한 번에 채움 (측정 대상 아님)
+        while filled < size:
+            chunk = min(50_000, size - filled)
+            storage.save_growth_many(make_records(filled, chunk))
+            storage.save_identifications(make_identification(i) for i in range(filled, filled + chunk))
+            filled += chunk
+        result = measure_writes(storage, 10_000_000 + size, writes)
+        filled += writes
+        print(f"{name:>7} {size:>10,} {result['growth_ms']:>12.3f} {result['ident_ms']:>12.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장소 쓰기 비용 벤치마크")
+    parser.add_argument("--max", type=int, default=1_000_000, help="SQLite 최대 기록 수")
+    parser.add_argument("--json-max", type=int, default=10_000, help="JSON 최대 기록 수 (느림)")
+    parser.add_argument("--writes", type=int, default=100, help="측정 지점마다 저장할 기록 수")
+    args = parser.parse_args()
+
+    print(f"{'backend':>7} {'records':>10} {'growth ms':>12} {'ident ms':>12}   (건당 중앙값)")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        run("json", JsonStorage(tmp / "identifications.json", tmp / "growth_history.json"),
+            args.json_max, max(5, args.writes // 10))
+        run("sqlite", SqliteStorage(tmp / "bench.sqlite3"), args.max, args.writes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+/api/detect 동시 부하 중 /health 응답 지연 측정
+
+동시 감지 요청(기본 20개)을 보내는 동안 /health를 주기적으로 호출해 지연 시간을 기록합니다.
+감지 추론과 LLM 조언이 이벤트 루프를 막지 않으면 /health 지연은 부하가 없을 때와 거의 같습니다.
+
+- 기본: 앱을 프로세스 안(httpx ASGITransport)에서 실행하고, 감지 모델/LLM은 지연만 흉내 내는 가짜로 교체
+  (--detect-ms 동안 블로킹, --advice-ms 동안 비동기 대기)
+  /bench/detect-inline: 비교용으로 기존처럼 async 핸들러 안에서 직접 블로킹 호출하는 경로
+- --url: 실행 중인 서버에 실제 이미지(--image)로 부하
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.load_detect_health
+    python -m benchmarks.load_detect_health --concurrency 20 --detect-ms 300 --advice-ms 500
+    python -m benchmarks.load_detect_health --url http://127.0.0.1:8000 --image sample.jpg
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from pathlib import Path
+
+import httpx
+
+
+class FakeDetector:
+    """감지 모델 대신 지정 시간 동안 블로킹하는 가짜"""
+
+    disease_model = object()
+
+    def __init__(self, detect_ms: float):
+        self.detect_ms = detect_ms
+
+    def detect_image(self, image, conf_threshold=0.01, filter_by_confidence=True, **render):
+        time.sleep(self.detect_ms / 1000)
+        return {
+            "diagnosis_status": "high_confidence",
+            "max_confidence": 0.9,
+            "detection_count": 1,
+            "species": "Tomato",
+            "species_confidence": 0.9,
+            "diseases": [{"name": "Early blight", "species": "Tomato", "confidence": 0.9, "bbox": [0, 0, 1, 1]}],
+            "result_image": None,
+            "original_image": None,
+        }
+
+
+class FakeAdvisor:
+    """OpenAI 호출 대신 지정 시간 동안 대기하는 가짜 (sync: 블로킹, async: 비동기)"""
+
+    def __init__(self, advice_ms: float):
+        self.advice_ms = advice_ms
+
+    def get_treatment_advice(self, **kwargs):
+        time.sleep(self.advice_ms / 1000)
+        return "advice"
+
+    async def get_treatment_advice_async(self, **kwargs):
+        await asyncio.sleep(self.advice_ms / 1000)
+        return "advice"
+
+
+def build_local_app(detect_ms: float, advice_ms: float):
+    from fastapi import File, UploadFile
+
+    import app.main as main
+
+    detector, advisor = FakeDetector(detect_ms), FakeAdvisor(advice_ms)
+    main._HAS_DETECTOR = True
+    main._HAS_ADVISOR = True
+    main.get_detector = lambda: detector
+    main.get_advisor = lambda: advisor
+    main.is_detector_loaded = lambda: True
+    main.decode_image = lambda data: data  # 디코딩 생략 (가짜 모델은 이미지를 보지 않음)
+
+    @main.app.post("/bench/detect-inline")
+    async def detect_inline(file: UploadFile = File(...)):
+        # 비교용: 변경 전처럼 이벤트 루프에서 직접 블로킹 호출
+        await file.read()
+        result = detector.detect_image(b"")
+        advisor.get_treatment_advice(plant_species="Tomato", disease="Early blight", confidence=0.9)
+        return {"success": True, "detection_count": result["detection_count"]}
+
+    return main.app
+
+
+async def probe_health(client: httpx.AsyncClient, stop: asyncio.Event, interval: float):
+    """
+    /health 지연 = 호출 예정 시각부터 응답까지 (이벤트 루프가 막혀 호출이 늦어진 시간도 포함)
+    """
+    latencies = []
+    due = time.perf_counter()
+    while True:
+        response = await client.get("/health")
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - due) * 1000)
+        if stop.is_set():
+            return latencies
+        due = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+
+
+async def run_phase(client: httpx.AsyncClient, path: str, image: bytes, concurrency: int, interval: float):
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_health(client, stop, interval))
+    start = time.perf_counter()
+    if concurrency:
+        files = lambda: {"file": ("leaf.jpg", image, "image/jpeg")}
+        responses = await asyncio.gather(*(client.post(path, files=files()) for _ in range(concurrency)))
+        failed = sum(r.status_code != 200 for r in responses)
+    else:
+        await asyncio.sleep(1.0)
+        failed = 0
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return await probe, elapsed, failed
+
+
+def summarize(label: str, latencies, elapsed: float, failed: int):
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:>16}: /health n={len(ordered):4d} p50={statistics.median(ordered):7.1f}ms "
+          f"p95={p95:7.1f}ms max={ordered[-1]:7.1f}ms | detect batch {elapsed:6.2f}s failed={failed}")
+
+
+async def main_async(args):
+    image = Path(args.image).read_bytes() if args.image else b"\xff\xd8" + b"\x00" * 100_000
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=300)
+        phases = [("idle", None, 0), ("detect", "/api/detect", args.concurrency)]
+    else:
+        app = build_local_app(args.detect_ms, args.advice_ms)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=300)
+        phases = [
+            ("idle", None, 0),
+            ("detect", "/api/detect", args.concurrency),
+            ("detect-inline", "/bench/detect-inline", args.concurrency),
+        ]
+
+    print(f"concurrency={args.concurrency} detect_ms={args.detect_ms} advice_ms={args.advice_ms}")
+    async with client:
+        for label, path, concurrency in phases:
+            latencies, elapsed, failed = await run_phase(client, path, image, concurrency, args.interval_ms / 1000)
+            summarize(label, latencies, elapsed, failed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/api/detect 부하 중 /health 지연 측정")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--detect-ms", type=float, default=200.0, help="가짜 감지 추론 시간")
+    parser.add_argument("--advice-ms", type=float, default=300.0, help="가짜 LLM 조언 시간")
+    parser.add_argument("--interval-ms", type=float, default=20.0, help="/health 호출 간격")
+    parser.add_argument("--url", default=None, help="실행 중인 서버 주소 (없으면 프로세스 안에서 실행)")
+    parser.add_argument("--image", default=None, help="--url 사용 시 업로드할 이미지")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
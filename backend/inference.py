@@ -5,28 +5,187 @@ YOLOv8 단일 모델 추론 로직
 """
 import os
 import base64
-import cv2
 import re
+import threading
 import numpy as np
 from pathlib import Path
-from ultralytics import YOLO
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional, Union
 from collections import Counter
+from functools import lru_cache
 import logging
-import torch
-from scipy.ndimage import gaussian_filter
 
-# PyTorch 2.6+ 호환성: Ultralytics 클래스를 안전한 글로벌로 등록
-try:
-    from ultralytics.nn.tasks import DetectionModel, ClassificationModel
-    torch.serialization.add_safe_globals([DetectionModel, ClassificationModel])
-except Exception:
-    pass  # 이전 버전에서는 무시
+from app.services.lazy_imports import lazy_import
+
+# ultralytics/torch/cv2는 모델 로드·추론 경로에서만 import (서버 시작 시간 단축)
+cv2 = lazy_import("cv2")
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def decode_image(data: Union[bytes, bytearray, memoryview]) -> Optional[np.ndarray]:
+    """
+    인코딩된 이미지 바이트를 BGR 배열로 디코딩합니다 (임시 파일 없이 cv2.imdecode).
+    
+    Returns:
+        BGR 이미지 배열, 디코딩할 수 없으면 None
+    """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if buffer.size == 0:
+        return None
+    return cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+
+
+# 블러 초점 렌더링: 배경 블러는 긴 변이 이 크기 이하인 축소본에서 계산 (원본 기준 51x51, sigma=30 블러)
+_FOCUS_PROXY_MAX_EDGE = 640
+_FOCUS_BLUR_KERNEL = 51
+_FOCUS_BLUR_SIGMA = 30.0
+# 원형 마스크 경계를 부드럽게 하는 가우시안 sigma (px)와 마스크가 0보다 큰 반지름 밖 범위 (3 sigma)
+_FOCUS_MASK_SIGMA = 15.0
+_FOCUS_MASK_EXTENT = int(3 * _FOCUS_MASK_SIGMA)
+
+
+def _blur_background(image: np.ndarray) -> np.ndarray:
+    """
+    전체 이미지 배경 블러를 축소본에서 계산해 원본 크기로 확대합니다.
+    강한 블러는 저주파만 남기므로 축소본 블러와 결과가 거의 같고, 비용은 축소 비율의 제곱만큼 줄어듭니다.
+    """
+    h, w = image.shape[:2]
+    scale = min(1.0, _FOCUS_PROXY_MAX_EDGE / max(h, w))
+    if scale >= 1.0:
+        return cv2.GaussianBlur(image, (_FOCUS_BLUR_KERNEL, _FOCUS_BLUR_KERNEL), _FOCUS_BLUR_SIGMA)
+    
+    proxy = cv2.resize(
+        image, (max(1, round(w * scale)), max(1, round(h * scale))), interpolation=cv2.INTER_AREA
+    )
+    kernel = max(3, int(_FOCUS_BLUR_KERNEL * scale) | 1)
+    proxy = cv2.GaussianBlur(proxy, (kernel, kernel), _FOCUS_BLUR_SIGMA * scale)
+    return cv2.resize(proxy, (w, h), interpolation=cv2.INTER_LINEAR)
+
+
+def _i0e(x: np.ndarray) -> np.ndarray:
+    """지수 스케일 0차 수정 베셀 함수 I0(x)·exp(-x) (큰 x는 점근 전개로 오버플로 방지)"""
+    small = np.minimum(x, 20.0)
+    large = np.maximum(x, 20.0)
+    asymptotic = (1 + 1 / (8 * large) + 9 / (128 * large**2) + 225 / (3072 * large**3)) / np.sqrt(2 * np.pi * large)
+    return np.where(x <= 20.0, np.i0(small) * np.exp(-small), asymptotic)
+
+
+@lru_cache(maxsize=64)
+def _focus_profile(radius: int) -> np.ndarray:
+    """
+    원뿔 마스크 1 - d/r을 2차원 가우시안(sigma=_FOCUS_MASK_SIGMA)으로 평활화한 반지름 방향 프로파일.
+    방사 대칭 함수의 2차원 가우시안 합성곱 = 반지름 방향 적분 (베셀 I0 가중치, |d - ρ| ≤ 3σ 대역만 계산).
+    
+    Returns:
+        거리 d = 0, 1, ..., radius + 3σ 에서의 마스크 값 (float32)
+    """
+    sigma2 = _FOCUS_MASK_SIGMA ** 2
+    d = np.arange(radius + _FOCUS_MASK_EXTENT + 1, dtype=np.float64)[:, None]
+    rho = d + np.arange(-_FOCUS_MASK_EXTENT, _FOCUS_MASK_EXTENT + 1, dtype=np.float64)[None, :]
+    rho_pos = np.maximum(rho, 0.0)
+    weights = np.where(
+        rho >= 0,
+        rho_pos * np.exp(-((d - rho_pos) ** 2) / (2 * sigma2)) * _i0e(d * rho_pos / sigma2),
+        0.0,
+    )
+    cone = np.clip(1.0 - rho_pos / radius, 0.0, 1.0)
+    profile = (weights * cone).sum(axis=1) / np.maximum(weights.sum(axis=1), 1e-12)
+    return np.clip(profile, 0.0, 1.0).astype(np.float32)
+
+
+def _focus_mask(dy: np.ndarray, dx: np.ndarray, radius: int) -> np.ndarray:
+    """
+    초점 원형 마스크 (중심=1.0, 반지름 밖=0.0, 경계는 가우시안으로 부드럽게)를 계산합니다.
+    기존의 선형 원뿔 마스크 + 전체 프레임 gaussian_filter(sigma=15)와 같은 값을
+    반지름 방향 조회표로 계산합니다 (scipy 불필요, ROI 크기만큼만 계산).
+    
+    Args:
+        dy: 중심으로부터의 행 오프셋 (float32, 1차원)
+        dx: 중심으로부터의 열 오프셋 (float32, 1차원)
+        radius: 초점 반지름 (px)
+        
+    Returns:
+        (len(dy), len(dx)) 크기 float32 마스크
+    """
+    table = _focus_profile(max(int(radius), 1))
+    distances = np.sqrt(dy[:, None] ** 2 + dx[None, :] ** 2)
+    return np.interp(distances, np.arange(len(table), dtype=np.float32), table).astype(np.float32)
+
+
+# 결과 이미지 출력 형식: 이름 → (확장자, MIME 타입, 품질 플래그 이름)
+IMAGE_FORMATS = {
+    "jpeg": (".jpg", "image/jpeg", "IMWRITE_JPEG_QUALITY"),
+    "webp": (".webp", "image/webp", "IMWRITE_WEBP_QUALITY"),
+    "png": (".png", "image/png", None),
+}
+
+
+def encode_image(
+    image: np.ndarray,
+    image_format: str = "jpeg",
+    quality: Optional[int] = None,
+    max_edge: Optional[int] = None
+) -> bytes:
+    """
+    BGR 이미지를 지정 형식으로 인코딩합니다 (긴 변이 max_edge보다 크면 먼저 축소).
+    
+    Args:
+        image: BGR 이미지 배열
+        image_format: IMAGE_FORMATS의 형식 이름 ('jpeg', 'webp', 'png')
+        quality: 1-100 품질 (None이면 OpenCV 기본값, png는 무시)
+        max_edge: 출력 긴 변 최대 픽셀 (None이면 원본 크기)
+        
+    Returns:
+        인코딩된 이미지 바이트
+    """
+    ext, _, quality_flag = IMAGE_FORMATS[image_format]
+    h, w = image.shape[:2]
+    if max_edge and max(h, w) > max_edge:
+        scale = max_edge / max(h, w)
+        image = cv2.resize(
+            image, (max(1, round(w * scale)), max(1, round(h * scale))), interpolation=cv2.INTER_AREA
+        )
+    params = [getattr(cv2, quality_flag), int(quality)] if quality_flag and quality is not None else []
+    ok, buffer = cv2.imencode(ext, image, params)
+    if not ok:
+        raise ValueError(f"이미지를 {image_format} 형식으로 인코딩할 수 없습니다.")
+    return buffer.tobytes()
+
+
+def _image_encoder(image_options: Optional[Dict] = None) -> Callable[[np.ndarray], Union[str, bytes]]:
+    """
+    결과 딕셔너리용 이미지 인코더를 만듭니다 (기본: JPEG + base64 문자열).
+    
+    Args:
+        image_options: encode_image 인자(image_format, quality, max_edge)와
+            as_base64 (False면 인코딩된 바이트를 그대로 반환)
+    """
+    options = dict(image_options or {})
+    as_base64 = options.pop("as_base64", True)
+    
+    def encode(image: np.ndarray) -> Union[str, bytes]:
+        data = encode_image(image, **options)
+        return base64.b64encode(data).decode('utf-8') if as_base64 else data
+    
+    return encode
+
+
+def _load_yolo(model_path: str):
+    """ultralytics를 import하고 YOLO 모델을 로드합니다."""
+    import torch
+    from ultralytics import YOLO
+
+    # PyTorch 2.6+ 호환성: Ultralytics 클래스를 안전한 글로벌로 등록
+    try:
+        from ultralytics.nn.tasks import DetectionModel, ClassificationModel
+        torch.serialization.add_safe_globals([DetectionModel, ClassificationModel])
+    except Exception:
+        pass  # 이전 버전에서는 무시
+
+    return YOLO(model_path)
+
+
 class PlantDiseaseDetector:
     """식물 종 분류 및 병충해 감지를 위한 단일 모델 클래스"""
     
@@ -54,7 +213,7 @@ class PlantDiseaseDetector:
             # 병충해 감지 모델 로드 (Detection - 식물 종 + 병충해 통합)
             if os.path.exists(self.disease_model_path):
                 logger.info(f"통합 병충해 감지 모델 로드 중: {self.disease_model_path}")
-                self.disease_model = YOLO(self.disease_model_path)
+                self.disease_model = _load_yolo(self.disease_model_path)
                 logger.info("✅ 모델 로드 완료!")
             else:
                 logger.warning(f"⚠️  병충해 감지 모델을 찾을 수 없습니다: {self.disease_model_path}")
@@ -124,7 +283,7 @@ class PlantDiseaseDetector:
         filter_by_confidence: bool = True  # 신뢰도 기반 필터링 활성화
     ) -> Dict:
         """
-        이미지에서 식물 종과 병충해를 감지합니다.
+        이미지 파일에서 식물 종과 병충해를 감지합니다 (detect_image의 파일 경로 래퍼).
         
         Args:
             image_path: 분석할 이미지 경로
@@ -133,35 +292,61 @@ class PlantDiseaseDetector:
         Returns:
             감지 결과를 담은 딕셔너리
         """
-        results = {
-            "species": None,
-            "species_confidence": 0.0,
-            "diseases": [],
-            "result_image": None,
-            "original_image": None,
-            "diagnosis_status": "no_detection",  # no_detection, low_confidence, medium_confidence, high_confidence
-            "max_confidence": 0.0,  # 가장 높은 신뢰도
-            "detection_count": 0  # 감지된 총 객체 수
-        }
+        img = cv2.imread(image_path)
+        if img is None:
+            raise ValueError(f"이미지를 로드할 수 없습니다: {image_path}")
+        return self.detect_image(img, conf_threshold=conf_threshold, filter_by_confidence=filter_by_confidence)
+    
+    def detect_image(
+        self, 
+        image: Union[np.ndarray, bytes, bytearray, memoryview], 
+        conf_threshold: float = 0.01,
+        filter_by_confidence: bool = True,  # 신뢰도 기반 필터링 활성화
+        render_images: bool = True,
+        include_original: bool = True,
+        image_options: Optional[Dict] = None,
+        render_result: bool = True
+    ) -> Dict:
+        """
+        메모리의 이미지에서 식물 종과 병충해를 감지합니다 (디스크 I/O 없음).
+        바이트는 한 번만 디코딩하고, 디코딩된 배열을 YOLO에 그대로 전달합니다.
+        
+        Args:
+            image: BGR 이미지 배열 또는 인코딩된 이미지 바이트 (업로드 버퍼)
+            conf_threshold: 신뢰도 임계값
+            render_images: False면 원본/결과 이미지 생성을 생략
+            include_original: False면 원본 이미지 재인코딩을 생략 (클라이언트가 이미 가진 경우)
+            image_options: 출력 이미지 옵션 (image_format, quality, max_edge, as_base64=False면 바이트 그대로)
+            render_result: False면 결과 이미지 렌더링(블러 초점/박스 그리기)과 인코딩을 생략
+            
+        Returns:
+            감지 결과를 담은 딕셔너리
+        """
+        results = self._empty_result()
         
         try:
-            # 원본 이미지 로드
-            img = cv2.imread(image_path)
-            if img is None:
-                raise ValueError(f"이미지를 로드할 수 없습니다: {image_path}")
+            # 원본 이미지 (바이트면 한 번만 디코딩)
+            if isinstance(image, np.ndarray):
+                img = image
+            else:
+                img = decode_image(image)
+                if img is None:
+                    raise ValueError("이미지를 디코딩할 수 없습니다.")
             
-            # 원본 이미지 base64 인코딩
-            _, buffer = cv2.imencode('.jpg', img)
-            results["original_image"] = base64.b64encode(buffer).decode('utf-8')
+            # 원본 이미지 인코딩
+            encode = _image_encoder(image_options) if render_images else None
+            result_encode = encode if render_result else None
+            if encode and include_original:
+                results["original_image"] = encode(img)
             
             # 모델이 없으면 오류
             if self.disease_model is None:
                 logger.error("모델이 로드되지 않았습니다!")
-                results["result_image"] = results["original_image"]
+                self._fallback_result_image(img, results, result_encode)
                 return results
             
             # Detection 수행
-            detection_results = self.disease_model(image_path, conf=conf_threshold)
+            detection_results = self.disease_model(img, conf=conf_threshold)
             
             # 🔍 디버깅: 모든 예측 결과 출력 (신뢰도 무관)
             logger.info(f"🔍 디버깅 모드 - 예측 결과 분석:")
@@ -186,101 +371,10 @@ class PlantDiseaseDetector:
                 logger.warning(f"   ⚠️ detection_results가 비어있습니다")
             
             if len(detection_results) > 0:
-                result = detection_results[0]
-                
-                all_detections = []
-                
-                # 바운딩 박스가 있는 경우
-                if result.boxes is not None and len(result.boxes) > 0:
-                    results["detection_count"] = len(result.boxes)
-                    
-                    # 모든 감지 결과 수집
-                    for box in result.boxes:
-                        # 바운딩 박스 좌표
-                        x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                        
-                        # 신뢰도
-                        confidence = float(box.conf[0])
-                        
-                        # 클래스 이름
-                        class_id = int(box.cls[0])
-                        class_name = result.names[class_id]
-                        
-                        # 클래스명에서 식물 종과 병충해 분리
-                        species, disease = self._parse_class_name(class_name)
-                        
-                        all_detections.append({
-                            "name": disease,
-                            "full_name": class_name,
-                            "species": species,
-                            "confidence": confidence,
-                            "bbox": [float(x1), float(y1), float(x2), float(y2)]
-                        })
-                    
-                    # 신뢰도 기반 필터링
-                    if filter_by_confidence and all_detections:
-                        # 신뢰도순 정렬
-                        all_detections.sort(key=lambda x: x["confidence"], reverse=True)
-                        max_conf = all_detections[0]["confidence"]
-                        results["max_confidence"] = max_conf
-                        
-                        # 신뢰도 기반 상태 결정 및 필터링
-                        if max_conf >= 0.55:  # 55% 이상
-                            results["diagnosis_status"] = "high_confidence"
-                            # 가장 높은 신뢰도 하나만 선택
-                            selected = all_detections[0]
-                            results["diseases"] = [selected]
-                            results["species"] = selected["species"]
-                            results["species_confidence"] = selected["confidence"]
-                            logger.info(f"✅ 고신뢰도 진단: {selected['species']} - {selected['name']} ({max_conf:.2%})")
-                        
-                        elif max_conf >= 0.20:  # 20-55%
-                            results["diagnosis_status"] = "medium_confidence"
-                            # 가장 높은 신뢰도 정보만 제공 (방제법 없음)
-                            selected = all_detections[0]
-                            results["diseases"] = [selected]
-                            results["species"] = selected["species"]
-                            results["species_confidence"] = selected["confidence"]
-                            logger.info(f"⚠️  중간신뢰도: {selected['species']} - {selected['name']} ({max_conf:.2%})")
-                        
-                        else:  # 20% 미만
-                            results["diagnosis_status"] = "low_confidence"
-                            # 가장 높은 신뢰도 정보는 제공하되 진단 실패로 처리
-                            selected = all_detections[0]
-                            results["diseases"] = [selected]
-                            results["species"] = selected["species"]
-                            results["species_confidence"] = selected["confidence"]
-                            logger.info(f"❌ 저신뢰도: {selected['species']} - {selected['name']} ({max_conf:.2%})")
-                    
-                    else:
-                        # 필터링 없이 모든 결과 반환
-                        results["diseases"] = all_detections
-                        if all_detections:
-                            all_detections.sort(key=lambda x: x["confidence"], reverse=True)
-                            results["species"] = all_detections[0]["species"]
-                            results["species_confidence"] = all_detections[0]["confidence"]
-                            results["max_confidence"] = all_detections[0]["confidence"]
-                
-                # 진단 상태 추출
-                diagnosis_status = results.get("diagnosis_status", "no_detection")
-                
-                # 시각적 표현: 신뢰도 기반 커스텀 렌더링
-                if filter_by_confidence and diagnosis_status == "high_confidence" and len(results["diseases"]) > 0:
-                    # 고신뢰도: 블러 배경 + 초점 강조 원형 영역으로 표시
-                    annotated_img = self._render_blur_focus(
-                        img, 
-                        results["diseases"][0],
-                        diagnosis_status
-                    )
-                else:
-                    # 기본 렌더링
-                    annotated_img = result.plot()
-                
-                _, buffer = cv2.imencode('.jpg', annotated_img)
-                results["result_image"] = base64.b64encode(buffer).decode('utf-8')
+                self._apply_detection(img, detection_results[0], results, filter_by_confidence, result_encode)
             else:
                 # 결과가 없으면 원본 이미지 사용
-                results["result_image"] = results["original_image"]
+                self._fallback_result_image(img, results, result_encode)
             
             return results
             
@@ -288,6 +382,201 @@ class PlantDiseaseDetector:
             logger.error(f"감지 중 오류 발생: {str(e)}")
             raise
     
+    def detect_batch(
+        self, 
+        images: List[Union[np.ndarray, bytes, bytearray, memoryview]], 
+        conf_threshold: float = 0.01,
+        filter_by_confidence: bool = True,
+        render_images: bool = True,
+        batch_size: int = 16,
+        include_original: bool = True,
+        image_options: Optional[Dict] = None,
+        render_result: bool = True
+    ) -> List[Dict]:
+        """
+        여러 이미지를 배치 추론합니다 (batch_size장씩 YOLO 순전파 한 번).
+        
+        Args:
+            images: BGR 이미지 배열 또는 인코딩된 이미지 바이트 목록
+            conf_threshold: 신뢰도 임계값
+            filter_by_confidence: 신뢰도 기반 필터링 활성화
+            render_images: False면 원본/결과 이미지 생성을 생략
+            batch_size: 한 번의 순전파에 넣을 최대 이미지 수 (메모리 상한)
+            include_original: False면 원본 이미지 재인코딩을 생략
+            image_options: 출력 이미지 옵션 (detect_image 참고)
+            render_result: False면 결과 이미지 렌더링과 인코딩을 생략
+            
+        Returns:
+            입력 순서대로 감지 결과 딕셔너리 목록
+            (디코딩할 수 없는 이미지는 "error" 키가 있는 빈 결과)
+        """
+        encode = _image_encoder(image_options) if render_images else None
+        result_encode = encode if render_result else None
+        outputs = [self._empty_result() for _ in images]
+        if self.disease_model is None:
+            logger.error("모델이 로드되지 않았습니다!")
+        
+        # 디코딩/원본 인코딩도 청크 단위로 수행 → 동시에 메모리에 있는 BGR 배열은 최대 batch_size장
+        batch_size = max(1, batch_size)
+        decoded_count = 0
+        for start in range(0, len(images), batch_size):
+            chunk = []  # (입력 위치, 이미지)
+            for index in range(start, min(start + batch_size, len(images))):
+                image = images[index]
+                img = image if isinstance(image, np.ndarray) else decode_image(image)
+                if img is None:
+                    outputs[index]["error"] = "이미지를 디코딩할 수 없습니다."
+                    continue
+                if encode and include_original:
+                    outputs[index]["original_image"] = encode(img)
+                chunk.append((index, img))
+            decoded_count += len(chunk)
+            if not chunk:
+                continue
+            
+            if self.disease_model is None:
+                for index, img in chunk:
+                    self._fallback_result_image(img, outputs[index], result_encode)
+                continue
+            
+            # 이미지 목록을 넘기면 Ultralytics가 한 번의 배치 순전파로 처리
+            detection_results = self.disease_model([img for _, img in chunk], conf=conf_threshold, verbose=False)
+            for (index, img), result in zip(chunk, detection_results):
+                self._apply_detection(img, result, outputs[index], filter_by_confidence, result_encode)
+            del chunk, detection_results  # 다음 청크를 디코딩하기 전에 이전 청크 배열 해제
+        
+        logger.info(f"배치 감지 완료: {decoded_count}/{len(images)}장")
+        return outputs
+    
+    @staticmethod
+    def _empty_result() -> Dict:
+        """감지 결과 기본값"""
+        return {
+            "species": None,
+            "species_confidence": 0.0,
+            "diseases": [],
+            "result_image": None,
+            "original_image": None,
+            "diagnosis_status": "no_detection",  # no_detection, low_confidence, medium_confidence, high_confidence
+            "max_confidence": 0.0,  # 가장 높은 신뢰도
+            "detection_count": 0  # 감지된 총 객체 수
+        }
+    
+    def _apply_detection(
+        self, 
+        img: np.ndarray, 
+        result, 
+        results: Dict, 
+        filter_by_confidence: bool, 
+        encode: Optional[Callable[[np.ndarray], Union[str, bytes]]]
+    ):
+        """
+        이미지 한 장의 YOLO 결과를 results에 반영합니다 (감지 목록, 신뢰도 필터링, 결과 이미지 렌더링).
+        
+        Args:
+            img: 원본 BGR 이미지
+            result: Ultralytics Results (이미지 한 장)
+            results: 채울 감지 결과 딕셔너리
+            filter_by_confidence: 신뢰도 기반 필터링 활성화
+            encode: 결과 이미지 인코더 (None이면 렌더링 생략)
+        """
+        all_detections = []
+        
+        # 바운딩 박스가 있는 경우
+        if result.boxes is not None and len(result.boxes) > 0:
+            results["detection_count"] = len(result.boxes)
+            
+            # 모든 감지 결과 수집
+            for box in result.boxes:
+                # 바운딩 박스 좌표
+                x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
+                
+                # 신뢰도
+                confidence = float(box.conf[0])
+                
+                # 클래스 이름
+                class_id = int(box.cls[0])
+                class_name = result.names[class_id]
+                
+                # 클래스명에서 식물 종과 병충해 분리
+                species, disease = self._parse_class_name(class_name)
+                
+                all_detections.append({
+                    "name": disease,
+                    "full_name": class_name,
+                    "species": species,
+                    "confidence": confidence,
+                    "bbox": [float(x1), float(y1), float(x2), float(y2)]
+                })
+            
+            # 신뢰도 기반 필터링
+            if filter_by_confidence and all_detections:
+                # 신뢰도순 정렬
+                all_detections.sort(key=lambda x: x["confidence"], reverse=True)
+                max_conf = all_detections[0]["confidence"]
+                results["max_confidence"] = max_conf
+                
+                # 신뢰도 기반 상태 결정 및 필터링
+                if max_conf >= 0.55:  # 55% 이상
+                    results["diagnosis_status"] = "high_confidence"
+                    # 가장 높은 신뢰도 하나만 선택
+                    selected = all_detections[0]
+                    results["diseases"] = [selected]
+                    results["species"] = selected["species"]
+                    results["species_confidence"] = selected["confidence"]
+                    logger.info(f"✅ 고신뢰도 진단: {selected['species']} - {selected['name']} ({max_conf:.2%})")
+                
+                elif max_conf >= 0.20:  # 20-55%
+                    results["diagnosis_status"] = "medium_confidence"
+                    # 가장 높은 신뢰도 정보만 제공 (방제법 없음)
+                    selected = all_detections[0]
+                    results["diseases"] = [selected]
+                    results["species"] = selected["species"]
+                    results["species_confidence"] = selected["confidence"]
+                    logger.info(f"⚠️  중간신뢰도: {selected['species']} - {selected['name']} ({max_conf:.2%})")
+                
+                else:  # 20% 미만
+                    results["diagnosis_status"] = "low_confidence"
+                    # 가장 높은 신뢰도 정보는 제공하되 진단 실패로 처리
+                    selected = all_detections[0]
+                    results["diseases"] = [selected]
+                    results["species"] = selected["species"]
+                    results["species_confidence"] = selected["confidence"]
+                    logger.info(f"❌ 저신뢰도: {selected['species']} - {selected['name']} ({max_conf:.2%})")
+            
+            else:
+                # 필터링 없이 모든 결과 반환
+                results["diseases"] = all_detections
+                if all_detections:
+                    all_detections.sort(key=lambda x: x["confidence"], reverse=True)
+                    results["species"] = all_detections[0]["species"]
+                    results["species_confidence"] = all_detections[0]["confidence"]
+                    results["max_confidence"] = all_detections[0]["confidence"]
+        
+        if encode is not None:
+            # 진단 상태 추출
+            diagnosis_status = results.get("diagnosis_status", "no_detection")
+        
+            # 시각적 표현: 신뢰도 기반 커스텀 렌더링
+            if filter_by_confidence and diagnosis_status == "high_confidence" and len(results["diseases"]) > 0:
+                # 고신뢰도: 블러 배경 + 초점 강조 원형 영역으로 표시
+                annotated_img = self._render_blur_focus(
+                    img, 
+                    results["diseases"][0],
+                    diagnosis_status
+                )
+            else:
+                # 기본 렌더링
+                annotated_img = result.plot()
+        
+            results["result_image"] = encode(annotated_img)
+    
+    @staticmethod
+    def _fallback_result_image(img: np.ndarray, results: Dict, encode) -> None:
+        """감지 결과가 없을 때 결과 이미지로 원본을 사용 (이미 인코딩한 원본이 있으면 재사용)"""
+        if encode is not None:
+            results["result_image"] = results["original_image"] or encode(img)
+    
     def _render_blur_focus(
         self, 
         image: np.ndarray, 
@@ -338,30 +627,24 @@ class PlantDiseaseDetector:
             else:
                 border_color = (100, 200, 255)  # 노란색
             
-            # 4. 전체 이미지 블러 처리
-            blurred = cv2.GaussianBlur(image, (51, 51), 30)
+            # 4. 배경 블러 (축소본에서 블러 후 원본 크기로 확대)
+            blurred = _blur_background(image)
             logger.info(f"   배경 블러 적용 완료")
             
-            # 5. 원형 마스크 생성 (부드러운 그라데이션)
-            mask = np.zeros((h, w), dtype=np.float32)
-            
-            # 원형 마스크를 거리 기반으로 생성
-            y_coords, x_coords = np.ogrid[:h, :w]
-            distances = np.sqrt((x_coords - center_x)**2 + (y_coords - center_y)**2)
-            
-            # 중심에서 멀어질수록 값이 작아짐 (중심=1.0, 반지름 밖=0.0)
-            mask = np.clip(1.0 - (distances / focus_radius), 0, 1)
-            
-            # 가우시안 블러로 더 부드럽게
-            mask = gaussian_filter(mask, sigma=15)
-            mask = np.clip(mask, 0, 1)
-            logger.info(f"   원형 마스크 생성 완료")
-            
-            # 6. 마스크를 3채널로 확장
-            mask_3ch = np.stack([mask] * 3, axis=2)
-            
-            # 7. 원본과 블러 이미지 블렌딩 (마스크 영역은 선명하게)
-            result = (image * mask_3ch + blurred * (1 - mask_3ch)).astype(np.uint8)
+            # 5~7. 초점 영역(ROI)에서만 원형 마스크를 만들어 원본과 블렌딩 (마스크 밖은 블러 그대로)
+            result = blurred
+            extent = focus_radius + _FOCUS_MASK_EXTENT
+            rx1, ry1 = max(center_x - extent, 0), max(center_y - extent, 0)
+            rx2, ry2 = min(center_x + extent + 1, w), min(center_y + extent + 1, h)
+            if rx1 < rx2 and ry1 < ry2:
+                mask = _focus_mask(
+                    np.arange(ry1, ry2, dtype=np.float32) - center_y,
+                    np.arange(rx1, rx2, dtype=np.float32) - center_x,
+                    focus_radius,
+                )
+                result[ry1:ry2, rx1:rx2] = cv2.blendLinear(
+                    image[ry1:ry2, rx1:rx2], blurred[ry1:ry2, rx1:rx2], mask, 1.0 - mask
+                )
             logger.info(f"   이미지 블렌딩 완료")
             
             # 8. 원형 테두리 추가 (여러 레이어로 부드럽게)
@@ -407,13 +690,37 @@ class PlantDiseaseDetector:
 
 # 싱글톤 인스턴스 (애플리케이션 전역에서 사용)
 _detector_instance: Optional[PlantDiseaseDetector] = None
+_detector_error: Optional[str] = None  # 로드 실패 사유 (실패 후에는 요청마다 다시 로드하지 않음)
+_detector_lock = threading.Lock()
 
 
 def get_detector() -> PlantDiseaseDetector:
     """
     PlantDiseaseDetector 싱글톤 인스턴스를 반환합니다.
+    (백그라운드 프리로드와 요청이 겹쳐도 모델은 한 번만 로드)
+    
+    Raises:
+        RuntimeError: 모델 로드가 이미 실패한 경우 (의존성/모델 파일을 고친 뒤 서버 재시작 필요)
     """
-    global _detector_instance
+    global _detector_instance, _detector_error
     if _detector_instance is None:
-        _detector_instance = PlantDiseaseDetector()
+        with _detector_lock:
+            if _detector_instance is None:
+                if _detector_error is not None:
+                    raise RuntimeError(f"감지 모델 로드 실패: {_detector_error}")
+                try:
+                    _detector_instance = PlantDiseaseDetector()
+                except Exception as e:
+                    _detector_error = str(e) or type(e).__name__
+                    raise
     return _detector_instance
+
+
+def is_detector_loaded() -> bool:
+    """감지 모델 인스턴스가 준비되었는지 여부 (로드를 기다리지 않음)"""
+    return _detector_instance is not None
+
+
+def detector_load_error() -> Optional[str]:
+    """감지 모델 로드 실패 사유 (로드 전이거나 성공했으면 None)"""
+    return _detector_error
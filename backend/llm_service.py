@@ -2,7 +2,6 @@
 LLM 서비스 - GPT-4o mini를 활용한 방제법 제시
 """
 import os
-from openai import OpenAI
 from typing import Optional
 import logging
 
@@ -22,13 +21,17 @@ class PlantDiseaseAdvisor:
         if not self.api_key:
             logger.warning("⚠️  OPENAI_API_KEY가 설정되지 않았습니다. LLM 기능이 비활성화됩니다.")
             self.client = None
+            self.async_client = None
         else:
             try:
+                from openai import AsyncOpenAI, OpenAI  # 키가 있을 때만 import
                 self.client = OpenAI(api_key=self.api_key)
+                self.async_client = AsyncOpenAI(api_key=self.api_key)
                 logger.info("✅ OpenAI 클라이언트 초기화 완료")
             except Exception as e:
                 logger.error(f"❌ OpenAI 클라이언트 초기화 실패: {str(e)}")
                 self.client = None
+                self.async_client = None
     
     def get_treatment_advice(
         self, 
@@ -53,30 +56,45 @@ class PlantDiseaseAdvisor:
             return "⚠️  AI 방제법 서비스를 사용할 수 없습니다. OPENAI_API_KEY를 설정해주세요."
         
         try:
-            # 프롬프트 구성
-            prompt = self._build_prompt(plant_species, disease, confidence, user_notes)
-            
             # GPT-4o mini 호출
             response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "당신은 식물 병충해 전문가입니다. "
-                            "농부와 가정 원예가들에게 실용적이고 이해하기 쉬운 "
-                            "방제법과 예방법을 제공합니다. "
-                            "답변은 한국어로, 친절하고 전문적인 어조로 작성하며, "
-                            "구체적인 실행 단계를 포함해야 합니다."
-                        )
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=800
+                **self._build_request(plant_species, disease, confidence, user_notes)
+            )
+            
+            advice = response.choices[0].message.content.strip()
+            logger.info(f"✅ LLM 방제법 생성 완료 (식물: {plant_species}, 병충해: {disease})")
+            
+            return advice
+            
+        except Exception as e:
+            logger.error(f"❌ LLM 호출 오류: {str(e)}")
+            return f"⚠️  방제법 생성 중 오류가 발생했습니다: {str(e)}"
+    
+    async def get_treatment_advice_async(
+        self, 
+        plant_species: str, 
+        disease: str,
+        confidence: float,
+        user_notes: Optional[str] = None
+    ) -> str:
+        """
+        get_treatment_advice의 비동기 버전 (AsyncOpenAI, 이벤트 루프를 막지 않음).
+        
+        Args:
+            plant_species: 식물 종 (예: "Tomato")
+            disease: 병충해명 (예: "Early blight")
+            confidence: 신뢰도 (0.0 ~ 1.0)
+            user_notes: 사용자 추가 의견 (선택사항)
+            
+        Returns:
+            방제법 및 예방법 텍스트
+        """
+        if not self.async_client:
+            return "⚠️  AI 방제법 서비스를 사용할 수 없습니다. OPENAI_API_KEY를 설정해주세요."
+        
+        try:
+            response = await self.async_client.chat.completions.create(
+                **self._build_request(plant_species, disease, confidence, user_notes)
             )
             
             advice = response.choices[0].message.content.strip()
@@ -88,6 +106,37 @@ class PlantDiseaseAdvisor:
             logger.error(f"❌ LLM 호출 오류: {str(e)}")
             return f"⚠️  방제법 생성 중 오류가 발생했습니다: {str(e)}"
     
+    def _build_request(
+        self, 
+        plant_species: str, 
+        disease: str,
+        confidence: float,
+        user_notes: Optional[str]
+    ) -> dict:
+        """chat.completions.create 인자를 구성합니다 (동기/비동기 공통)."""
+        prompt = self._build_prompt(plant_species, disease, confidence, user_notes)
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": (
+                        "당신은 식물 병충해 전문가입니다. "
+                        "농부와 가정 원예가들에게 실용적이고 이해하기 쉬운 "
+                        "방제법과 예방법을 제공합니다. "
+                        "답변은 한국어로, 친절하고 전문적인 어조로 작성하며, "
+                        "구체적인 실행 단계를 포함해야 합니다."
+                    )
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.7,
+            "max_tokens": 800,
+        }
+    
     def _build_prompt(
         self, 
         plant_species: str, 